@@ -14,6 +14,19 @@ if has_starter_addon then
     console.log("Starter detection enabled!")
 end
 
+-- Optional: Push party snapshots to the Python calculator's live feed
+local has_party_feed, party_feed = pcall(require, "party_feed")
+if has_party_feed then
+    console.log("Live party feed enabled!")
+end
+
+-- Optional: Use tiers scored by the Python calculator (needs the party feed's snapshots)
+local has_tier_ring, tier_ring = pcall(require, "tier_ring")
+has_tier_ring = has_tier_ring and has_party_feed
+if has_tier_ring then
+    console.log("Tier ring reader enabled!")
+end
+
 -- Global state
 local tool_state = {
     initialized = false,
@@ -54,11 +67,22 @@ local function onFrameUpdate()
     end
     
     if pokemon_data then
+        if has_party_feed then
+            safe_call(party_feed.push, pokemon_data)
+        end
+        
+        -- Python-scored tiers for this party, if they are up to date
+        local ring_results = nil
+        if has_tier_ring then
+            ring_results = safe_call(tier_ring.lookup, party_feed.snapshot_seq)
+        end
+        
         -- Calculate tiers for each Pokemon
         local tier_results = {}
         for i, pokemon in pairs(pokemon_data) do
             if pokemon.species > 0 then  -- Valid Pokemon
-                tier_results[i] = tier_calculator.calculateTierRating(pokemon)
+                tier_results[i] = has_tier_ring and tier_ring.resultFor(ring_results, i, pokemon)
+                    or tier_calculator.calculateTierRating(pokemon)
             end
         end
         
@@ -36,6 +36,9 @@ local vanilla_addresses = {
     money = 0xD573,
 }
 
+-- Addresses resolved for this ROM ahead of time (roms/rom_addresses.py); optional
+local has_profile, address_profile = pcall(require, "address_profile")
+
 -- Pokemon structure offsets (these don't change)
 local pokemon_offsets = {
     species_offset = 0x00,
@@ -58,14 +61,44 @@ local pokemon_offsets = {
 memory_reader.addresses = {}
 memory_reader.use_system_bus = true  -- We'll use System Bus for simplicity
 
+-- Whether the address profile was generated for the loaded ROM
+local function profileMatchesRom(profile)
+    if not profile.rom_checksum then
+        return true
+    end
+    local ok, checksum = pcall(function()
+        memory.usememorydomain("ROM")
+        return memory.readbyte(0x14E) * 256 + memory.readbyte(0x14F)
+    end)
+    return not ok or checksum == profile.rom_checksum
+end
+
 -- Initialize the memory reader
 function memory_reader.initialize()
     console.log("Initializing memory reader...")
     
+    -- A profile generated for this ROM needs no probing or scanning
+    local use_profile = has_profile and type(address_profile) == "table" and profileMatchesRom(address_profile)
+    
     -- Always use System Bus for Archipelago - it's simpler
     memory.usememorydomain("System Bus")
     memory_reader.use_system_bus = true
     
+    if use_profile then
+        -- Vanilla addresses fill in anything the profile does not resolve
+        memory_reader.addresses = {}
+        for key, addr in pairs(vanilla_addresses) do
+            memory_reader.addresses[key] = addr
+        end
+        for key, addr in pairs(address_profile) do
+            memory_reader.addresses[key] = addr
+        end
+        console.log(string.format("Using address profile (party at 0x%04X)", memory_reader.addresses.party_count))
+        return
+    elseif has_profile then
+        console.log("Address profile is for a different ROM, ignoring it")
+    end
+    
     -- Test Archipelago addresses first
     local party_count = memory.readbyte(archipelago_addresses.party_count)
     
@@ -0,0 +1,135 @@
+-- Live Party Feed Add-on for Pokemon Crystal Tier Tool
+-- Pushes party snapshots to the Python tier calculator over BizHawk's socket
+-- and keeps a binary snapshot file (raw party structs) up to date
+
+local memory_reader = require("memory_reader")
+
+-- Start BizHawk with the socket pointed at the calculator's listener:
+--   EmuHawk.exe --socket_ip=127.0.0.1 --socket_port=52790
+-- then tick "Live Party" in Crystal.py. main.lua loads this add-on if present.
+
+local party_feed = {}
+
+-- Binary snapshot file (party_snapshot.py format); set to nil to disable
+party_feed.snapshot_file = "party_snapshot.bin"
+
+-- Frame stamped on the last snapshot written; tier_ring.lua looks results up by it
+party_feed.snapshot_seq = nil
+
+local SNAPSHOT_VERSION = 1
+local PARTYMON_SIZE = 48
+
+local last_message = nil
+local last_snapshot = nil
+
+-- Big-endian unsigned integer as a byte string
+local function packBE(value, size)
+    local bytes = {}
+    for i = size, 1, -1 do
+        bytes[i] = string.char(value % 256)
+        value = math.floor(value / 256)
+    end
+    return table.concat(bytes)
+end
+
+-- Header plus the raw 48-byte party structs, read straight from WRAM
+local function encodeSnapshot(count, frame)
+    local bytes = {}
+    local sum = 0
+    local base = memory_reader.addresses.party_data_start
+    for i = 0, count * PARTYMON_SIZE - 1 do
+        local byte = memory.readbyte(base + i)
+        bytes[i + 1] = string.char(byte)
+        sum = sum + byte
+    end
+    local payload = table.concat(bytes)
+    return "CPTY" .. string.char(SNAPSHOT_VERSION, count) ..
+        packBE(sum % 65536, 2) .. packBE(frame, 4) .. payload
+end
+
+-- Replace the snapshot file in one step so readers never see half a write
+local function writeSnapshot(snapshot)
+    local temp = party_feed.snapshot_file .. ".tmp"
+    local file = io.open(temp, "wb")
+    if not file then
+        return false
+    end
+    file:write(snapshot)
+    file:close()
+    os.remove(party_feed.snapshot_file)
+    return os.rename(temp, party_feed.snapshot_file)
+end
+
+-- Encode the party as the same JSON shape as party_data.json
+local function encodeParty(pokemon_data)
+    local entries = {}
+    for slot = 0, 5 do
+        local pokemon = pokemon_data[slot]
+        if pokemon then
+            local moves = {}
+            for _, move in ipairs(pokemon.moves) do
+                if move > 0 then
+                    table.insert(moves, tostring(move))
+                end
+            end
+            table.insert(entries, string.format(
+                '{"slot":%d,"species":%d,"level":%d,"moves":[%s]}',
+                slot + 1, pokemon.species, pokemon.level, table.concat(moves, ",")))
+        end
+    end
+    return string.format('{"count":%d,"pokemon":[%s]}', #entries, table.concat(entries, ","))
+end
+
+-- Write the binary snapshot file if the party structs changed
+function party_feed.writeSnapshot()
+    if not party_feed.snapshot_file then
+        return false
+    end
+
+    local count = memory.readbyte(memory_reader.addresses.party_count)
+    if count < 1 or count > 6 then
+        return false
+    end
+
+    -- Compare without the frame counter, which changes every call
+    local frame = emu.framecount() % 4294967296
+    local snapshot = encodeSnapshot(count, frame)
+    local content = snapshot:sub(1, 8) .. snapshot:sub(13)
+    if content == last_snapshot then
+        return false
+    end
+
+    last_snapshot = content
+    if not writeSnapshot(snapshot) then
+        return false
+    end
+    party_feed.snapshot_seq = frame
+    return true
+end
+
+-- Send the party if it changed since the last snapshot
+function party_feed.push(pokemon_data)
+    party_feed.writeSnapshot()
+
+    if not (comm and comm.socketServerIsConnected and comm.socketServerIsConnected()) then
+        return false
+    end
+
+    local message = encodeParty(pokemon_data)
+    if message == last_message then
+        return false
+    end
+
+    comm.socketServerSend(message .. "\n")
+    last_message = message
+    return true
+end
+
+-- Force the next push to send even if nothing changed
+function party_feed.reset()
+    last_message = nil
+    last_snapshot = nil
+    party_feed.snapshot_seq = nil
+end
+
+return party_feed
@@ -13,6 +13,17 @@ import math
 import json
 import random
 
+from speed_index import SpeedIndex
+from tier_distribution import ScoreDistribution
+from move_catalog import MoveCatalog
+from dvs import HIDDEN_POWER, HIDDEN_POWER_TYPES, PHYSICAL_HIDDEN_POWER_TYPES, hidden_power
+from party import PartyScores, find_party_file, load_party_file
+from party_feed import PartyFeed
+from party_watch import PartyWatcher
+from search_index import normalize
+from species_index import SpeciesIndex
+from stat_engine import StatTable
+
 # Import move names from Move_names.py (you'll need this file)
 MOVE_NAMES = {
     1: "Pound", 2: "Karate Chop", 3: "Double Slap", 4: "Comet Punch",
@@ -81,13 +92,29 @@ MOVE_NAMES = {
 }
 
 
-class PokemonTierCalculator:
-    """Main application for calculating Pokemon tiers with manual move selection"""
-    
+class TierScorer:
+    """ROM-backed Pokemon data and tier scoring, independent of the GUI"""
+
     # Memory addresses (patched ROM)
-    POKEMON_DATA_BASE = 0x513F4  # Base address for Pokemon data
+    POKEMON_DATA_BASE = 0x513F3  # Base address for Pokemon data (record byte 0 is the dex number)
     POKEMON_SIZE = 32            # Bytes per Pokemon
     
+    # Tier weights and boundaries (overridden by tier_config.json)
+    CONFIG_FILE = Path(__file__).with_name("tier_config.json")
+    DEFAULT_WEIGHTS = {
+        'BST': 0.20, 'Speed': 0.25, 'Offense': 0.15,
+        'Bulk': 0.15, 'Type': 0.10, 'Moves': 0.15
+    }
+    DEFAULT_TIER_BOUNDARIES = [
+        ("S", 85, "#FF0000"), ("A", 70, "#FF8C00"), ("B", 55, "#FFD700"),
+        ("C", 40, "#00FF00"), ("D", 25, "#00CED1"), ("F", 0, "#808080")
+    ]
+    
+    # "fixed" uses the score boundaries above; "percentile" places each tier
+    # at a share of this ROM's dex, so randomized stat spreads don't shift tiers
+    TIER_MODES = ("fixed", "percentile")
+    DEFAULT_TIER_PERCENTILES = {"S": 95, "A": 80, "B": 55, "C": 30, "D": 10, "F": 0}
+    
     # Type IDs
     TYPES = {
         0x00: "Normal",   0x01: "Fighting", 0x02: "Flying",   0x03: "Poison",
@@ -429,282 +456,61 @@ class PokemonTierCalculator:
         251: "Celebi"
     }
     
-    def __init__(self, root):
-        self.root = root
-        self.root.title("🎮 Pokemon Crystal Tier Calculator - Manual Move Selection")
-        self.root.geometry("1400x900")
-        
-        self.rom_path = None
-        self.rom_data = None
-        self.current_pokemon = None
+    def __init__(self, rom_data: Optional[bytes] = None):
+        self.rom_data = rom_data
         self.selected_moves = []
-        
-        self.create_widgets()
-        
-    def create_widgets(self):
-        """Create the GUI layout"""
-        # Main container
-        main_frame = ttk.Frame(self.root, padding="10")
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Header
-        header_frame = ttk.Frame(main_frame)
-        header_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        ttk.Label(header_frame, text="Pokemon Crystal Tier Calculator", 
-                 font=("Arial", 16, "bold")).pack(side=tk.LEFT)
-        
-        ttk.Button(header_frame, text="Load ROM", command=self.load_rom,
-                  style="Accent.TButton").pack(side=tk.RIGHT, padx=5)
-        
-        ttk.Button(header_frame, text="Load Party", command=self.load_party_data,
-                  style="Accent.TButton").pack(side=tk.RIGHT, padx=5)
-        
-        self.rom_label = ttk.Label(header_frame, text="No ROM loaded", foreground="gray")
-        self.rom_label.pack(side=tk.RIGHT, padx=10)
-        
-        # Search frame
-        search_frame = ttk.LabelFrame(main_frame, text="Select Pokemon", padding="10")
-        search_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        # Search by number
-        ttk.Label(search_frame, text="Dex #:").grid(row=0, column=0, sticky=tk.W, padx=5)
-        self.dex_var = tk.StringVar()
-        dex_entry = ttk.Entry(search_frame, textvariable=self.dex_var, width=10)
-        dex_entry.grid(row=0, column=1, padx=5)
-        
-        # Search by name
-        ttk.Label(search_frame, text="Name:").grid(row=0, column=2, sticky=tk.W, padx=5)
-        self.name_var = tk.StringVar()
-        name_combo = ttk.Combobox(search_frame, textvariable=self.name_var, width=20)
-        name_combo['values'] = [f"{num}: {name}" for num, name in self.POKEMON_NAMES.items()]
-        name_combo.grid(row=0, column=3, padx=5)
-        
-        ttk.Button(search_frame, text="Load Pokemon", command=self.search_pokemon).grid(row=0, column=4, padx=10)
-        ttk.Button(search_frame, text="Random", command=self.random_pokemon).grid(row=0, column=5, padx=5)
-        
-        # Main content area with three columns
-        content_frame = ttk.Frame(main_frame)
-        content_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Left panel - Pokemon info
-        left_panel = ttk.LabelFrame(content_frame, text="Pokemon Data", padding="10")
-        left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
-        
-        # Basic info
-        self.info_frame = ttk.Frame(left_panel)
-        self.info_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        # Stats display
-        self.stats_frame = ttk.LabelFrame(left_panel, text="Base Stats", padding="10")
-        self.stats_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        # Type effectiveness
-        self.type_frame = ttk.LabelFrame(left_panel, text="Type Matchups", padding="10")
-        self.type_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Middle panel - Move selection
-        middle_panel = ttk.LabelFrame(content_frame, text="Move Selection", padding="10")
-        middle_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
-        
-        # Instructions
-        ttk.Label(middle_panel, text="Select up to 4 moves:", font=("Arial", 10, "bold")).pack()
-        
-        # Search box for moves
-        search_move_frame = ttk.Frame(middle_panel)
-        search_move_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Label(search_move_frame, text="Search:").pack(side=tk.LEFT, padx=5)
-        self.move_search_var = tk.StringVar()
-        self.move_search_var.trace('w', self.filter_moves)
-        search_entry = ttk.Entry(search_move_frame, textvariable=self.move_search_var)
-        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
-        
-        # Move list with scrollbar
-        move_list_frame = ttk.Frame(middle_panel)
-        move_list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
-        
-        scrollbar = ttk.Scrollbar(move_list_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        self.move_listbox = tk.Listbox(move_list_frame, height=15, selectmode=tk.SINGLE,
-                                       yscrollcommand=scrollbar.set)
-        self.move_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.move_listbox.yview)
-        
-        # Populate move list
-        self.all_moves = []
-        for move_id, move_name in sorted(MOVE_NAMES.items()):
-            if move_id in self.MOVE_DATA:
-                power, type_, acc, pp, is_phys, effect = self.MOVE_DATA[move_id]
-                display_text = f"{move_name} ({type_}, Pow: {power})"
-                self.move_listbox.insert(tk.END, display_text)
-                self.all_moves.append((move_id, move_name, display_text))
-            else:
-                display_text = f"{move_name} (???)"
-                self.move_listbox.insert(tk.END, display_text)
-                self.all_moves.append((move_id, move_name, display_text))
-        
-        # Buttons
-        button_frame = ttk.Frame(middle_panel)
-        button_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Button(button_frame, text="Add Move →", command=self.add_move).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="← Remove", command=self.remove_move).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Clear All", command=self.clear_moves).pack(side=tk.LEFT, padx=5)
-        
-        # Selected moves
-        ttk.Label(middle_panel, text="Selected Moves:", font=("Arial", 10, "bold")).pack(pady=(10, 5))
-        
-        self.selected_moves_frame = ttk.Frame(middle_panel)
-        self.selected_moves_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Right panel - Tier rating
-        right_panel = ttk.LabelFrame(content_frame, text="Tier Analysis", padding="10")
-        right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        
-        self.tier_display = ttk.Frame(right_panel)
-        self.tier_display.pack(fill=tk.BOTH, expand=True)
-        
-        # Calculate button
-        self.calculate_button = ttk.Button(right_panel, text="Calculate Tier", 
-                                         command=self.calculate_and_display_tier,
-                                         style="Accent.TButton", state=tk.DISABLED)
-        self.calculate_button.pack(side=tk.BOTTOM, pady=10)
-        
-        # Status bar
-        self.status_var = tk.StringVar(value="Ready - Select a Pokemon to begin")
-        status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN)
-        status_bar.pack(fill=tk.X, pady=(5, 0))
-        
-    def load_rom(self):
-        """Load a ROM file"""
-        filename = filedialog.askopenfilename(
-            title="Select Pokemon Crystal ROM",
-            filetypes=[("Game Boy ROMs", "*.gbc *.gb"), ("All files", "*.*")]
-        )
-        
-        if filename:
-            self.rom_path = Path(filename)
-            self.rom_data = self.rom_path.read_bytes()
-            self.rom_label.config(text=self.rom_path.name, foreground="black")
-            self.status_var.set(f"Loaded: {self.rom_path.name}")
-            
-    def load_party_data(self):
-        """Load party data from BizHawk export"""
-        party_file = Path("party_data.json")
-        if not party_file.exists():
-            messagebox.showerror("Error", "No party data found!\n\nRun party_exporter.lua in BizHawk first.")
-            return
-            
+        self.speed_index = None
+        self.distribution = None
+        self.distribution_rom = None
+        
+        self.weights = dict(self.DEFAULT_WEIGHTS)
+        self.tier_boundaries = list(self.DEFAULT_TIER_BOUNDARIES)
+        self.tier_mode = "fixed"
+        self.tier_percentiles = dict(self.DEFAULT_TIER_PERCENTILES)
+        self.config_mtime = None
+        self.load_config()
+        
+    def load_config(self, config_path: Optional[Path] = None) -> bool:
+        """Load weights and tier boundaries, returning True if they changed
+        
+        Cheap to call repeatedly: the file is only re-read when its mtime moves.
+        A half-written or invalid file keeps the previous settings.
+        """
+        config_path = Path(config_path) if config_path else self.CONFIG_FILE
         try:
-            with open(party_file, 'r') as f:
-                party_data = json.load(f)
-                
-            self.status_var.set(f"Loaded party data: {party_data['count']} Pokemon")
-            self.show_party_selection(party_data)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load party data: {str(e)}")
-            
-    def show_party_selection(self, party_data):
-        """Show dialog to select Pokemon from party"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Select Pokemon from Party")
-        dialog.geometry("400x300")
-        
-        ttk.Label(dialog, text="Your Current Party:", font=("Arial", 12, "bold")).pack(pady=10)
-        
-        listbox = tk.Listbox(dialog, height=6, font=("Arial", 11))
-        listbox.pack(pady=10, padx=20, fill=tk.BOTH, expand=True)
-        
-        for poke in party_data['pokemon']:
-            name = self.POKEMON_NAMES.get(poke['species'], f"Unknown #{poke['species']}")
-            listbox.insert(tk.END, f"Slot {poke['slot']}: {name} Lv.{poke['level']}")
-            
-        def select_pokemon():
-            selection = listbox.curselection()
-            if selection:
-                idx = selection[0]
-                pokemon = party_data['pokemon'][idx]
-                dialog.destroy()
-                self.display_party_pokemon(pokemon)
-                
-        ttk.Button(dialog, text="Select", command=select_pokemon).pack(pady=10)
-        
-    def display_party_pokemon(self, party_poke):
-        """Display party Pokemon and pre-select their moves"""
-        # Set the dex number
-        self.dex_var.set(str(party_poke['species']))
-        
-        # Load the Pokemon
-        self.search_pokemon()
-        
-        # Pre-select their current moves
-        self.clear_moves()
-        for move_id in party_poke['moves']:
-            if move_id > 0:
-                # Find and select this move
-                for i, (mid, mname, display) in enumerate(self.all_moves):
-                    if mid == move_id:
-                        self.move_listbox.selection_clear(0, tk.END)
-                        self.move_listbox.selection_set(i)
-                        self.move_listbox.see(i)
-                        self.add_move()
-                        break
-                        
-    def filter_moves(self, *args):
-        """Filter move list based on search"""
-        search_term = self.move_search_var.get().lower()
-        
-        self.move_listbox.delete(0, tk.END)
-        for move_id, move_name, display_text in self.all_moves:
-            if search_term in move_name.lower() or search_term in display_text.lower():
-                self.move_listbox.insert(tk.END, display_text)
-                
-    def search_pokemon(self):
-        """Search for a Pokemon by number or name"""
-        if not self.rom_data:
-            messagebox.showerror("Error", "Please load a ROM first")
-            return
-            
-        # Try to get dex number
-        dex_num = None
-        
-        if self.dex_var.get():
-            try:
-                dex_num = int(self.dex_var.get())
-            except ValueError:
-                messagebox.showerror("Error", "Invalid dex number")
-                return
-                
-        elif self.name_var.get():
-            # Extract number from combo selection
-            try:
-                dex_num = int(self.name_var.get().split(":")[0])
-            except:
-                # Try to find by name
-                name = self.name_var.get().strip()
-                for num, pname in self.POKEMON_NAMES.items():
-                    if pname.lower() == name.lower():
-                        dex_num = num
-                        break
-                        
-        if not dex_num or dex_num < 1 or dex_num > 251:
-            messagebox.showerror("Error", "Please enter a valid Pokemon (1-251)")
-            return
+            mtime = config_path.stat().st_mtime
+        except OSError:
+            return False
+        if mtime == self.config_mtime:
+            return False
             
-        self.display_pokemon(dex_num)
-        
-    def random_pokemon(self):
-        """Display a random Pokemon"""
-        if not self.rom_data:
-            messagebox.showerror("Error", "Please load a ROM first")
-            return
+        try:
+            with open(config_path, 'r') as f:
+                config = json.load(f)
+            weights = {name: float(config.get('weights', {}).get(name, default))
+                       for name, default in self.DEFAULT_WEIGHTS.items()}
+            colors = {tier: color for tier, _, color in self.DEFAULT_TIER_BOUNDARIES}
+            boundaries = config.get('tier_boundaries')
+            if boundaries:
+                boundaries = sorted(((tier, float(minimum), colors.get(tier, "#808080"))
+                                     for tier, minimum in boundaries.items()),
+                                    key=lambda b: b[1], reverse=True)
+            else:
+                boundaries = list(self.DEFAULT_TIER_BOUNDARIES)
+            tier_mode = config.get('tier_mode', "fixed")
+            if tier_mode not in self.TIER_MODES:
+                return False
+            percentiles = {tier: float(value)
+                           for tier, value in config.get('tier_percentiles', self.DEFAULT_TIER_PERCENTILES).items()}
+        except (ValueError, AttributeError, TypeError):
+            return False
             
-        dex_num = random.randint(1, 251)
-        self.dex_var.set(str(dex_num))
-        self.display_pokemon(dex_num)
+        self.config_mtime = mtime
+        self.weights = weights
+        self.tier_boundaries = boundaries
+        self.tier_mode = tier_mode
+        self.tier_percentiles = percentiles
+        return True
         
     def read_pokemon_data(self, dex_num: int) -> Dict:
         """Read Pokemon data from ROM"""
@@ -729,6 +535,8 @@ class PokemonTierCalculator:
             'type2': data[8],
             'catch_rate': data[9],
             'base_exp': data[10],
+            'gender_ratio': data[13],
+            'tmhm': int.from_bytes(bytes(data[24:32]), 'little'),  # Bit i = TM/HM/tutor i
         }
         
         # Calculate BST
@@ -737,290 +545,46 @@ class PokemonTierCalculator:
         
         return pokemon
         
-    def display_pokemon(self, dex_num: int):
-        """Display Pokemon information"""
-        try:
-            pokemon = self.read_pokemon_data(dex_num)
-            self.current_pokemon = pokemon
-            
-            # Clear previous displays
-            for widget in self.info_frame.winfo_children():
-                widget.destroy()
-            for widget in self.stats_frame.winfo_children():
-                widget.destroy()
-            for widget in self.type_frame.winfo_children():
-                widget.destroy()
-            for widget in self.tier_display.winfo_children():
-                widget.destroy()
-                
-            # Clear selected moves
-            self.clear_moves()
-                
-            # Basic info
-            info_text = f"#{pokemon['dex_num']:03d} {pokemon['name']}"
-            ttk.Label(self.info_frame, text=info_text, font=("Arial", 14, "bold")).pack()
-            
-            # Types
-            type1_name = self.TYPES.get(pokemon['type1'], f"Type {pokemon['type1']}")
-            type2_name = self.TYPES.get(pokemon['type2'], f"Type {pokemon['type2']}")
-            
-            if pokemon['type1'] == pokemon['type2']:
-                type_text = f"Type: {type1_name}"
-            else:
-                type_text = f"Types: {type1_name} / {type2_name}"
-                
-            ttk.Label(self.info_frame, text=type_text, font=("Arial", 11)).pack()
-            ttk.Label(self.info_frame, text=f"BST: {pokemon['bst']}", font=("Arial", 11)).pack()
-            
-            # Stats
-            self.display_stats(pokemon)
-            
-            # Type effectiveness
-            self.display_type_matchups(pokemon)
-            
-            # Enable calculate button
-            self.calculate_button.config(state=tk.NORMAL)
-            
-            self.status_var.set(f"Loaded: {pokemon['name']} - Select moves and click Calculate Tier")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to read Pokemon data: {str(e)}")
-            
-    def display_stats(self, pokemon: Dict):
-        """Display stat bars"""
-        stats = [
-            ("HP", pokemon['hp'], "#FF0000"),
-            ("Attack", pokemon['attack'], "#F08030"),
-            ("Defense", pokemon['defense'], "#F8D030"),
-            ("Speed", pokemon['speed'], "#78C850"),
-            ("Sp.Atk", pokemon['sp_attack'], "#6890F0"),
-            ("Sp.Def", pokemon['sp_defense'], "#F85888")
-        ]
-        
-        for i, (stat_name, value, color) in enumerate(stats):
-            # Stat name and value
-            ttk.Label(self.stats_frame, text=f"{stat_name}:").grid(row=i, column=0, sticky=tk.W, padx=5, pady=2)
-            ttk.Label(self.stats_frame, text=str(value), width=5).grid(row=i, column=1, padx=5, pady=2)
-            
-            # Stat bar
-            bar_frame = ttk.Frame(self.stats_frame)
-            bar_frame.grid(row=i, column=2, sticky=tk.W+tk.E, padx=5, pady=2)
-            
-            # Create canvas for bar
-            canvas = tk.Canvas(bar_frame, height=20, width=200, highlightthickness=0)
-            canvas.pack(fill=tk.X, expand=True)
-            
-            # Draw bar
-            bar_width = (value / 255) * 200  # Max stat is 255
-            canvas.create_rectangle(0, 0, bar_width, 20, fill=color, outline="")
-            canvas.create_rectangle(0, 0, 200, 20, outline="gray")
-            
-        # Configure grid weights
-        self.stats_frame.grid_columnconfigure(2, weight=1)
-        
-    def display_type_matchups(self, pokemon: Dict):
-        """Display type effectiveness"""
-        type1_name = self.TYPES.get(pokemon['type1'], "Unknown")
-        type2_name = self.TYPES.get(pokemon['type2'], "Unknown") if pokemon['type1'] != pokemon['type2'] else None
-        
-        # Calculate offensive coverage
-        offensive_label = ttk.Label(self.type_frame, text="Offensive Coverage:", font=("Arial", 10, "bold"))
-        offensive_label.pack(anchor=tk.W)
-        
-        super_effective = []
-        not_very_effective = []
-        
-        for defender_type, effectiveness in self.TYPE_EFFECTIVENESS.get(type1_name, {}).items():
-            if effectiveness > 1:
-                super_effective.append(defender_type)
-            elif effectiveness < 1 and effectiveness > 0:
-                not_very_effective.append(defender_type)
-                
-        if type2_name and type2_name in self.TYPE_EFFECTIVENESS:
-            for defender_type, effectiveness in self.TYPE_EFFECTIVENESS.get(type2_name, {}).items():
-                if effectiveness > 1 and defender_type not in super_effective:
-                    super_effective.append(defender_type)
-                    
-        if super_effective:
-            ttk.Label(self.type_frame, text=f"  Super Effective vs: {', '.join(super_effective[:8])}", 
-                     foreground="green", wraplength=250, justify=tk.LEFT).pack(anchor=tk.W)
-        if not_very_effective:
-            ttk.Label(self.type_frame, text=f"  Not Very Effective vs: {', '.join(not_very_effective[:8])}", 
-                     foreground="red", wraplength=250, justify=tk.LEFT).pack(anchor=tk.W)
-                     
-        # Calculate defensive matchups
-        ttk.Label(self.type_frame, text="\nDefensive Matchups:", font=("Arial", 10, "bold")).pack(anchor=tk.W)
-        
-        weaknesses = []
-        resistances = []
-        immunities = []
-        
-        # Check all types against this Pokemon
-        for attacker_type, matchups in self.TYPE_EFFECTIVENESS.items():
-            effectiveness = matchups.get(type1_name, 1.0)
-            if type2_name:
-                effectiveness *= matchups.get(type2_name, 1.0)
-                
-            if effectiveness > 1:
-                weaknesses.append(attacker_type)
-            elif effectiveness < 1 and effectiveness > 0:
-                resistances.append(attacker_type)
-            elif effectiveness == 0:
-                immunities.append(attacker_type)
-                
-        if weaknesses:
-            ttk.Label(self.type_frame, text=f"  Weak to: {', '.join(weaknesses[:8])}", 
-                     foreground="red", wraplength=250, justify=tk.LEFT).pack(anchor=tk.W)
-        if resistances:
-            ttk.Label(self.type_frame, text=f"  Resists: {', '.join(resistances[:8])}", 
-                     foreground="green", wraplength=250, justify=tk.LEFT).pack(anchor=tk.W)
-        if immunities:
-            ttk.Label(self.type_frame, text=f"  Immune to: {', '.join(immunities)}", 
-                     foreground="blue", wraplength=250, justify=tk.LEFT).pack(anchor=tk.W)
-                     
-    def add_move(self):
-        """Add selected move to Pokemon's moveset"""
-        selection = self.move_listbox.curselection()
-        if not selection:
-            return
-            
-        if len(self.selected_moves) >= 4:
-            messagebox.showwarning("Warning", "Pokemon can only have 4 moves!")
-            return
-            
-        # Get the selected move
-        selected_text = self.move_listbox.get(selection[0])
-        
-        # Find the move ID
-        move_id = None
-        for mid, mname, display in self.all_moves:
-            if display == selected_text:
-                move_id = mid
-                break
-                
-        if move_id and move_id not in [m[0] for m in self.selected_moves]:
-            self.selected_moves.append((move_id, MOVE_NAMES[move_id]))
-            self.update_selected_moves_display()
-            
-    def remove_move(self):
-        """Remove a move from the selected list"""
-        if not self.selected_moves:
-            return
-            
-        # Simple approach: remove the last move
-        self.selected_moves.pop()
-        self.update_selected_moves_display()
-        
-    def clear_moves(self):
-        """Clear all selected moves"""
-        self.selected_moves = []
-        self.update_selected_moves_display()
-        
-    def update_selected_moves_display(self):
-        """Update the display of selected moves"""
-        # Clear previous display
-        for widget in self.selected_moves_frame.winfo_children():
-            widget.destroy()
-            
-        if not self.selected_moves:
-            ttk.Label(self.selected_moves_frame, text="No moves selected", 
-                     foreground="gray").pack(pady=20)
-            return
-            
-        # Display each selected move
-        for i, (move_id, move_name) in enumerate(self.selected_moves):
-            move_frame = ttk.Frame(self.selected_moves_frame)
-            move_frame.pack(fill=tk.X, pady=2)
-            
-            # Move slot and name
-            ttk.Label(move_frame, text=f"{i+1}. {move_name}", 
-                     font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=5)
-            
-            # Move details if available
-            if move_id in self.MOVE_DATA:
-                power, type_, acc, pp, is_phys, effect = self.MOVE_DATA[move_id]
-                details = f"({type_}, Pow: {power}, Acc: {acc}%)"
-                ttk.Label(move_frame, text=details, foreground="gray").pack(side=tk.LEFT, padx=10)
-                
-        # Show how many moves selected
-        count_text = f"{len(self.selected_moves)}/4 moves selected"
-        ttk.Label(self.selected_moves_frame, text=count_text, 
-                 font=("Arial", 9), foreground="blue").pack(pady=(10, 0))
-                 
-    def calculate_and_display_tier(self):
-        """Calculate and display the tier rating"""
-        if not self.current_pokemon:
-            messagebox.showerror("Error", "Please select a Pokemon first")
-            return
-            
-        # Clear previous tier display
-        for widget in self.tier_display.winfo_children():
-            widget.destroy()
-            
-        # Calculate tier
-        tier, total_score, breakdown, color = self.calculate_tier(self.current_pokemon)
-        
-        # Tier display
-        tier_label = ttk.Label(self.tier_display, text=f"Tier: {tier}", 
-                              font=("Arial", 24, "bold"), foreground=color)
-        tier_label.pack(pady=10)
-        
-        score_label = ttk.Label(self.tier_display, text=f"Score: {total_score:.1f}/100",
-                               font=("Arial", 14))
-        score_label.pack()
-        
-        # Move count indicator
-        move_count = len(self.selected_moves)
-        move_text = f"Based on {move_count} moves"
-        ttk.Label(self.tier_display, text=move_text, font=("Arial", 10), 
-                 foreground="gray").pack()
-        
-        # Breakdown
-        ttk.Label(self.tier_display, text="\nScore Breakdown:", 
-                 font=("Arial", 12, "bold")).pack(pady=(20, 10))
-        
-        breakdown_frame = ttk.Frame(self.tier_display)
-        breakdown_frame.pack(fill=tk.X, padx=20)
-        
-        for category, score in breakdown.items():
-            row_frame = ttk.Frame(breakdown_frame)
-            row_frame.pack(fill=tk.X, pady=2)
-            
-            ttk.Label(row_frame, text=f"{category}:", width=10).pack(side=tk.LEFT)
-            
-            # Progress bar
-            progress = ttk.Progressbar(row_frame, length=150, mode='determinate')
-            progress['value'] = (score / (total_score / 100)) * 100 if total_score > 0 else 0
-            progress.pack(side=tk.LEFT, padx=10)
-            
-            ttk.Label(row_frame, text=f"{score:.1f}").pack(side=tk.LEFT)
-            
-        # Analysis text
-        ttk.Label(self.tier_display, text="\nAnalysis:", 
-                 font=("Arial", 12, "bold")).pack(pady=(20, 10))
-        
-        analysis_frame = ttk.Frame(self.tier_display)
-        analysis_frame.pack(fill=tk.BOTH, expand=True, padx=20)
-        
-        analysis_text = self.generate_analysis(self.current_pokemon, tier, breakdown)
-        
-        analysis_label = ttk.Label(analysis_frame, text=analysis_text, 
-                                  wraplength=300, justify=tk.LEFT)
-        analysis_label.pack(anchor=tk.W)
-        
-        self.status_var.set(f"Tier calculated: {tier} ({total_score:.1f}/100)")
-        
-    def calculate_tier(self, pokemon: Dict) -> Tuple[str, float, Dict, str]:
-        """Calculate tier rating based on stats and selected moves"""
-        scores = {}
-        
-        # 1. Base Stat Total (20% weight)
-        bst_score = min((pokemon['bst'] - 200) / 4, 100)
-        scores['BST'] = bst_score * 0.20
+    def get_speed_index(self) -> Optional[SpeedIndex]:
+        """Speed index for the loaded ROM, rebuilt when a different ROM is loaded"""
+        if not self.rom_data:
+            return None
+        if self.speed_index is None or self.speed_index.rom_data is not self.rom_data:
+            self.speed_index = SpeedIndex(self)
+        return self.speed_index
         
-        # 2. Speed Tier (25% weight)
+    def get_distribution(self) -> Optional[ScoreDistribution]:
+        """Whole-dex score distribution for the loaded ROM, rebuilt when a different ROM is loaded"""
+        if not self.rom_data:
+            return None
+        if self.distribution is None or self.distribution_rom is not self.rom_data:
+            self.distribution = ScoreDistribution.for_rom(self)
+            self.distribution_rom = self.rom_data
+        return self.distribution
+        
+    def current_boundaries(self) -> List[Tuple[str, float, str]]:
+        """Tier boundaries in effect: the fixed ones, or percentile cutoffs for this ROM"""
+        if self.tier_mode == "percentile":
+            distribution = self.get_distribution()
+            if distribution:
+                colors = {tier: color for tier, _, color in self.DEFAULT_TIER_BOUNDARIES}
+                return distribution.boundaries(self.weights, self.tier_percentiles, colors)
+        return self.tier_boundaries
+        
+    def calculate_components(self, pokemon: Dict, moves: Optional[List[Tuple[int, str]]] = None) -> Dict[str, float]:
+        """Calculate the raw 0-100 score of each tier component"""
+        components = {}
+        
+        # 1. Base Stat Total
+        components['BST'] = min((pokemon['bst'] - 200) / 4, 100)
+        
+        # 2. Speed Tier - share of this ROM's dex it outspeeds, so randomized
+        # base stats move the scale with them
         speed = pokemon['speed']
-        if speed >= 120:
+        speed_index = self.get_speed_index()
+        if speed_index:
+            speed_score = 10 + 90 * speed_index.outspeed_fraction(speed)
+        elif speed >= 120:
             speed_score = 100
         elif speed >= 100:
             speed_score = 90
@@ -1032,51 +596,44 @@ class PokemonTierCalculator:
             speed_score = 25
         else:
             speed_score = 10
-        scores['Speed'] = speed_score * 0.25
+        components['Speed'] = speed_score
         
-        # 3. Offensive Potential (15% weight)
+        # 3. Offensive Potential
         offensive_stats = max(pokemon['attack'], pokemon['sp_attack'])
-        offensive_score = min(offensive_stats / 1.5, 100)
-        scores['Offense'] = offensive_score * 0.15
+        components['Offense'] = min(offensive_stats / 1.5, 100)
         
-        # 4. Defensive Bulk (15% weight)
+        # 4. Defensive Bulk
         bulk = (pokemon['hp'] + pokemon['defense'] + pokemon['sp_defense']) / 3
-        bulk_score = min(bulk / 1.2, 100)
-        scores['Bulk'] = bulk_score * 0.15
+        components['Bulk'] = min(bulk / 1.2, 100)
+        
+        # 5. Type Quality
+        components['Type'] = self.evaluate_type_quality(pokemon)
         
-        # 5. Type Quality (10% weight)
-        type_score = self.evaluate_type_quality(pokemon)
-        scores['Type'] = type_score * 0.10
+        # 6. Movepool Quality - Based on selected moves
+        components['Moves'] = self.analyze_selected_moves(pokemon, moves)
         
-        # 6. Movepool Quality (15% weight) - Based on selected moves
-        movepool_score = self.analyze_selected_moves(pokemon)
-        scores['Moves'] = movepool_score * 0.15
+        return components
+        
+    def calculate_tier(self, pokemon: Dict, moves: Optional[List[Tuple[int, str]]] = None) -> Tuple[str, float, Dict, str]:
+        """Calculate tier rating based on stats and selected moves (or an explicit moveset)"""
+        components = self.calculate_components(pokemon, moves)
+        scores = {name: value * self.weights[name] for name, value in components.items()}
         
         # Calculate total
         total_score = sum(scores.values())
-        
-        # Determine tier
-        if total_score >= 85:
-            tier = "S"
-            color = "#FF0000"
-        elif total_score >= 70:
-            tier = "A"
-            color = "#FF8C00"
-        elif total_score >= 55:
-            tier = "B"
-            color = "#FFD700"
-        elif total_score >= 40:
-            tier = "C"
-            color = "#00FF00"
-        elif total_score >= 25:
-            tier = "D"
-            color = "#00CED1"
-        else:
-            tier = "F"
-            color = "#808080"
+        tier, color = self.assign_tier(total_score)
             
         return tier, total_score, scores, color
         
+    def assign_tier(self, total_score: float) -> Tuple[str, str]:
+        """Map a total score to (tier, color) using the current boundaries"""
+        boundaries = self.current_boundaries()
+        for tier, minimum, color in boundaries:
+            if total_score >= minimum:
+                return tier, color
+        tier, _, color = boundaries[-1]
+        return tier, color
+        
     def evaluate_type_quality(self, pokemon: Dict) -> float:
         """Evaluate how good a type combination is"""
         type1_name = self.TYPES.get(pokemon['type1'], "Unknown")
@@ -1100,9 +657,11 @@ class PokemonTierCalculator:
             
         return min(score, 100)
         
-    def analyze_selected_moves(self, pokemon: Dict) -> float:
+    def analyze_selected_moves(self, pokemon: Dict, moves: Optional[List[Tuple[int, str]]] = None) -> float:
         """Analyze the quality of selected moves"""
-        if not self.selected_moves:
+        if moves is None:
+            moves = self.selected_moves
+        if not moves:
             return 0
             
         score = 0
@@ -1110,9 +669,13 @@ class PokemonTierCalculator:
         status_moves = []
         
         # Categorize moves
-        for move_id, move_name in self.selected_moves:
+        for move_id, move_name in moves:
             if move_id in self.MOVE_DATA:
                 power, type_, acc, pp, is_phys, effect = self.MOVE_DATA[move_id]
+                # Hidden Power's type and power come from the Pokemon's DVs when known
+                if move_id == HIDDEN_POWER and 'hidden_power' in pokemon:
+                    type_, power = pokemon['hidden_power']
+                    is_phys = HIDDEN_POWER_TYPES.index(type_) < PHYSICAL_HIDDEN_POWER_TYPES
                 if power > 0:
                     damaging_moves.append((move_id, power, type_, is_phys))
                 else:
@@ -1184,9 +747,9 @@ class PokemonTierCalculator:
                 score += 5
                 
         # Move count bonus (5 points)
-        if len(self.selected_moves) == 4:
+        if len(moves) == 4:
             score += 5
-        elif len(self.selected_moves) == 3:
+        elif len(moves) == 3:
             score += 3
             
         return min(score, 100)
@@ -1260,6 +823,784 @@ class PokemonTierCalculator:
         return '\n'.join(analysis)
 
 
+class PokemonTierCalculator(TierScorer):
+    """Main application for calculating Pokemon tiers with manual move selection"""
+    
+    CONFIG_POLL_MS = 1000  # How often to check tier_config.json for edits
+    FILTER_DEBOUNCE_MS = 75  # Quiet time after a keystroke before the move list is filtered
+    SPECIES_MATCHES = 10     # Suggestions offered in the name combobox while typing
+    FEED_POLL_MS = 100       # How often the Tk loop drains the live party feed and file watcher
+    
+    # (label, stat key, bar color) for the stat panel
+    STAT_BARS = [
+        ("HP", 'hp', "#FF0000"), ("Attack", 'attack', "#F08030"), ("Defense", 'defense', "#F8D030"),
+        ("Speed", 'speed', "#78C850"), ("Sp.Atk", 'sp_attack', "#6890F0"), ("Sp.Def", 'sp_defense', "#F85888")
+    ]
+    
+    def __init__(self, root):
+        self.root = root
+        self.root.title("🎮 Pokemon Crystal Tier Calculator - Manual Move Selection")
+        self.root.geometry("1400x900")
+        
+        super().__init__()
+        self.rom_path = None
+        self.current_pokemon = None
+        self.stat_table = None
+        self.party_level = None  # Level of the party Pokemon being displayed, if any
+        self.species_index = SpeciesIndex(self.POKEMON_NAMES)
+        self.species_filter_job = None
+        self.party_feed = None     # Live party listener, while enabled
+        self.party_watcher = None  # Party file watcher, while live
+        self.feed_job = None       # Pending poll_party_feed, while live
+        self.party_scores = None   # Tier results of the live party
+        self.party_slot = None     # Party slot of the Pokemon being displayed, if any
+        
+        self.create_widgets()
+        
+        # Pick up tier_config.json edits without restarting
+        self.root.after(self.CONFIG_POLL_MS, self.poll_config)
+        
+    def create_widgets(self):
+        """Create the GUI layout"""
+        # Main container
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Header
+        header_frame = ttk.Frame(main_frame)
+        header_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(header_frame, text="Pokemon Crystal Tier Calculator", 
+                 font=("Arial", 16, "bold")).pack(side=tk.LEFT)
+        
+        ttk.Button(header_frame, text="Load ROM", command=self.load_rom,
+                  style="Accent.TButton").pack(side=tk.RIGHT, padx=5)
+        
+        ttk.Button(header_frame, text="Load Party", command=self.load_party_data,
+                  style="Accent.TButton").pack(side=tk.RIGHT, padx=5)
+        
+        self.live_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(header_frame, text="Live Party", variable=self.live_var,
+                        command=self.toggle_live_party).pack(side=tk.RIGHT, padx=5)
+        
+        self.rom_label = ttk.Label(header_frame, text="No ROM loaded", foreground="gray")
+        self.rom_label.pack(side=tk.RIGHT, padx=10)
+        
+        # Search frame
+        search_frame = ttk.LabelFrame(main_frame, text="Select Pokemon", padding="10")
+        search_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        # Search by number
+        ttk.Label(search_frame, text="Dex #:").grid(row=0, column=0, sticky=tk.W, padx=5)
+        self.dex_var = tk.StringVar()
+        dex_entry = ttk.Entry(search_frame, textvariable=self.dex_var, width=10)
+        dex_entry.grid(row=0, column=1, padx=5)
+        
+        # Search by name
+        ttk.Label(search_frame, text="Name:").grid(row=0, column=2, sticky=tk.W, padx=5)
+        self.name_var = tk.StringVar()
+        self.name_combo = ttk.Combobox(search_frame, textvariable=self.name_var, width=20)
+        self.name_combo['values'] = self.species_index.labels(sorted(self.POKEMON_NAMES))
+        self.name_combo.grid(row=0, column=3, padx=5)
+        self.name_var.trace('w', self.filter_species)
+        self.name_combo.bind('<Return>', lambda e: self.search_pokemon())
+        
+        ttk.Button(search_frame, text="Load Pokemon", command=self.search_pokemon).grid(row=0, column=4, padx=10)
+        ttk.Button(search_frame, text="Random", command=self.random_pokemon).grid(row=0, column=5, padx=5)
+        
+        # Main content area with three columns
+        content_frame = ttk.Frame(main_frame)
+        content_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Left panel - Pokemon info
+        left_panel = ttk.LabelFrame(content_frame, text="Pokemon Data", padding="10")
+        left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
+        
+        # Basic info
+        self.info_frame = ttk.Frame(left_panel)
+        self.info_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        # Stats display
+        self.stats_frame = ttk.LabelFrame(left_panel, text="Base Stats", padding="10")
+        self.stats_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        # Type effectiveness
+        self.type_frame = ttk.LabelFrame(left_panel, text="Type Matchups", padding="10")
+        self.type_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Middle panel - Move selection
+        middle_panel = ttk.LabelFrame(content_frame, text="Move Selection", padding="10")
+        middle_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
+        
+        # Instructions
+        ttk.Label(middle_panel, text="Select up to 4 moves:", font=("Arial", 10, "bold")).pack()
+        
+        # Search box for moves
+        search_move_frame = ttk.Frame(middle_panel)
+        search_move_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(search_move_frame, text="Search:").pack(side=tk.LEFT, padx=5)
+        self.move_search_var = tk.StringVar()
+        self.move_search_var.trace('w', self.filter_moves)
+        search_entry = ttk.Entry(search_move_frame, textvariable=self.move_search_var)
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        
+        # Move list with scrollbar
+        move_list_frame = ttk.Frame(middle_panel)
+        move_list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        
+        scrollbar = ttk.Scrollbar(move_list_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.move_listbox = tk.Listbox(move_list_frame, height=15, selectmode=tk.SINGLE,
+                                       yscrollcommand=scrollbar.set)
+        self.move_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.move_listbox.yview)
+        
+        # Populate move list; visible_rows maps listbox positions to catalog rows
+        self.move_catalog = MoveCatalog(MOVE_NAMES, self.MOVE_DATA)
+        self.visible_rows = list(range(len(self.move_catalog)))
+        self.visible_index = {row: i for i, row in enumerate(self.visible_rows)}
+        self.visible_query = ""
+        self.visible_fuzzy = False
+        self.filter_job = None
+        self.move_listbox.insert(tk.END, *(self.move_catalog.display(row) for row in self.visible_rows))
+        
+        # Buttons
+        button_frame = ttk.Frame(middle_panel)
+        button_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Button(button_frame, text="Add Move →", command=self.add_move).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="← Remove", command=self.remove_move).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Clear All", command=self.clear_moves).pack(side=tk.LEFT, padx=5)
+        
+        # Selected moves
+        ttk.Label(middle_panel, text="Selected Moves:", font=("Arial", 10, "bold")).pack(pady=(10, 5))
+        
+        self.selected_moves_frame = ttk.Frame(middle_panel)
+        self.selected_moves_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Right panel - Tier rating
+        right_panel = ttk.LabelFrame(content_frame, text="Tier Analysis", padding="10")
+        right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        
+        self.tier_display = ttk.Frame(right_panel)
+        self.tier_display.pack(fill=tk.BOTH, expand=True)
+        
+        # Calculate button
+        self.calculate_button = ttk.Button(right_panel, text="Calculate Tier", 
+                                         command=self.calculate_and_display_tier,
+                                         style="Accent.TButton", state=tk.DISABLED)
+        self.calculate_button.pack(side=tk.BOTTOM, pady=10)
+        
+        # Status bar
+        self.status_var = tk.StringVar(value="Ready - Select a Pokemon to begin")
+        status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN)
+        status_bar.pack(fill=tk.X, pady=(5, 0))
+        
+        # Panel contents are built once and updated in place
+        self.build_info_panel()
+        self.build_stats_panel()
+        self.build_type_panel()
+        self.build_tier_panel()
+        self.build_selected_moves_panel()
+        
+    def build_info_panel(self):
+        """Name, type and BST labels"""
+        self.name_label = ttk.Label(self.info_frame, font=("Arial", 14, "bold"))
+        self.name_label.pack()
+        self.types_label = ttk.Label(self.info_frame, font=("Arial", 11))
+        self.types_label.pack()
+        self.bst_label = ttk.Label(self.info_frame, font=("Arial", 11))
+        self.bst_label.pack()
+        
+    def build_stats_panel(self):
+        """One row per stat: name, value, bar and (for party Pokemon) actual stat"""
+        self.stat_rows = []
+        for i, (stat_name, _, color) in enumerate(self.STAT_BARS):
+            ttk.Label(self.stats_frame, text=f"{stat_name}:").grid(row=i, column=0, sticky=tk.W, padx=5, pady=2)
+            value_label = ttk.Label(self.stats_frame, width=5)
+            value_label.grid(row=i, column=1, padx=5, pady=2)
+            
+            # Stat bar
+            bar_frame = ttk.Frame(self.stats_frame)
+            bar_frame.grid(row=i, column=2, sticky=tk.W+tk.E, padx=5, pady=2)
+            canvas = tk.Canvas(bar_frame, height=20, width=200, highlightthickness=0)
+            canvas.pack(fill=tk.X, expand=True)
+            bar = canvas.create_rectangle(0, 0, 0, 20, fill=color, outline="")
+            canvas.create_rectangle(0, 0, 200, 20, outline="gray")
+            
+            actual_label = ttk.Label(self.stats_frame, width=5)
+            actual_label.grid(row=i, column=3, padx=5, pady=2)
+            actual_label.grid_remove()
+            self.stat_rows.append((value_label, canvas, bar, actual_label))
+            
+        self.level_label = ttk.Label(self.stats_frame, foreground="gray")
+        self.level_label.grid(row=len(self.STAT_BARS), column=3, padx=5, pady=2)
+        self.level_label.grid_remove()
+        
+        # Configure grid weights
+        self.stats_frame.grid_columnconfigure(2, weight=1)
+        
+    def build_type_panel(self):
+        """Offensive and defensive matchup lines; empty lines are hidden"""
+        def line(row, foreground=None, font=None):
+            label = ttk.Label(self.type_frame, foreground=foreground, font=font,
+                              wraplength=250, justify=tk.LEFT)
+            label.grid(row=row, column=0, sticky=tk.W)
+            return label
+            
+        line(0, font=("Arial", 10, "bold")).config(text="Offensive Coverage:")
+        self.super_effective_label = line(1, "green")
+        self.not_very_effective_label = line(2, "red")
+        line(3, font=("Arial", 10, "bold")).config(text="\nDefensive Matchups:")
+        self.weak_label = line(4, "red")
+        self.resist_label = line(5, "green")
+        self.immune_label = line(6, "blue")
+        
+    def build_tier_panel(self):
+        """Tier result, breakdown and analysis; hidden until a tier is calculated"""
+        self.tier_content = ttk.Frame(self.tier_display)
+        
+        self.tier_label = ttk.Label(self.tier_content, font=("Arial", 24, "bold"))
+        self.tier_label.pack(pady=10)
+        self.score_label = ttk.Label(self.tier_content, font=("Arial", 14))
+        self.score_label.pack()
+        self.percentile_label = ttk.Label(self.tier_content, font=("Arial", 10))
+        
+        # Move count indicator
+        self.move_count_label = ttk.Label(self.tier_content, font=("Arial", 10), foreground="gray")
+        self.move_count_label.pack()
+        
+        # Breakdown
+        ttk.Label(self.tier_content, text="\nScore Breakdown:", 
+                 font=("Arial", 12, "bold")).pack(pady=(20, 10))
+        
+        breakdown_frame = ttk.Frame(self.tier_content)
+        breakdown_frame.pack(fill=tk.X, padx=20)
+        
+        self.breakdown_rows = {}
+        for category in self.DEFAULT_WEIGHTS:
+            row_frame = ttk.Frame(breakdown_frame)
+            row_frame.pack(fill=tk.X, pady=2)
+            
+            ttk.Label(row_frame, text=f"{category}:", width=10).pack(side=tk.LEFT)
+            progress = ttk.Progressbar(row_frame, length=150, mode='determinate')
+            progress.pack(side=tk.LEFT, padx=10)
+            score_label = ttk.Label(row_frame)
+            score_label.pack(side=tk.LEFT)
+            self.breakdown_rows[category] = (progress, score_label)
+            
+        # Analysis text
+        ttk.Label(self.tier_content, text="\nAnalysis:", 
+                 font=("Arial", 12, "bold")).pack(pady=(20, 10))
+        
+        analysis_frame = ttk.Frame(self.tier_content)
+        analysis_frame.pack(fill=tk.BOTH, expand=True, padx=20)
+        
+        self.analysis_label = ttk.Label(analysis_frame, wraplength=300, justify=tk.LEFT)
+        self.analysis_label.pack(anchor=tk.W)
+        
+    def build_selected_moves_panel(self):
+        """Placeholder, four move slots and the count line; shown as needed"""
+        self.no_moves_label = ttk.Label(self.selected_moves_frame, text="No moves selected", 
+                                        foreground="gray")
+        self.move_slots = []
+        for _ in range(4):
+            move_frame = ttk.Frame(self.selected_moves_frame)
+            name_label = ttk.Label(move_frame, font=("Arial", 10, "bold"))
+            name_label.pack(side=tk.LEFT, padx=5)
+            details_label = ttk.Label(move_frame, foreground="gray")
+            details_label.pack(side=tk.LEFT, padx=10)
+            self.move_slots.append((move_frame, name_label, details_label))
+        self.move_count_text = ttk.Label(self.selected_moves_frame, font=("Arial", 9), foreground="blue")
+        
+    @staticmethod
+    def show_line(label, text: str):
+        """Set a grid-managed label's text, hiding it when there is nothing to show"""
+        if text:
+            label.config(text=text)
+            label.grid()
+        else:
+            label.grid_remove()
+        
+    def load_rom(self):
+        """Load a ROM file"""
+        filename = filedialog.askopenfilename(
+            title="Select Pokemon Crystal ROM",
+            filetypes=[("Game Boy ROMs", "*.gbc *.gb"), ("All files", "*.*")]
+        )
+        
+        if filename:
+            self.rom_path = Path(filename)
+            self.rom_data = self.rom_path.read_bytes()
+            self.stat_table = StatTable.for_rom(self.rom_data, self)
+            self.rom_label.config(text=self.rom_path.name, foreground="black")
+            self.status_var.set(f"Loaded: {self.rom_path.name}")
+            
+    def load_party_data(self):
+        """Load party data from BizHawk export (or the live feed, when enabled)"""
+        if self.party_scores and self.party_scores.slots:
+            self.show_party_selection({'count': len(self.party_scores.slots),
+                                       'pokemon': [self.party_scores.slots[s] for s in sorted(self.party_scores.slots)]})
+            return
+            
+        party_file = find_party_file()
+        if not party_file:
+            messagebox.showerror("Error", "No party data found!\n\nRun party_exporter.lua in BizHawk first.")
+            return
+            
+        try:
+            party_data = load_party_file(party_file)
+                
+            self.status_var.set(f"Loaded party data: {party_data['count']} Pokemon")
+            self.show_party_selection(party_data)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load party data: {str(e)}")
+            
+    def show_party_selection(self, party_data):
+        """Show dialog to select Pokemon from party"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Select Pokemon from Party")
+        dialog.geometry("400x300")
+        
+        ttk.Label(dialog, text="Your Current Party:", font=("Arial", 12, "bold")).pack(pady=10)
+        
+        listbox = tk.Listbox(dialog, height=6, font=("Arial", 11))
+        listbox.pack(pady=10, padx=20, fill=tk.BOTH, expand=True)
+        
+        for poke in party_data['pokemon']:
+            name = self.POKEMON_NAMES.get(poke['species'], f"Unknown #{poke['species']}")
+            listbox.insert(tk.END, f"Slot {poke['slot']}: {name} Lv.{poke['level']}")
+            
+        def select_pokemon():
+            selection = listbox.curselection()
+            if selection:
+                idx = selection[0]
+                pokemon = party_data['pokemon'][idx]
+                dialog.destroy()
+                self.display_party_pokemon(pokemon)
+                
+        ttk.Button(dialog, text="Select", command=select_pokemon).pack(pady=10)
+        
+    def display_party_pokemon(self, party_poke):
+        """Display party Pokemon and pre-select their moves"""
+        # Set the dex number
+        self.dex_var.set(str(party_poke['species']))
+        
+        # Load the Pokemon, showing actual stats at its level
+        self.party_level = party_poke.get('level')
+        self.search_pokemon()
+        self.party_level = None
+        self.party_slot = party_poke.get('slot')
+        if 'dvs' in party_poke and self.current_pokemon:
+            self.current_pokemon['hidden_power'] = hidden_power(party_poke['dvs'])
+        
+        # Pre-select their current moves
+        self.clear_moves()
+        for move_id in party_poke['moves']:
+            row = self.move_catalog.row_of_id.get(move_id)
+            if row is None:
+                continue
+            # Highlight the move if the current filter shows it
+            i = self.visible_index.get(row)
+            if i is not None:
+                self.move_listbox.selection_clear(0, tk.END)
+                self.move_listbox.selection_set(i)
+                self.move_listbox.see(i)
+            self.add_move_id(move_id)
+                        
+    def toggle_live_party(self):
+        """Start or stop following the party: snapshots pushed from the emulator
+        plus changes to the exported party files"""
+        if not self.live_var.get():
+            if self.feed_job is not None:
+                self.root.after_cancel(self.feed_job)
+                self.feed_job = None
+            if self.party_feed:
+                self.party_feed.stop()
+            if self.party_watcher:
+                self.party_watcher.close()
+            self.party_feed = None
+            self.party_watcher = None
+            self.party_scores = None
+            self.status_var.set("Live party stopped")
+            return
+            
+        if not self.rom_data:
+            messagebox.showerror("Error", "Please load a ROM first")
+            self.live_var.set(False)
+            return
+            
+        self.party_scores = PartyScores(self)
+        self.party_watcher = PartyWatcher()
+        try:
+            self.party_feed = PartyFeed().start()
+            host, port = self.party_feed.address
+            self.status_var.set(f"Waiting for party snapshots on {host}:{port} "
+                                f"and party file changes ({self.party_watcher.method})")
+        except OSError as e:
+            self.status_var.set(f"Live socket unavailable ({e}); watching party files only")
+        self.feed_job = self.root.after(self.FEED_POLL_MS, self.poll_party_feed)
+        
+    def poll_party_feed(self):
+        """Apply the newest snapshot from the socket or the party files; runs on the Tk loop"""
+        self.feed_job = None
+        if not self.party_watcher:
+            return
+        snapshots = [self.party_watcher.poll()]
+        if self.party_feed:
+            snapshots.append(self.party_feed.latest())
+        for snapshot in snapshots:
+            if snapshot is None:
+                continue
+            try:
+                self.apply_party_snapshot(snapshot)
+            except Exception as e:
+                self.status_var.set(f"Skipped a malformed party snapshot: {e!r}")
+        self.feed_job = self.root.after(self.FEED_POLL_MS, self.poll_party_feed)
+        
+    def apply_party_snapshot(self, snapshot: Dict):
+        """Rescore the slots that changed and refresh the display if it shows one of them"""
+        changed = self.party_scores.update(snapshot)
+        if not changed:
+            return
+        self.status_var.set("Party: " + self.party_scores.summary(" | "))
+        
+        if self.party_slot in changed and self.party_slot in self.party_scores.slots:
+            tier_shown = self.tier_content.winfo_manager()
+            self.display_party_pokemon(self.party_scores.slots[self.party_slot])
+            if tier_shown:
+                self.calculate_and_display_tier()
+        
+    def filter_species(self, *args):
+        """Offer ranked species matches in the name combobox, once typing pauses"""
+        if self.species_filter_job is not None:
+            self.root.after_cancel(self.species_filter_job)
+        self.species_filter_job = self.root.after(self.FILTER_DEBOUNCE_MS, self.apply_species_filter)
+        
+    def apply_species_filter(self):
+        self.species_filter_job = None
+        query = self.name_var.get()
+        if query in self.name_combo['values']:
+            return  # A suggestion was just picked
+        if normalize(query):
+            dex_nums = self.species_index.search(query, self.SPECIES_MATCHES)
+        else:
+            dex_nums = sorted(self.POKEMON_NAMES)
+        self.name_combo['values'] = self.species_index.labels(dex_nums)
+        
+    def filter_moves(self, *args):
+        """Filter move list based on search, once typing pauses"""
+        if self.filter_job is not None:
+            self.root.after_cancel(self.filter_job)
+        self.filter_job = self.root.after(self.FILTER_DEBOUNCE_MS, self.apply_move_filter)
+        
+    def apply_move_filter(self):
+        """Filter the move list, refining the current results when the query only grew
+        
+        A query no move contains falls back to fuzzy matches, which can't be
+        refined by substring, so the next keystroke filters from scratch.
+        """
+        self.filter_job = None
+        query = normalize(self.move_search_var.get())
+        if query == self.visible_query:
+            return
+            
+        if self.visible_query in query and not self.visible_fuzzy:
+            rows = self.move_catalog.refine(self.visible_rows, query)
+        else:
+            rows = self.move_catalog.filter(query)
+            
+        # Nothing contains the query: offer the closest spellings instead
+        self.visible_fuzzy = not rows
+        if self.visible_fuzzy:
+            rows = self.move_catalog.closest(query)
+            
+        self.patch_move_listbox(rows)
+        self.visible_query = query
+        
+    def patch_move_listbox(self, rows: List[int]):
+        """Turn the listbox into rows with as few deletes/inserts as possible
+        
+        Both the old and new rows are in catalog order, so rows that stay keep
+        their relative order: delete runs that dropped out (bottom up, so indices
+        stay valid), then insert runs of new rows at their final positions.
+        """
+        keep = set(rows)
+        old = self.visible_rows
+        i = len(old) - 1
+        while i >= 0:
+            if old[i] in keep:
+                i -= 1
+                continue
+            end = i
+            while i >= 0 and old[i] not in keep:
+                i -= 1
+            self.move_listbox.delete(i + 1, end)
+            
+        present = set(old)
+        i = 0
+        while i < len(rows):
+            if rows[i] in present:
+                i += 1
+                continue
+            start = i
+            while i < len(rows) and rows[i] not in present:
+                i += 1
+            self.move_listbox.insert(start, *(self.move_catalog.display(row) for row in rows[start:i]))
+            
+        self.visible_rows = rows
+        self.visible_index = {row: i for i, row in enumerate(rows)}
+                
+    def search_pokemon(self):
+        """Search for a Pokemon by number or name"""
+        if not self.rom_data:
+            messagebox.showerror("Error", "Please load a ROM first")
+            return
+            
+        # Try to get dex number
+        dex_num = None
+        
+        if self.dex_var.get():
+            try:
+                dex_num = int(self.dex_var.get())
+            except ValueError:
+                messagebox.showerror("Error", "Invalid dex number")
+                return
+                
+        elif self.name_var.get():
+            # Combo selection, dex number, exact name or best fuzzy match
+            dex_num = self.species_index.resolve(self.name_var.get())
+                        
+        if not dex_num or dex_num < 1 or dex_num > 251:
+            messagebox.showerror("Error", "Please enter a valid Pokemon (1-251)")
+            return
+            
+        self.display_pokemon(dex_num)
+        
+    def random_pokemon(self):
+        """Display a random Pokemon"""
+        if not self.rom_data:
+            messagebox.showerror("Error", "Please load a ROM first")
+            return
+            
+        dex_num = random.randint(1, 251)
+        self.dex_var.set(str(dex_num))
+        self.display_pokemon(dex_num)
+        
+    def display_pokemon(self, dex_num: int):
+        """Display Pokemon information"""
+        try:
+            pokemon = self.read_pokemon_data(dex_num)
+            self.current_pokemon = pokemon
+            
+            # Hide the previous tier result
+            self.tier_content.pack_forget()
+            self.party_slot = None
+                
+            # Clear selected moves
+            self.clear_moves()
+                
+            # Basic info
+            self.name_label.config(text=f"#{pokemon['dex_num']:03d} {pokemon['name']}")
+            
+            # Types
+            type1_name = self.TYPES.get(pokemon['type1'], f"Type {pokemon['type1']}")
+            type2_name = self.TYPES.get(pokemon['type2'], f"Type {pokemon['type2']}")
+            
+            if pokemon['type1'] == pokemon['type2']:
+                type_text = f"Type: {type1_name}"
+            else:
+                type_text = f"Types: {type1_name} / {type2_name}"
+                
+            self.types_label.config(text=type_text)
+            self.bst_label.config(text=f"BST: {pokemon['bst']}")
+            
+            # Stats
+            self.display_stats(pokemon)
+            
+            # Type effectiveness
+            self.display_type_matchups(pokemon)
+            
+            # Enable calculate button
+            self.calculate_button.config(state=tk.NORMAL)
+            
+            self.status_var.set(f"Loaded: {pokemon['name']} - Select moves and click Calculate Tier")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to read Pokemon data: {str(e)}")
+            
+    def display_stats(self, pokemon: Dict):
+        """Update stat values and bars"""
+        # Actual stats (max DVs, no stat exp) when showing a party Pokemon
+        actual = None
+        if self.party_level and self.stat_table and 1 <= self.party_level <= 100:
+            actual = self.stat_table.stats(pokemon['dex_num'], self.party_level)
+        self.show_line(self.level_label, f"Lv.{self.party_level}" if actual else "")
+        
+        for (_, key, _), (value_label, canvas, bar, actual_label) in zip(self.STAT_BARS, self.stat_rows):
+            value = pokemon[key]
+            value_label.config(text=str(value))
+            canvas.coords(bar, 0, 0, (value / 255) * 200, 20)  # Max stat is 255
+            self.show_line(actual_label, str(actual[key]) if actual else "")
+        
+    def display_type_matchups(self, pokemon: Dict):
+        """Display type effectiveness"""
+        type1_name = self.TYPES.get(pokemon['type1'], "Unknown")
+        type2_name = self.TYPES.get(pokemon['type2'], "Unknown") if pokemon['type1'] != pokemon['type2'] else None
+        
+        # Calculate offensive coverage
+        super_effective = []
+        not_very_effective = []
+        
+        for defender_type, effectiveness in self.TYPE_EFFECTIVENESS.get(type1_name, {}).items():
+            if effectiveness > 1:
+                super_effective.append(defender_type)
+            elif effectiveness < 1 and effectiveness > 0:
+                not_very_effective.append(defender_type)
+                
+        if type2_name and type2_name in self.TYPE_EFFECTIVENESS:
+            for defender_type, effectiveness in self.TYPE_EFFECTIVENESS.get(type2_name, {}).items():
+                if effectiveness > 1 and defender_type not in super_effective:
+                    super_effective.append(defender_type)
+                    
+        self.show_line(self.super_effective_label,
+                       f"  Super Effective vs: {', '.join(super_effective[:8])}" if super_effective else "")
+        self.show_line(self.not_very_effective_label,
+                       f"  Not Very Effective vs: {', '.join(not_very_effective[:8])}" if not_very_effective else "")
+                     
+        # Calculate defensive matchups
+        weaknesses = []
+        resistances = []
+        immunities = []
+        
+        # Check all types against this Pokemon
+        for attacker_type, matchups in self.TYPE_EFFECTIVENESS.items():
+            effectiveness = matchups.get(type1_name, 1.0)
+            if type2_name:
+                effectiveness *= matchups.get(type2_name, 1.0)
+                
+            if effectiveness > 1:
+                weaknesses.append(attacker_type)
+            elif effectiveness < 1 and effectiveness > 0:
+                resistances.append(attacker_type)
+            elif effectiveness == 0:
+                immunities.append(attacker_type)
+                
+        self.show_line(self.weak_label, f"  Weak to: {', '.join(weaknesses[:8])}" if weaknesses else "")
+        self.show_line(self.resist_label, f"  Resists: {', '.join(resistances[:8])}" if resistances else "")
+        self.show_line(self.immune_label, f"  Immune to: {', '.join(immunities)}" if immunities else "")
+                     
+    def add_move(self):
+        """Add selected move to Pokemon's moveset"""
+        selection = self.move_listbox.curselection()
+        if not selection:
+            return
+            
+        self.add_move_id(self.move_catalog.move_id(self.visible_rows[selection[0]]))
+        
+    def add_move_id(self, move_id: int):
+        """Add a move to the moveset by ID"""
+        if len(self.selected_moves) >= 4:
+            messagebox.showwarning("Warning", "Pokemon can only have 4 moves!")
+            return
+            
+        if move_id and move_id not in [m[0] for m in self.selected_moves]:
+            self.selected_moves.append((move_id, MOVE_NAMES[move_id]))
+            self.update_selected_moves_display()
+            
+    def remove_move(self):
+        """Remove a move from the selected list"""
+        if not self.selected_moves:
+            return
+            
+        # Simple approach: remove the last move
+        self.selected_moves.pop()
+        self.update_selected_moves_display()
+        
+    def clear_moves(self):
+        """Clear all selected moves"""
+        self.selected_moves = []
+        self.update_selected_moves_display()
+        
+    def update_selected_moves_display(self):
+        """Update the display of selected moves"""
+        self.no_moves_label.pack_forget()
+        for move_frame, _, _ in self.move_slots:
+            move_frame.pack_forget()
+        self.move_count_text.pack_forget()
+            
+        if not self.selected_moves:
+            self.no_moves_label.pack(pady=20)
+            return
+            
+        # Display each selected move
+        for i, ((move_id, move_name), (move_frame, name_label, details_label)) in enumerate(
+                zip(self.selected_moves, self.move_slots)):
+            move_frame.pack(fill=tk.X, pady=2)
+            
+            # Move slot and name
+            name_label.config(text=f"{i+1}. {move_name}")
+            
+            # Move details if available
+            if move_id in self.MOVE_DATA:
+                power, type_, acc, pp, is_phys, effect = self.MOVE_DATA[move_id]
+                details_label.config(text=f"({type_}, Pow: {power}, Acc: {acc}%)")
+            else:
+                details_label.config(text="")
+                
+        # Show how many moves selected
+        self.move_count_text.config(text=f"{len(self.selected_moves)}/4 moves selected")
+        self.move_count_text.pack(pady=(10, 0))
+                 
+    def poll_config(self):
+        """Reload tier weights/boundaries when the config file changes"""
+        if self.load_config():
+            self.status_var.set("Reloaded tier_config.json")
+            if self.current_pokemon and self.tier_content.winfo_manager():
+                self.calculate_and_display_tier()
+            if self.party_scores and self.party_scores.rescore():
+                self.status_var.set("Party: " + self.party_scores.summary(" | "))
+        self.root.after(self.CONFIG_POLL_MS, self.poll_config)
+        
+    def calculate_and_display_tier(self):
+        """Calculate and display the tier rating"""
+        if not self.current_pokemon:
+            messagebox.showerror("Error", "Please select a Pokemon first")
+            return
+            
+        # Calculate tier
+        tier, total_score, breakdown, color = self.calculate_tier(self.current_pokemon)
+        
+        # Tier display
+        self.tier_label.config(text=f"Tier: {tier}", foreground=color)
+        self.score_label.config(text=f"Score: {total_score:.1f}/100")
+        
+        if self.tier_mode == "percentile" and self.get_distribution():
+            percentile = self.distribution.percentile(total_score, self.weights)
+            self.percentile_label.config(text=f"Beats or ties {percentile:.0f}% of the dex")
+            self.percentile_label.pack(after=self.score_label)
+        else:
+            self.percentile_label.pack_forget()
+        
+        # Move count indicator
+        self.move_count_label.config(text=f"Based on {len(self.selected_moves)} moves")
+        
+        # Breakdown
+        for category, score in breakdown.items():
+            progress, score_label = self.breakdown_rows[category]
+            progress['value'] = (score / (total_score / 100)) * 100 if total_score > 0 else 0
+            score_label.config(text=f"{score:.1f}")
+            
+        # Analysis text
+        self.analysis_label.config(text=self.generate_analysis(self.current_pokemon, tier, breakdown))
+        self.tier_content.pack(fill=tk.BOTH, expand=True)
+        
+        self.status_var.set(f"Tier calculated: {tier} ({total_score:.1f}/100)")
+
+
 def main():
     root = tk.Tk()
     app = PokemonTierCalculator(root)
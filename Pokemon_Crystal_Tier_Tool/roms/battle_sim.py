@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal 1v1 Battle Simulator
+Seeded Monte Carlo round-robin used to check tier scores against battle outcomes
+"""
+
+import argparse
+import json
+import random
+import re
+from multiprocessing import Pool
+from typing import List, Optional, Tuple
+
+from Crystal import MOVE_NAMES, TierScorer
+from damage_calc import DEFAULT_LEVEL, MIN_RANDOM, DamageCalculator, apply_random
+from rom_tables import NUM_POKEMON, default_movesets, load_rom, read_learnsets
+
+DEFAULT_BATTLES = 16
+MAX_TURNS = 100
+RNG_BLOCK = 4096          # Random bytes drawn per refill
+
+# Move kinds
+DAMAGE, FIXED, LEVEL, OHKO, HEAL, STATUS, NONE = range(7)
+
+STATUS_IMMUNE_TYPES = {'brn': {"Fire"}, 'frz': {"Ice"}, 'psn': {"Poison", "Steel"}}
+SECONDARY_RE = re.compile(r'(\d+)% (burn|freeze|paralyze|poison|flinch)')
+SECONDARY_STATUS = {'burn': 'brn', 'freeze': 'frz', 'paralyze': 'par', 'poison': 'psn', 'flinch': 'flinch'}
+STATUS_MOVES = {'Sleep': 'slp', 'Paralyze': 'par', 'Poison': 'psn', 'Badly poison': 'psn'}
+
+
+class ByteRNG:
+    """Gen 2 style byte RNG that draws its bytes from a seeded generator in blocks"""
+
+    def __init__(self, seed: str):
+        self.rng = random.Random(seed)
+        self.buffer = self.rng.randbytes(RNG_BLOCK)
+        self.pos = 0
+
+    def byte(self) -> int:
+        if self.pos >= RNG_BLOCK:
+            self.buffer = self.rng.randbytes(RNG_BLOCK)
+            self.pos = 0
+        value = self.buffer[self.pos]
+        self.pos += 1
+        return value
+
+
+class SimMove:
+    """A move pre-resolved against one specific opponent"""
+
+    __slots__ = ('move_id', 'kind', 'accuracy', 'priority', 'normal', 'crit', 'crit_threshold',
+                 'physical', 'recoil', 'drain', 'recharge', 'self_ko', 'charge',
+                 'secondary', 'secondary_chance', 'inflicts', 'expected')
+
+
+def build_moves(calc: DamageCalculator, attacker: int, defender: int, moves: List[int]) -> List[SimMove]:
+    """Resolve an attacker's moves against a defender: damage, accuracy and effects"""
+    sim_moves = []
+    for move_id in moves:
+        if move_id not in calc.scorer.MOVE_DATA:
+            continue
+        power, type_, acc, _, _, effect = calc.scorer.MOVE_DATA[move_id]
+
+        move = SimMove()
+        move.move_id = move_id
+        move.accuracy = acc * 255 // 100
+        move.priority = int(effect[-1]) if effect.startswith("Priority") else 0
+        move.normal = move.crit = move.crit_threshold = 0
+        move.physical = False
+        move.recoil = effect == "Recoil"
+        move.drain = effect == "Drain"
+        move.recharge = effect == "Recharge"
+        move.self_ko = effect == "User faints"
+        move.charge = effect.startswith("2-turn")
+        move.secondary, move.secondary_chance, move.inflicts = None, 0, None
+        immune = all(m == 0 for m in calc.type_multipliers[type_][defender])
+
+        info = calc.move_info(move_id)
+        if info:
+            _, _, is_special, crit_chance, hits = info
+            move.kind = DAMAGE
+            move.normal = int(calc.base_damage(attacker, defender, power, type_, is_special) * hits)
+            move.crit = int(calc.base_damage(attacker, defender, power, type_, is_special, crit=True) * hits)
+            move.crit_threshold = int(crit_chance * 256)
+            move.physical = not is_special
+            match = SECONDARY_RE.search(effect)
+            if match:
+                move.secondary = SECONDARY_STATUS[match.group(2)]
+                move.secondary_chance = int(match.group(1)) * 256 // 100
+        elif effect.startswith("Always") and not immune:
+            move.kind = FIXED
+            move.normal = int(effect.split()[1])
+        elif effect == "Level damage" and not immune:
+            move.kind = LEVEL
+            move.normal = calc.level
+        elif effect == "OHKO" and not immune:
+            move.kind = OHKO
+        elif effect == "Heal 50%":
+            move.kind = HEAL
+        elif effect in STATUS_MOVES and not immune:
+            move.kind = STATUS
+            move.inflicts = STATUS_MOVES[effect]
+        else:
+            move.kind = NONE
+
+        move.expected = move.normal * move.accuracy / 255 / (2 if move.charge or move.recharge else 1)
+        sim_moves.append(move)
+    return sim_moves
+
+
+class Side:
+    __slots__ = ('hp', 'max_hp', 'speed', 'types', 'moves', 'best', 'status', 'sleep',
+                 'recharging', 'charging', 'flinched')
+
+    def __init__(self, max_hp: int, speed: int, types: Tuple[str, ...], moves: List[SimMove]):
+        self.hp = self.max_hp = max_hp
+        self.speed = speed
+        self.types = types
+        self.moves = moves
+        self.best = max(moves, key=lambda m: m.expected) if moves else None
+        self.status = None
+        self.sleep = 0
+        self.recharging = self.charging = None
+        self.flinched = False
+
+
+def choose_move(side: Side, opponent: Side) -> Optional[SimMove]:
+    """Simple AI: status an unstatused foe, heal when low, otherwise hit hardest"""
+    if side.charging:
+        return side.charging
+    if opponent.status is None:
+        for move in side.moves:
+            if move.kind == STATUS and not set(opponent.types) & STATUS_IMMUNE_TYPES.get(move.inflicts, set()):
+                return move
+    if side.hp * 3 < side.max_hp:
+        for move in side.moves:
+            if move.kind == HEAL:
+                return move
+    return side.best
+
+
+def inflict(target: Side, status: str, rng: ByteRNG):
+    if target.status is not None or set(target.types) & STATUS_IMMUNE_TYPES.get(status, set()):
+        return
+    target.status = status
+    if status == 'slp':
+        target.sleep = 1 + rng.byte() % 7
+
+
+def use_move(user: Side, target: Side, move: SimMove, rng: ByteRNG):
+    """Run one move, applying damage and effects"""
+    if move.charge and user.charging is None:
+        user.charging = move
+        return
+    user.charging = None
+
+    if move.kind == HEAL:
+        user.hp = min(user.max_hp, user.hp + user.max_hp // 2)
+        return
+    if move.kind == NONE:
+        return
+    if rng.byte() >= move.accuracy:
+        return
+
+    if move.kind == STATUS:
+        inflict(target, move.inflicts, rng)
+        return
+    if move.kind == OHKO:
+        target.hp = 0
+        return
+
+    if move.kind == DAMAGE:
+        damage = move.crit if rng.byte() < move.crit_threshold else move.normal
+        damage = apply_random(damage, MIN_RANDOM + (rng.byte() * 39 >> 8))
+        if move.physical and user.status == 'brn':
+            damage = max(1, damage // 2)
+    else:
+        damage = move.normal
+
+    damage = min(damage, target.hp)
+    target.hp -= damage
+
+    if move.recoil:
+        user.hp -= max(1, damage // 4)
+    if move.drain:
+        user.hp = min(user.max_hp, user.hp + max(1, damage // 2))
+    if move.self_ko:
+        user.hp = 0
+    if move.recharge and target.hp > 0:
+        user.recharging = True
+    if move.secondary and target.hp > 0 and rng.byte() < move.secondary_chance:
+        if move.secondary == 'flinch':
+            target.flinched = True
+        else:
+            inflict(target, move.secondary, rng)
+
+
+def can_act(side: Side, rng: ByteRNG) -> bool:
+    if side.recharging:
+        side.recharging = None
+        return False
+    if side.flinched:
+        side.flinched = False
+        return False
+    if side.status == 'slp':
+        side.sleep -= 1
+        if side.sleep <= 0:
+            side.status = None
+        return False
+    if side.status == 'frz':
+        if rng.byte() < 25:
+            side.status = None
+        return False
+    if side.status == 'par' and rng.byte() < 64:
+        return False
+    return True
+
+
+def battle(a: Side, b: Side, rng: ByteRNG) -> int:
+    """Fight to the finish; returns 1 if a wins, -1 if b wins, 0 on a draw"""
+    for _ in range(MAX_TURNS):
+        move_a, move_b = choose_move(a, b), choose_move(b, a)
+        speed_a = a.speed // 4 if a.status == 'par' else a.speed
+        speed_b = b.speed // 4 if b.status == 'par' else b.speed
+        priority_a = move_a.priority if move_a else 0
+        priority_b = move_b.priority if move_b else 0
+
+        if (priority_a, speed_a) == (priority_b, speed_b):
+            a_first = rng.byte() < 128
+        else:
+            a_first = (priority_a, speed_a) > (priority_b, speed_b)
+        order = [(a, b, move_a), (b, a, move_b)] if a_first else [(b, a, move_b), (a, b, move_a)]
+
+        for user, target, move in order:
+            if user.hp <= 0 or target.hp <= 0:
+                break
+            if move and can_act(user, rng):
+                use_move(user, target, move, rng)
+
+        # End-of-turn residual damage; a flinch only lasts for the turn it was inflicted
+        for side in (a, b):
+            side.flinched = False
+            if side.hp > 0 and side.status in ('brn', 'psn'):
+                side.hp -= max(1, side.max_hp // 8)
+
+        if a.hp <= 0 or b.hp <= 0:
+            if a.hp <= 0 and b.hp <= 0:
+                return 0
+            return 1 if b.hp <= 0 else -1
+
+    return 0
+
+
+# Per-process state, created once by the pool initializer
+_calc = None
+_movesets = None
+
+
+def _init_worker(rom_path: str, level: int):
+    global _calc, _movesets
+    rom_data = load_rom(rom_path)
+    _calc = DamageCalculator(TierScorer(rom_data), level=level)
+    _movesets = default_movesets(read_learnsets(rom_data), level)
+
+
+def simulate_row(task: Tuple[int, int, int]) -> Tuple[int, List[float]]:
+    """Win rates of one species against every species with a higher dex number"""
+    attacker, battles, seed = task
+    row = [0.0] * (NUM_POKEMON + 1)
+    for defender in range(attacker + 1, NUM_POKEMON + 1):
+        moves_a = build_moves(_calc, attacker, defender, _movesets[attacker])
+        moves_b = build_moves(_calc, defender, attacker, _movesets[defender])
+        rng = ByteRNG(f"{seed}:{attacker}:{defender}")
+        points = 0.0
+        for _ in range(battles):
+            a = Side(_calc.hp[attacker], _calc.speed[attacker], _calc.types[attacker], moves_a)
+            b = Side(_calc.hp[defender], _calc.speed[defender], _calc.types[defender], moves_b)
+            points += (battle(a, b, rng) + 1) / 2
+        row[defender] = points / battles
+    return attacker, row
+
+
+def round_robin(rom_path: str, level: int = DEFAULT_LEVEL, battles: int = DEFAULT_BATTLES,
+                seed: int = 0, workers: int = None) -> List[List[float]]:
+    """Full win-rate matrix; matrix[a][b] is a's win rate against b (draws count half)"""
+    matrix = [[0.5] * (NUM_POKEMON + 1) for _ in range(NUM_POKEMON + 1)]
+    tasks = [(attacker, battles, seed) for attacker in range(1, NUM_POKEMON)]
+
+    with Pool(processes=workers, initializer=_init_worker, initargs=(rom_path, level)) as pool:
+        for attacker, row in pool.imap_unordered(simulate_row, tasks):
+            for defender in range(attacker + 1, NUM_POKEMON + 1):
+                matrix[attacker][defender] = row[defender]
+                matrix[defender][attacker] = 1 - row[defender]
+
+    return matrix
+
+
+def pearson(xs: List[float], ys: List[float]) -> float:
+    n = len(xs)
+    mean_x, mean_y = sum(xs) / n, sum(ys) / n
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    var_y = sum((y - mean_y) ** 2 for y in ys)
+    return cov / (var_x * var_y) ** 0.5 if var_x and var_y else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seeded 1v1 round-robin over the whole dex")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("--level", type=int, default=DEFAULT_LEVEL, help="Level for both sides")
+    parser.add_argument("--battles", type=int, default=DEFAULT_BATTLES, help="Battles per pairing")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--out", default="win_rates.json", help="Win-rate matrix output file")
+    args = parser.parse_args()
+
+    print(f"Simulating {NUM_POKEMON}x{NUM_POKEMON} round-robin at Lv.{args.level}, "
+          f"{args.battles} battles per pairing (seed {args.seed})...")
+    matrix = round_robin(args.rom, args.level, args.battles, args.seed, args.workers)
+
+    # Compare average win rate with the tier score of the same moveset
+    rom_data = load_rom(args.rom)
+    scorer = TierScorer(rom_data)
+    movesets = default_movesets(read_learnsets(rom_data), args.level)
+
+    win_rates, tier_scores, rows = [], [], []
+    for dex_num in range(1, NUM_POKEMON + 1):
+        pokemon = scorer.read_pokemon_data(dex_num)
+        tier, score, _, _ = scorer.calculate_tier(pokemon, [(m, MOVE_NAMES[m]) for m in movesets[dex_num]])
+        win_rate = sum(matrix[dex_num][1:]) / NUM_POKEMON
+        win_rates.append(win_rate)
+        tier_scores.append(score)
+        rows.append((win_rate, dex_num, pokemon['name'], tier, score))
+
+    with open(args.out, 'w') as f:
+        json.dump({'level': args.level, 'battles': args.battles, 'seed': args.seed,
+                   'win_rates': [row[1:] for row in matrix[1:]]}, f)
+
+    print(f"\nTop 10 by win rate:")
+    for win_rate, dex_num, name, tier, score in sorted(rows, reverse=True)[:10]:
+        print(f"  #{dex_num:03d} {name:<12} win {win_rate * 100:5.1f}%  tier {tier} ({score:.1f})")
+
+    print(f"\nCorrelation between tier score and win rate: {pearson(tier_scores, win_rates):.3f}")
+    print(f"[+] Win-rate matrix saved to: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Damage Calculator
+Gen 2 damage formula evaluated over every attacker x defender x move in the dex
+"""
+
+import argparse
+import json
+from typing import Dict, List, Optional, Tuple
+
+from Crystal import TierScorer
+from rom_tables import NUM_POKEMON, load_rom, read_learnsets
+from stat_engine import DEFAULT_PRESET, PRESET_NAMES, StatTable
+
+DEFAULT_LEVEL = 50
+
+MIN_RANDOM, MAX_RANDOM = 217, 255    # Damage variation range (x/255)
+MEAN_ROLL = (MIN_RANDOM + MAX_RANDOM) / 2 / 255
+DAMAGE_CAP = 997                     # Cap applied before the +2
+
+# Gen 2 decides physical/special by move type, not per move
+SPECIAL_TYPES = {"Fire", "Water", "Grass", "Electric", "Psychic", "Ice", "Dragon", "Dark"}
+
+# Moves with a raised critical hit ratio
+HIGH_CRIT_MOVES = {2, 75, 152, 163, 177, 238}
+CRIT_CHANCE = {0: 17 / 256, 1: 32 / 256}
+
+# Expected number of hits for multi-hit moves (by MOVE_DATA effect text)
+HIT_COUNTS = {"2 hits": 2, "2 hits, 20% poison": 2, "2-5 hits": 3, "2-3 hits": 2.5}
+# (fewest, most) multiples of one hit's damage a multi-hit move can deal. Min
+# rolls and guaranteed KOs use the fewest; Triple Kick hits 1-3 times at 1x,
+# 2x and 3x power, so it deals at most 6x
+HIT_RANGES = {"2 hits": (2, 2), "2 hits, 20% poison": (2, 2), "2-5 hits": (2, 5), "2-3 hits": (1, 6)}
+
+TYPE_NAMES = list(TierScorer.TYPES.values())
+
+
+def apply_random(damage: int, roll: int) -> int:
+    """Apply a damage variation roll (217-255)"""
+    if damage <= 1:
+        return damage
+    return max(1, damage * roll // 255)
+
+
+class DamageCalculator:
+    """Gen 2 damage for every species at a fixed level and DV/stat exp preset"""
+
+    def __init__(self, scorer: TierScorer, level: int = DEFAULT_LEVEL, preset: str = DEFAULT_PRESET):
+        self.scorer = scorer
+        self.level = level
+        self.level_factor = (2 * level) // 5 + 2
+
+        # Per-species stat and type tables, indexed by dex number (index 0 unused)
+        stats = StatTable.for_rom(scorer.rom_data, scorer)
+        self.hp = stats.column('hp', level, preset)
+        self.attack = stats.column('attack', level, preset)
+        self.defense = stats.column('defense', level, preset)
+        self.sp_attack = stats.column('sp_attack', level, preset)
+        self.sp_defense = stats.column('sp_defense', level, preset)
+        self.speed = stats.column('speed', level, preset)
+        self.types = [()] * (NUM_POKEMON + 1)
+
+        for dex_num in range(1, NUM_POKEMON + 1):
+            pokemon = scorer.read_pokemon_data(dex_num)
+            type1 = scorer.TYPES.get(pokemon['type1'], "Normal")
+            type2 = scorer.TYPES.get(pokemon['type2'], "Normal")
+            self.types[dex_num] = (type1,) if type1 == type2 else (type1, type2)
+
+        # Type multiplier lookup: attack type -> defender types -> list of per-type multipliers
+        self.type_multipliers = {}
+        for attack_type in TYPE_NAMES:
+            chart = scorer.TYPE_EFFECTIVENESS.get(attack_type, {})
+            self.type_multipliers[attack_type] = [
+                tuple(chart.get(t, 1.0) for t in self.types[d]) for d in range(NUM_POKEMON + 1)
+            ]
+
+    def move_info(self, move_id: int) -> Optional[Tuple[int, str, bool, float, float]]:
+        """(power, type, is_special, crit chance, hits) for a damaging move, None for fixed/status moves"""
+        if move_id not in self.scorer.MOVE_DATA:
+            return None
+        power, type_, _, _, _, effect = self.scorer.MOVE_DATA[move_id]
+        if power <= 0:
+            return None
+        crit = CRIT_CHANCE[1 if move_id in HIGH_CRIT_MOVES else 0]
+        return power, type_, type_ in SPECIAL_TYPES, crit, HIT_COUNTS.get(effect, 1)
+
+    def base_damage(self, attacker: int, defender: int, power: int, type_: str,
+                    is_special: bool, crit: bool = False) -> int:
+        """Damage before the random roll: formula, crit, cap, STAB and type effectiveness"""
+        if is_special:
+            attack, defense = self.sp_attack[attacker], self.sp_defense[defender]
+        else:
+            attack, defense = self.attack[attacker], self.defense[defender]
+
+        # Stats above 255 are quartered to fit the 8-bit divide
+        if attack > 255 or defense > 255:
+            attack, defense = max(1, attack // 4), max(1, defense // 4)
+
+        damage = self.level_factor * power * attack // defense // 50
+        if crit:
+            damage *= 2
+        damage = min(damage, DAMAGE_CAP) + 2
+
+        if type_ in self.types[attacker]:
+            damage += damage // 2
+
+        for multiplier in self.type_multipliers[type_][defender]:
+            damage = int(damage * multiplier)
+
+        return damage
+
+    def expected_damage(self, attacker: int, defender: int, info: Tuple[int, str, bool, float, float]) -> float:
+        """Expected damage of one use of a move (as returned by move_info), including crits and the mean roll"""
+        power, type_, is_special, crit_chance, hits = info
+        normal = self.base_damage(attacker, defender, power, type_, is_special)
+        if normal == 0:
+            return 0.0
+        crit = self.base_damage(attacker, defender, power, type_, is_special, crit=True)
+        return ((1 - crit_chance) * normal + crit_chance * crit) * MEAN_ROLL * hits
+
+    def damage_range(self, attacker: int, defender: int, move_id: int,
+                     crit: bool = False) -> Tuple[int, int]:
+        """(min, max) damage of one use over the random roll and, for multi-hit moves, the hit count"""
+        info = self.move_info(move_id)
+        if info is None:
+            return 0, 0
+        power, type_, is_special, _, _ = info
+        fewest, most = HIT_RANGES.get(self.scorer.MOVE_DATA[move_id][5], (1, 1))
+        damage = self.base_damage(attacker, defender, power, type_, is_special, crit)
+        return apply_random(damage, MIN_RANDOM) * fewest, damage * most
+
+    def damage_grid(self, movesets: Dict[int, List[int]]) -> Dict[int, List[Tuple[int, int, float]]]:
+        """Best move of each attacker against every defender
+
+        Returns {attacker: [(move_id, min_damage, expected_damage) per defender]},
+        with index 0 of each list unused. Expected damage includes the crit chance
+        and the mean random roll; min damage is the low roll with the fewest hits.
+        """
+        grid = {}
+
+        for attacker, moves in movesets.items():
+            infos = [(m, self.move_info(m)) for m in moves]
+            infos = [(m, info, HIT_RANGES.get(self.scorer.MOVE_DATA[m][5], (1, 1))[0])
+                     for m, info in infos if info]
+            row = [(0, 0, 0.0)] * (NUM_POKEMON + 1)
+
+            for defender in range(1, NUM_POKEMON + 1):
+                best = (0, 0, 0.0)
+                for move_id, (power, type_, is_special, crit_chance, hits), fewest in infos:
+                    normal = self.base_damage(attacker, defender, power, type_, is_special)
+                    if normal == 0:
+                        continue
+                    crit = self.base_damage(attacker, defender, power, type_, is_special, crit=True)
+                    min_damage = apply_random(normal, MIN_RANDOM) * fewest
+                    expected = ((1 - crit_chance) * normal + crit_chance * crit) * MEAN_ROLL * hits
+                    if (min_damage, expected) > best[1:]:
+                        best = (move_id, min_damage, expected)
+                row[defender] = best
+
+            grid[attacker] = row
+
+        return grid
+
+    def ko_metrics(self, movesets: Dict[int, List[int]]) -> Dict[int, Dict]:
+        """Share of the dex each attacker guaranteed OHKOs / 2HKOs without crits"""
+        grid = self.damage_grid(movesets)
+        metrics = {}
+        for attacker, row in grid.items():
+            ohko = sum(1 for d in range(1, NUM_POKEMON + 1) if row[d][1] >= self.hp[d])
+            two_hko = sum(1 for d in range(1, NUM_POKEMON + 1) if row[d][1] * 2 >= self.hp[d])
+            metrics[attacker] = {
+                'ohko_pct': round(100 * ohko / NUM_POKEMON, 1),
+                '2hko_pct': round(100 * two_hko / NUM_POKEMON, 1),
+            }
+        return metrics
+
+
+def learnset_movesets(learnsets: Dict[int, List[Tuple[int, int]]], level: int) -> Dict[int, List[int]]:
+    """Every level-up move each species knows by the given level"""
+    return {dex_num: sorted({move_id for move_level, move_id in learnset if move_level <= level})
+            for dex_num, learnset in learnsets.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gen 2 damage grid over the whole dex")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("--level", type=int, default=DEFAULT_LEVEL, help="Level for both sides")
+    parser.add_argument("--preset", choices=PRESET_NAMES, default=DEFAULT_PRESET, help="DV/stat exp preset")
+    parser.add_argument("--top", type=int, default=20, help="Attackers to list")
+    parser.add_argument("--json", help="Write per-species KO metrics to this file")
+    args = parser.parse_args()
+
+    rom_data = load_rom(args.rom)
+    scorer = TierScorer(rom_data)
+    calc = DamageCalculator(scorer, level=args.level, preset=args.preset)
+    movesets = learnset_movesets(read_learnsets(rom_data), args.level)
+
+    metrics = calc.ko_metrics(movesets)
+    ranked = sorted(metrics.items(), key=lambda kv: (kv[1]['ohko_pct'], kv[1]['2hko_pct']), reverse=True)
+
+    print(f"Level {args.level} KO metrics (level-up moves only, no crits)\n")
+    print(f"{'Pokemon':<18} {'OHKO %':>7} {'2HKO %':>7}")
+    for dex_num, m in ranked[:args.top]:
+        name = scorer.POKEMON_NAMES.get(dex_num, f"#{dex_num}")
+        print(f"#{dex_num:03d} {name:<13} {m['ohko_pct']:>7.1f} {m['2hko_pct']:>7.1f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({str(k): v for k, v in metrics.items()}, f, indent=2)
+        print(f"\n[+] Metrics saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal TM/HM Compatibility
+Decodes the TM/HM/tutor bitfield of every base-stat record into a packed species x machine matrix
+"""
+
+import argparse
+from typing import List, Optional, Tuple
+
+from Crystal import MOVE_NAMES, TierScorer
+from rom_tables import NUM_POKEMON, load_rom
+from species_index import species_arg
+
+NUM_TMS = 50
+NUM_HMS = 7
+NUM_TUTORS = 3    # Crystal's Goldenrod tutor moves share the bitfield after the HMs
+NUM_MACHINES = NUM_TMS + NUM_HMS + NUM_TUTORS
+
+# HM01-HM07 (Cut, Fly, Surf, Strength, Flash, Whirlpool, Waterfall), used to find TMHMMoves
+HM_MOVES = bytes([15, 19, 57, 70, 148, 250, 127])
+
+TYPE_NAMES = list(TierScorer.TYPES.values())
+TYPE_BITS = {name: 1 << i for i, name in enumerate(TYPE_NAMES)}
+
+
+def popcount(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+def machine_label(index: int) -> str:
+    """TM01..TM50, HM01..HM07, then Tutor1..Tutor3"""
+    if index < NUM_TMS:
+        return f"TM{index + 1:02d}"
+    if index < NUM_TMS + NUM_HMS:
+        return f"HM{index - NUM_TMS + 1:02d}"
+    return f"Tutor{index - NUM_TMS - NUM_HMS + 1}"
+
+
+def find_tmhm_moves(rom_data: bytes) -> Optional[int]:
+    """Locate the TMHMMoves table: 50 TM moves, the 7 HM moves, 3 tutor moves and a 0 terminator
+
+    TMs may be randomized, so the search anchors on the HM moves and then
+    checks that the rest of the table holds valid move IDs.
+    """
+    pos = rom_data.find(HM_MOVES)
+    while pos != -1:
+        start = pos - NUM_TMS
+        end = start + NUM_MACHINES
+        if start >= 0 and end < len(rom_data) and rom_data[end] == 0 and \
+                all(1 <= move_id <= 251 for move_id in rom_data[start:end]):
+            return start
+        pos = rom_data.find(HM_MOVES, pos + 1)
+    return None
+
+
+def read_machine_moves(rom_data: bytes) -> List[int]:
+    """Move ID taught by each machine, in bitfield order"""
+    table = find_tmhm_moves(rom_data)
+    if table is None:
+        raise ValueError("TMHMMoves table not found in ROM")
+    return list(rom_data[table:table + NUM_MACHINES])
+
+
+class MachineMatrix:
+    """Species x machine compatibility stored both ways as packed ints
+
+    rows[dex_num] has bit i set when the species can learn machine i, and
+    columns[i] has bit dex_num set for the same pair, so "who learns X" and
+    "what does Y learn" are single lookups and set queries are bitwise ops.
+    """
+
+    def __init__(self, rows: List[int], machine_moves: List[int]):
+        self.rows = rows
+        self.machine_moves = machine_moves
+        self.machine_of_move = {move_id: i for i, move_id in enumerate(machine_moves)}
+
+        self.columns = [0] * NUM_MACHINES
+        for dex_num in range(1, NUM_POKEMON + 1):
+            bits = rows[dex_num]
+            while bits:
+                low = bits & -bits
+                self.columns[low.bit_length() - 1] |= 1 << dex_num
+                bits ^= low
+
+        # Attacking type of each damaging machine, for coverage queries
+        self.machine_type_bits = [0] * NUM_MACHINES
+        for i, move_id in enumerate(machine_moves):
+            power, type_, _, _, _, _ = TierScorer.MOVE_DATA.get(move_id, (0, "Normal", 0, 0, False, ""))
+            if power > 0:
+                self.machine_type_bits[i] = TYPE_BITS.get(type_, 0)
+
+    @classmethod
+    def for_rom(cls, rom_data: bytes, scorer: TierScorer = None) -> 'MachineMatrix':
+        scorer = scorer or TierScorer(rom_data)
+        rows = [0] * (NUM_POKEMON + 1)
+        for dex_num in range(1, NUM_POKEMON + 1):
+            rows[dex_num] = scorer.read_pokemon_data(dex_num)['tmhm'] & ((1 << NUM_MACHINES) - 1)
+        return cls(rows, read_machine_moves(rom_data))
+
+    def can_learn(self, dex_num: int, move_id: int) -> bool:
+        machine = self.machine_of_move.get(move_id)
+        return machine is not None and bool(self.rows[dex_num] >> machine & 1)
+
+    def learners(self, move_id: int) -> List[int]:
+        """Species that can be taught a move by machine"""
+        machine = self.machine_of_move.get(move_id)
+        if machine is None:
+            return []
+        column = self.columns[machine]
+        return [dex_num for dex_num in range(1, NUM_POKEMON + 1) if column >> dex_num & 1]
+
+    def learnable_moves(self, dex_num: int) -> List[int]:
+        """Move IDs a species can be taught by machine"""
+        row = self.rows[dex_num]
+        return [move_id for i, move_id in enumerate(self.machine_moves) if row >> i & 1]
+
+    def coverage_types(self, dex_nums: List[int]) -> int:
+        """Type bitset of every damaging machine move any of the species can learn"""
+        row = 0
+        for dex_num in dex_nums:
+            row |= self.rows[dex_num]
+        coverage = 0
+        for i, type_bits in enumerate(self.machine_type_bits):
+            if row >> i & 1:
+                coverage |= type_bits
+        return coverage
+
+    def shared(self, dex_num: int, min_shared: int) -> List[Tuple[int, int]]:
+        """(species, shared machine count) for species sharing at least min_shared machines, most first"""
+        row = self.rows[dex_num]
+        matches = []
+        for other in range(1, NUM_POKEMON + 1):
+            if other != dex_num:
+                count = popcount(row & self.rows[other])
+                if count >= min_shared:
+                    matches.append((other, count))
+        return sorted(matches, key=lambda m: m[1], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query TM/HM compatibility decoded from the ROM")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("--move", help="List species that can learn this move by machine")
+    parser.add_argument("--species", type=species_arg, help="List machine moves and coverage for this species")
+    parser.add_argument("--shared", type=int, default=0, help="With --species, list species sharing this many machines")
+    args = parser.parse_args()
+
+    rom_data = load_rom(args.rom)
+    scorer = TierScorer(rom_data)
+    matrix = MachineMatrix.for_rom(rom_data, scorer)
+    move_ids = {name.lower(): move_id for move_id, name in MOVE_NAMES.items()}
+
+    print("=" * 60)
+    print("TM/HM Moves")
+    print("=" * 60)
+    for i, move_id in enumerate(matrix.machine_moves):
+        print(f"  {machine_label(i):<7} {MOVE_NAMES.get(move_id, f'Move {move_id}'):<14} "
+              f"{popcount(matrix.columns[i]):3d} learners")
+
+    if args.move:
+        move_id = move_ids.get(args.move.lower())
+        if move_id is None:
+            print(f"\nUnknown move: {args.move}")
+        else:
+            names = [scorer.POKEMON_NAMES.get(d, f"#{d}") for d in matrix.learners(move_id)]
+            print(f"\n{MOVE_NAMES[move_id]} ({len(names)}): {', '.join(names) or 'none'}")
+
+    if args.species:
+        name = scorer.POKEMON_NAMES.get(args.species, f"#{args.species}")
+        moves = [MOVE_NAMES.get(m, f"Move {m}") for m in matrix.learnable_moves(args.species)]
+        coverage = matrix.coverage_types([args.species])
+        print(f"\n{name} learns {len(moves)} machine moves: {', '.join(moves)}")
+        print(f"Coverage types: {', '.join(t for t in TYPE_NAMES if coverage & TYPE_BITS[t])}")
+        if args.shared:
+            for other, count in matrix.shared(args.species, args.shared):
+                print(f"  #{other:03d} {scorer.POKEMON_NAMES.get(other, '?'):<12} {count} shared")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Move Catalog
+Move rows for the GUI list with a row lookup by ID plus a search index
+"""
+
+from typing import Dict, List, Tuple
+
+from search_index import SearchIndex, normalize
+
+FUZZY_MATCHES = 5   # Rows offered when no move contains the search
+
+
+class MoveCatalog:
+    """Every known move as a (move_id, name, display text) row, in move ID order"""
+
+    def __init__(self, move_names: Dict[int, str], move_data: Dict[int, Tuple]):
+        self.rows: List[Tuple[int, str, str]] = []
+        for move_id, move_name in sorted(move_names.items()):
+            if move_id in move_data:
+                power, type_, acc, pp, is_phys, effect = move_data[move_id]
+                display_text = f"{move_name} ({type_}, Pow: {power})"
+            else:
+                display_text = f"{move_name} (???)"
+            self.rows.append((move_id, move_name, display_text))
+
+        self.row_of_id = {move_id: row for row, (move_id, _, _) in enumerate(self.rows)}
+        self.index = SearchIndex((row, display) for row, (_, _, display) in enumerate(self.rows))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def display(self, row: int) -> str:
+        return self.rows[row][2]
+
+    def move_id(self, row: int) -> int:
+        return self.rows[row][0]
+
+    def filter(self, query: str) -> List[int]:
+        """Rows whose name or type/power text contains the query, in list order"""
+        return self.index.substring(query)
+
+    def refine(self, rows: List[int], query: str) -> List[int]:
+        """filter() restricted to rows already known to match a substring of the query"""
+        query = normalize(query)
+        return [row for row in rows if query in self.index.texts[row]]
+
+    def closest(self, query: str, limit: int = FUZZY_MATCHES) -> List[int]:
+        """Best fuzzy matches for a query nothing contains (a typo), in list order"""
+        return sorted(row for row, _ in self.index.fuzzy(query, limit))
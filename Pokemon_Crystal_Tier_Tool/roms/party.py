@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Party Snapshots
+Party snapshots keyed by slot, with per-slot change detection and scoring
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from dvs import hidden_power
+from party_snapshot import MAGIC, SNAPSHOT_FILE, decode_snapshot
+from rom_tables import NUM_POKEMON, load_rom
+
+PARTY_FILE = "party_data.json"
+PARTY_SIZE = 6
+
+
+def valid_entry(poke) -> bool:
+    """A party entry with an int slot, an in-range species and well-formed moves and DVs"""
+    return (isinstance(poke, dict) and isinstance(poke.get('slot'), int)
+            and isinstance(poke.get('species'), int) and 1 <= poke['species'] <= NUM_POKEMON
+            and isinstance(poke.get('moves', []), list)
+            and isinstance(poke.get('dvs', 0), int) and 0 <= poke.get('dvs', 0) <= 0xFFFF)
+
+
+def party_slots(snapshot: Dict) -> Dict[int, Dict]:
+    """{slot: pokemon} for the valid entries of a party_data.json-style snapshot"""
+    entries = snapshot.get('pokemon', [])
+    if not isinstance(entries, list):
+        return {}
+    return {poke['slot']: poke for poke in entries if valid_entry(poke)}
+
+
+def slot_key(poke: Dict) -> Tuple:
+    """The fields a slot's score depends on"""
+    return poke['species'], poke.get('level'), tuple(poke.get('moves', ())), poke.get('dvs')
+
+
+def changed_slots(old: Dict[int, Dict], new: Dict[int, Dict]) -> List[int]:
+    """Slots that were added, removed or changed in a way that affects scoring"""
+    return sorted(slot for slot in old.keys() | new.keys()
+                  if slot not in old or slot not in new or slot_key(old[slot]) != slot_key(new[slot]))
+
+
+def find_party_file() -> Optional[Path]:
+    """The exported party in the working directory: JSON first, then a binary snapshot"""
+    for name in (PARTY_FILE, SNAPSHOT_FILE):
+        if Path(name).exists():
+            return Path(name)
+    return None
+
+
+def parse_party(data: bytes) -> Dict:
+    """Decode a party_data.json export or a binary party snapshot; ValueError if it's neither"""
+    if data.startswith(MAGIC):
+        return decode_snapshot(data)
+    party = json.loads(data)
+    if not isinstance(party, dict):
+        raise ValueError("party data is not a JSON object")
+    return party
+
+
+def load_party_file(path=PARTY_FILE) -> Dict:
+    return parse_party(Path(path).read_bytes())
+
+
+class PartyScores:
+    """Tier results of the current party, rescored slot by slot as snapshots arrive"""
+
+    def __init__(self, scorer):
+        self.scorer = scorer
+        self.slots: Dict[int, Dict] = {}
+        self.results: Dict[int, Tuple[str, float, Dict, str]] = {}
+
+    def score(self, poke: Dict) -> Tuple[str, float, Dict, str]:
+        """calculate_tier for a party Pokemon with its current moves (and Hidden Power, given DVs)"""
+        from Crystal import MOVE_NAMES
+        moves = [(m, MOVE_NAMES[m]) for m in poke.get('moves', []) if m in MOVE_NAMES]
+        pokemon = self.scorer.read_pokemon_data(poke['species'])
+        if 'dvs' in poke:
+            pokemon['hidden_power'] = hidden_power(poke['dvs'])
+        return self.scorer.calculate_tier(pokemon, moves)
+
+    def update(self, snapshot: Dict) -> List[int]:
+        """Take a new snapshot, rescoring only the slots that changed; returns those slots"""
+        slots = party_slots(snapshot)
+        changed = changed_slots(self.slots, slots)
+        for slot in changed:
+            if slot in slots:
+                self.results[slot] = self.score(slots[slot])
+            else:
+                self.results.pop(slot, None)
+        self.slots = slots
+        return changed
+
+    def rescore(self) -> List[int]:
+        """Rescore every slot (after a ROM or config change)"""
+        for slot, poke in self.slots.items():
+            self.results[slot] = self.score(poke)
+        return sorted(self.slots)
+
+    def summary(self, separator: str = "\n") -> str:
+        """One entry per slot: name, level, tier and score"""
+        lines = []
+        for slot in sorted(self.slots):
+            poke = self.slots[slot]
+            tier, total, _, _ = self.results[slot]
+            name = self.scorer.POKEMON_NAMES.get(poke['species'], f"#{poke['species']}")
+            lines.append(f"Slot {slot}: {name} Lv.{poke.get('level', '?')} - {tier} ({total:.1f})")
+        return separator.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a party snapshot")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("party", nargs="?", default=PARTY_FILE, help="party_data.json or binary party snapshot")
+    args = parser.parse_args()
+
+    from Crystal import TierScorer
+    party = PartyScores(TierScorer(load_rom(args.rom)))
+    party.update(load_party_file(args.party))
+    print(party.summary())
+
+
+if __name__ == "__main__":
+    main()
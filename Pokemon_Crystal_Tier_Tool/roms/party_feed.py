@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Live Party Feed
+Receives party snapshots pushed from the emulator over a local TCP socket
+"""
+
+import argparse
+import json
+import queue
+import socketserver
+import threading
+from typing import IO, Iterator, Optional
+
+from party_snapshot import HEADER, MAGIC, PARTYMON, decode_snapshot
+
+FEED_HOST = "127.0.0.1"
+FEED_PORT = 52790      # Matches party_feed.lua / BizHawk's --socket_port
+
+
+def parse_message(message: bytes) -> dict:
+    """Decode a JSON or binary snapshot message"""
+    if message.startswith(MAGIC):
+        return decode_snapshot(message)
+    snapshot = json.loads(message)
+    if not isinstance(snapshot, dict):
+        raise ValueError("snapshot is not a JSON object")
+    return snapshot
+
+
+def read_messages(stream: IO[bytes]) -> Iterator[bytes]:
+    """Split a byte stream into messages
+
+    Accepts newline-delimited messages, BizHawk's comm.socketServerSend
+    framing ("<length> <message>" with no terminator) and binary snapshots,
+    which carry their own length in the header. JSON snapshots are objects,
+    so a leading digit can only be a length prefix; a prefix that isn't all
+    digits is dropped up to the end of its line.
+    """
+    while True:
+        first = stream.read(1)
+        if not first:
+            return
+        if first.isdigit():
+            digits = first
+            while True:
+                char = stream.read(1)
+                if not char:
+                    return
+                if not char.isdigit():
+                    break
+                digits += char
+            if char != b" ":
+                if char not in b"\r\n":
+                    stream.readline()   # Garbled length prefix: skip to the next line and resync
+                continue
+            message = stream.read(int(digits))
+        elif first == MAGIC[:1]:
+            header = first + stream.read(HEADER.size - 1)
+            if len(header) < HEADER.size:
+                return
+            count = header[5]
+            message = header + stream.read(count * PARTYMON.size)
+        elif first in b"\r\n":
+            continue
+        else:
+            message = first + stream.readline()
+        if message.strip():
+            yield message
+
+
+class SnapshotHandler(socketserver.StreamRequestHandler):
+    """Decode each message of a connection and queue the snapshots"""
+
+    def handle(self):
+        for message in read_messages(self.rfile):
+            try:
+                self.server.snapshots.put(parse_message(message))
+            except ValueError:
+                continue
+
+
+class FeedServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class PartyFeed:
+    """Background listener putting each decoded snapshot on a queue
+
+    The socket server runs on its own thread; consumers (the Tk loop) drain
+    the queue with latest() so a burst of snapshots costs one rescore.
+    """
+
+    def __init__(self, host: str = FEED_HOST, port: int = FEED_PORT):
+        self.snapshots: "queue.Queue[dict]" = queue.Queue()
+        self.server = FeedServer((host, port), SnapshotHandler)
+        self.server.snapshots = self.snapshots
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def address(self):
+        return self.server.server_address
+
+    def start(self) -> 'PartyFeed':
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def latest(self) -> Optional[dict]:
+        """Most recent queued snapshot, discarding older ones (None if nothing arrived)"""
+        snapshot = None
+        while True:
+            try:
+                snapshot = self.snapshots.get_nowait()
+            except queue.Empty:
+                return snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Listen for live party snapshots and print tier changes")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("--host", default=FEED_HOST)
+    parser.add_argument("--port", type=int, default=FEED_PORT)
+    parser.add_argument("--record", help="Append every snapshot to this JSON Lines file (for party_replay.py)")
+    args = parser.parse_args()
+
+    from Crystal import TierScorer
+    from party import PartyScores
+    from rom_tables import load_rom
+
+    party = PartyScores(TierScorer(load_rom(args.rom)))
+    feed = PartyFeed(args.host, args.port).start()
+    print(f"Listening on {args.host}:{feed.address[1]} (Ctrl+C to stop)")
+    try:
+        while True:
+            snapshot = feed.snapshots.get()
+            if args.record:
+                with open(args.record, 'a') as f:
+                    f.write(json.dumps(snapshot) + "\n")
+            changed = party.update(snapshot)
+            if changed:
+                print("=" * 60)
+                print(f"Rescored slots {', '.join(map(str, changed))}")
+                print(party.summary())
+    except KeyboardInterrupt:
+        feed.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Party History
+Append-only, delta-encoded record of party snapshots with time-range queries over memory-mapped files
+"""
+
+import argparse
+import csv
+import mmap
+import struct
+import time
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from party import PARTY_SIZE, PartyScores
+from party_snapshot import PARTYMON, decode_structs, pack_pokemon
+
+HISTORY_FILE = "party_history"   # party_history.dat (records) + party_history.idx (index)
+KEYFRAME_INTERVAL = 64           # A full snapshot at least this often bounds random-access cost
+RUN_GAP = 4                      # Unchanged bytes a delta run may absorb (a new run costs 3)
+POLL_SECONDS = 0.1
+
+BUFFER_SIZE = PARTY_SIZE * PARTYMON.size
+
+KEYFRAME = 0
+DELTA = 1
+KIND_MASK = 0x03
+NO_DVS_SHIFT = 2   # Record kind bits 2-7: party slots 1-6 whose entry had no DVs (a JSON export)
+
+# Index entry: wall-clock time, emulator frame, record offset in the .dat file, kind
+INDEX = struct.Struct(">dIQB3x")
+# Record header: kind (plus the no-DVs slot mask), party count, payload length
+RECORD = struct.Struct(">BBH")
+# Delta run: offset into the party buffer, length, then the new bytes
+RUN = struct.Struct(">HB")
+
+
+def snapshot_buffer(snapshot: Dict) -> Tuple[int, bytes, int]:
+    """(party count, six struct slots zero-padded, mask of slots without DVs) for a binary or JSON snapshot
+
+    A missing DV word is packed as 0, so the mask is what keeps a JSON entry
+    without DVs from decoding as one with Hidden Power Fighting 31.
+    """
+    pokemon = snapshot.get('pokemon', [])[:PARTY_SIZE]
+    structs = b"".join(pack_pokemon(poke) for poke in pokemon)
+    no_dvs = sum(1 << i for i, poke in enumerate(pokemon) if 'dvs' not in poke)
+    return len(structs) // PARTYMON.size, structs.ljust(BUFFER_SIZE, b"\0"), no_dvs
+
+
+def encode_delta(old: bytes, new: bytes) -> bytes:
+    """Runs of changed bytes; slots whose struct is unchanged are skipped whole"""
+    runs = []
+    for slot_start in range(0, BUFFER_SIZE, PARTYMON.size):
+        slot_end = slot_start + PARTYMON.size
+        if old[slot_start:slot_end] == new[slot_start:slot_end]:
+            continue
+        i = slot_start
+        while i < slot_end:
+            if old[i] == new[i]:
+                i += 1
+                continue
+            start = end = i
+            while i < slot_end and i - start < 255:
+                if old[i] != new[i]:
+                    end = i + 1
+                elif i - end >= RUN_GAP:
+                    break
+                i += 1
+            runs.append(RUN.pack(start, end - start) + new[start:end])
+            i = end
+    return b"".join(runs)
+
+
+def apply_delta(old: bytes, delta: bytes) -> bytes:
+    buffer = bytearray(old)
+    pos = 0
+    while pos < len(delta):
+        start, length = RUN.unpack_from(delta, pos)
+        pos += RUN.size
+        buffer[start:start + length] = delta[pos:pos + length]
+        pos += length
+    return bytes(buffer)
+
+
+class HistoryReader:
+    """Memory-mapped view of a party history
+
+    Only the index entries a query touches and the records from the nearest
+    keyframe onwards are read, so a multi-hour history is never loaded whole.
+    A trailing partial index entry (a recorder mid-write) is ignored.
+    """
+
+    def __init__(self, path=HISTORY_FILE):
+        self.path = Path(path)
+        self.files = [open(self.path.with_suffix(suffix), 'rb') for suffix in (".idx", ".dat")]
+        self.index, self.data = (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                                 if Path(f.name).stat().st_size else b"" for f in self.files)
+        self.count = len(self.index) // INDEX.size
+
+    def __len__(self) -> int:
+        return self.count
+
+    def entry(self, i: int) -> Tuple[float, int, int, int]:
+        """(time, frame, record offset, kind) of index entry i"""
+        return INDEX.unpack_from(self.index, i * INDEX.size)
+
+    def time(self, i: int) -> float:
+        return self.entry(i)[0]
+
+    def frame(self, i: int) -> int:
+        return self.entry(i)[1]
+
+    def record(self, offset: int) -> Tuple[int, int, bytes, int]:
+        """(kind, count, payload, no-DVs slot mask) of the record at a .dat offset"""
+        kind, count, length = RECORD.unpack_from(self.data, offset)
+        start = offset + RECORD.size
+        return kind & KIND_MASK, count, self.data[start:start + length], kind >> NO_DVS_SHIFT
+
+    def keyframe_before(self, i: int) -> int:
+        while i > 0 and self.entry(i)[3] != KEYFRAME:
+            i -= 1
+        return i
+
+    def buffers(self, start: int, stop: int) -> Iterator[Tuple[int, int, bytes, int]]:
+        """(entry, party count, party buffer, no-DVs mask) for entries start..stop-1, decoding from the last keyframe"""
+        buffer = bytes(BUFFER_SIZE)
+        for i in range(self.keyframe_before(start), min(stop, self.count)):
+            kind, count, payload, no_dvs = self.record(self.entry(i)[2])
+            buffer = payload.ljust(BUFFER_SIZE, b"\0") if kind == KEYFRAME else apply_delta(buffer, payload)
+            if i >= start:
+                yield i, count, buffer, no_dvs
+
+    def snapshots(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict]:
+        """Decoded snapshots in the party_data.json shape, plus their time and frame"""
+        for i, count, buffer, no_dvs in self.buffers(start, self.count if stop is None else stop):
+            when, frame, _, _ = self.entry(i)
+            pokemon = decode_structs(buffer[:count * PARTYMON.size])
+            for slot, poke in enumerate(pokemon):
+                if no_dvs >> slot & 1:
+                    del poke['dvs']
+            yield {'time': when, 'frame': frame, 'count': count, 'pokemon': pokemon}
+
+    def span(self, start_time: float = float('-inf'), end_time: float = float('inf')) -> Tuple[int, int]:
+        """Entry range [start, stop) recorded within a time range (bisected on the index)"""
+        return (bisect_left(range(self.count), start_time, key=self.time),
+                bisect_right(range(self.count), end_time, key=self.time))
+
+    def sessions(self) -> List[Tuple[int, int]]:
+        """Entry ranges [start, stop) of each emulator session: frames restart when a session does"""
+        starts = [0] + [i for i in range(1, self.count) if self.frame(i) < self.frame(i - 1)]
+        return list(zip(starts, starts[1:] + [self.count]))
+
+    def frame_span(self, first: int, last: int, session: int = -1) -> Tuple[int, int]:
+        """Entry range for a frame range within one session (the latest by default)
+
+        Frames only increase within a session, so the bisect stays inside it.
+        """
+        if first > last:
+            raise ValueError(f"frame range {first}-{last} is reversed")
+        low, high = self.sessions()[session]
+        return (bisect_left(range(low, high), first, key=self.frame) + low,
+                bisect_right(range(low, high), last, key=self.frame) + low)
+
+    def close(self):
+        for view in (self.index, self.data):
+            if isinstance(view, mmap.mmap):
+                view.close()
+        for f in self.files:
+            f.close()
+
+
+class PartyHistory:
+    """Appends snapshots: a keyframe every KEYFRAME_INTERVAL entries, deltas in between
+
+    The record is written and flushed before its index entry, so readers
+    never see an index entry pointing at a partial record.
+    """
+
+    def __init__(self, path=HISTORY_FILE):
+        self.path = Path(path)
+        self.last: Optional[Tuple[int, bytes, int]] = None
+        self.since_keyframe = KEYFRAME_INTERVAL
+        entries = 0
+        if self.path.with_suffix(".idx").exists():
+            reader = HistoryReader(self.path)
+            entries = len(reader)
+            if entries:
+                _, count, buffer, no_dvs = next(reader.buffers(entries - 1, entries))
+                self.last = (count, buffer, no_dvs)
+                self.since_keyframe = entries - reader.keyframe_before(entries - 1)
+            reader.close()
+        self.data = open(self.path.with_suffix(".dat"), 'ab')
+        self.index = open(self.path.with_suffix(".idx"), 'ab')
+        self.index.truncate(entries * INDEX.size)   # Drop an entry cut short by a crash
+
+    def append(self, snapshot: Dict, timestamp: Optional[float] = None) -> bool:
+        """Record a snapshot unless it matches the previous one; returns whether it was recorded"""
+        count, buffer, no_dvs = snapshot_buffer(snapshot)
+        if (count, buffer, no_dvs) == self.last:
+            return False
+
+        if self.last is None or self.since_keyframe >= KEYFRAME_INTERVAL:
+            kind, payload = KEYFRAME, buffer[:count * PARTYMON.size]
+            self.since_keyframe = 0
+        else:
+            kind, payload = DELTA, encode_delta(self.last[1], buffer)
+        self.since_keyframe += 1
+
+        offset = self.data.tell()
+        self.data.write(RECORD.pack(kind | no_dvs << NO_DVS_SHIFT, count, len(payload)) + payload)
+        self.data.flush()
+        self.index.write(INDEX.pack(time.time() if timestamp is None else timestamp,
+                                    snapshot.get('frame', 0) & 0xFFFFFFFF, offset, kind))
+        self.index.flush()
+        self.last = (count, buffer, no_dvs)
+        return True
+
+    def close(self):
+        self.data.close()
+        self.index.close()
+
+
+def tier_series(scorer, reader: HistoryReader, start: int = 0, stop: Optional[int] = None) -> List[Dict]:
+    """Per-entry party tiers; only the slots that changed between entries are rescored"""
+    party = PartyScores(scorer)
+    series = []
+    for snapshot in reader.snapshots(start, stop):
+        party.update(snapshot)
+        slots = {slot: party.results[slot][:2] for slot in party.slots}
+        scores = [score for _, score in slots.values()]
+        series.append({'time': snapshot['time'], 'frame': snapshot['frame'], 'slots': slots,
+                       'mean': sum(scores) / len(scores) if scores else 0.0})
+    return series
+
+
+def write_svg(series: List[Dict], path, width: int = 800, height: int = 300):
+    """Party mean score and best slot over time as a plain SVG line chart"""
+    t0, t1 = series[0]['time'], max(series[-1]['time'], series[0]['time'] + 1)
+
+    def points(values):
+        return " ".join(f"{(t - t0) / (t1 - t0) * width:.1f},{height - v / 100 * height:.1f}"
+                        for t, v in values)
+
+    mean = points((s['time'], s['mean']) for s in series)
+    best = points((s['time'], max((score for _, score in s['slots'].values()), default=0)) for s in series)
+    Path(path).write_text(
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}">\n'
+        f'<rect width="100%" height="100%" fill="white"/>\n'
+        f'<polyline points="{best}" fill="none" stroke="#FF8C00" stroke-width="1.5"/>\n'
+        f'<polyline points="{mean}" fill="none" stroke="#4169E1" stroke-width="2"/>\n'
+        f'<text x="5" y="15" font-size="12">Party tier score over {(t1 - t0) / 3600:.2f} h '
+        f'(blue: mean, orange: best slot)</text>\n</svg>\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record party snapshots and query how the party's tiers evolved")
+    parser.add_argument("--history", default=HISTORY_FILE, help="History file base name")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("record", help="Append every new party export (binary snapshot or JSON)")
+    commands.add_parser("info", help="Entry count, size and time span")
+    tiers = commands.add_parser("tiers", help="Tier scores over a time range")
+    tiers.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    tiers.add_argument("--start", type=float, default=0, help="Seconds after the first entry")
+    tiers.add_argument("--end", type=float, default=float('inf'), help="Seconds after the first entry")
+    tiers.add_argument("--frames", type=int, nargs=2, metavar=("FIRST", "LAST"), help="Select by frame instead")
+    tiers.add_argument("--session", type=int, default=-1,
+                       help="With --frames, the emulator session (0 = first, -1 = latest)")
+    tiers.add_argument("--csv", help="Write time, frame, mean and per-slot scores")
+    tiers.add_argument("--svg", help="Write a score-over-time chart")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        from party_watch import PartyWatcher
+        history = PartyHistory(args.history)
+        watcher = PartyWatcher()
+        print(f"Recording party changes to {args.history}.dat ({watcher.method}, Ctrl+C to stop)")
+        try:
+            while True:
+                snapshot = watcher.poll()
+                if snapshot is not None and history.append(snapshot):
+                    print(f"{time.strftime('%H:%M:%S')} frame {snapshot.get('frame', 0)}: "
+                          f"{snapshot.get('count', len(snapshot.get('pokemon', [])))} Pokemon")
+                time.sleep(POLL_SECONDS)
+        except KeyboardInterrupt:
+            watcher.close()
+            history.close()
+        return
+
+    reader = HistoryReader(args.history)
+    if not len(reader):
+        print(f"{args.history} has no entries")
+        return
+    first = reader.time(0)
+
+    if args.command == "info":
+        keyframes = sum(1 for i in range(len(reader)) if reader.entry(i)[3] == KEYFRAME)
+        stored = len(reader.data) + len(reader.index)
+        print("=" * 60)
+        print(f"{len(reader)} snapshots ({keyframes} keyframes, {len(reader.sessions())} sessions) over "
+              f"{(reader.time(len(reader) - 1) - first) / 3600:.2f} h")
+        print(f"{stored} bytes stored, {len(reader) * BUFFER_SIZE} as full snapshots "
+              f"({stored / (len(reader) * BUFFER_SIZE):.1%})")
+        print("=" * 60)
+        reader.close()
+        return
+
+    from Crystal import TierScorer
+    from rom_tables import load_rom
+    if args.frames:
+        sessions = len(reader.sessions())
+        if not -sessions <= args.session < sessions:
+            parser.error(f"--session must be within the history's {sessions} session(s)")
+        if args.frames[0] > args.frames[1]:
+            parser.error("--frames FIRST must not be after LAST")
+        start, stop = reader.frame_span(*args.frames, args.session)
+    else:
+        start, stop = reader.span(first + args.start, first + args.end)
+    series = tier_series(TierScorer(load_rom(args.rom)), reader, start, stop)
+
+    print("=" * 60)
+    print(f"{len(series)} snapshots")
+    print("=" * 60)
+    for entry in series:
+        slots = "  ".join(f"{tier} {score:4.1f}" for tier, score in entry['slots'].values())
+        print(f"  {(entry['time'] - first) / 60:7.1f} min  frame {entry['frame']:>8}  "
+              f"mean {entry['mean']:5.1f}  {slots}")
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["time", "frame", "mean"] + [f"slot{slot}" for slot in range(1, PARTY_SIZE + 1)])
+            for entry in series:
+                writer.writerow([f"{entry['time']:.3f}", entry['frame'], f"{entry['mean']:.2f}"] +
+                                [f"{entry['slots'][slot][1]:.2f}" if slot in entry['slots'] else ""
+                                 for slot in range(1, PARTY_SIZE + 1)])
+        print(f"\nSeries written to {args.csv}")
+    if args.svg and series:
+        write_svg(series, args.svg)
+        print(f"Chart written to {args.svg}")
+    reader.close()
+
+
+if __name__ == "__main__":
+    main()
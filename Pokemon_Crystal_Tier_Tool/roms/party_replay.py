@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Party Replay
+Stand-in for the emulator: replays recorded party snapshots to the live party feed
+"""
+
+import argparse
+import json
+import socket
+import time
+from typing import Dict, List
+
+from party_feed import FEED_HOST, FEED_PORT
+from party_snapshot import encode_snapshot, pack_pokemon
+
+
+def load_snapshots(path: str) -> List[Dict]:
+    """Snapshots from a JSON Lines recording (party_feed.py --record) or a single party_data.json"""
+    with open(path, 'r') as f:
+        text = f.read()
+    try:
+        return [json.loads(text)]
+    except ValueError:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def encode(snapshot: Dict, bizhawk: bool = False, binary: bool = False) -> bytes:
+    """One wire message: a JSON line, BizHawk's "<length> <message>" framing or a binary snapshot"""
+    if binary:
+        return encode_snapshot(b"".join(pack_pokemon(poke) for poke in snapshot.get('pokemon', [])),
+                               snapshot.get('frame', 0))
+    message = json.dumps(snapshot, separators=(",", ":")).encode()
+    return str(len(message)).encode() + b" " + message if bizhawk else message + b"\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded party snapshots to the live party feed")
+    parser.add_argument("snapshots", help="JSON Lines recording or party_data.json")
+    parser.add_argument("--host", default=FEED_HOST)
+    parser.add_argument("--port", type=int, default=FEED_PORT)
+    parser.add_argument("--interval", type=float, default=0.5, help="Seconds between snapshots")
+    parser.add_argument("--loop", action="store_true", help="Repeat the recording until interrupted")
+    parser.add_argument("--bizhawk", action="store_true", help="Use BizHawk's length-prefixed framing")
+    parser.add_argument("--binary", action="store_true", help="Send binary party snapshots")
+    args = parser.parse_args()
+
+    snapshots = load_snapshots(args.snapshots)
+    with socket.create_connection((args.host, args.port)) as sock:
+        while True:
+            for i, snapshot in enumerate(snapshots, start=1):
+                sock.sendall(encode(snapshot, args.bizhawk, args.binary))
+                print(f"Sent snapshot {i}/{len(snapshots)} ({len(snapshot.get('pokemon', []))} Pokemon)")
+                time.sleep(args.interval)
+            if not args.loop:
+                break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Party Snapshots (binary)
+Versioned binary party snapshots carrying the game's raw 48-byte party structs
+"""
+
+import argparse
+import struct
+import timeit
+from typing import Dict, List
+
+MAGIC = b"CPTY"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILE = "party_snapshot.bin"
+
+# magic, version, party count, checksum (16-bit sum of the payload), emulator frame
+HEADER = struct.Struct(">4sBBHI")
+
+# wPartyMon struct, big-endian like the game:
+# species, item, 4 moves, OT ID, exp (24-bit), 5 stat exp, DVs, 4 PP,
+# happiness, pokerus, caught data, level, status, (unused), HP, 6 stats
+PARTYMON = struct.Struct(">BB4BH3s5HH4BBBHBBxH6H")
+
+STATS = ("hp", "attack", "defense", "speed", "sp_attack", "sp_defense")
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def checksum(payload: bytes) -> int:
+    return sum(payload) & 0xFFFF
+
+
+def encode_snapshot(structs: bytes, frame: int = 0) -> bytes:
+    """Header plus the raw party structs (count = len(structs) // 48)"""
+    count, remainder = divmod(len(structs), PARTYMON.size)
+    if remainder or count > 6:
+        raise SnapshotError(f"party structs must be up to 6 x {PARTYMON.size} bytes, got {len(structs)}")
+    return HEADER.pack(MAGIC, SNAPSHOT_VERSION, count, checksum(structs), frame) + structs
+
+
+def pack_pokemon(poke: Dict) -> bytes:
+    """A party struct from a party_data.json entry (fields it lacks are zero)"""
+    moves = (list(poke.get('moves', [])) + [0] * 4)[:4]
+    stats = poke.get('stats', {})
+    return PARTYMON.pack(
+        poke['species'], poke.get('item', 0), *moves, poke.get('ot_id', 0),
+        poke.get('experience', 0).to_bytes(3, 'big'), *([0] * 5), poke.get('dvs', 0),
+        *([0] * 4), 0, 0, 0, poke.get('level', 1), 0,
+        poke.get('current_hp', stats.get('hp', 0)), *(stats.get(s, 0) for s in STATS))
+
+
+def decode_snapshot(data: bytes) -> Dict:
+    """Parse a snapshot into the party_data.json shape (plus item, DVs, exp and stats)"""
+    if len(data) < HEADER.size:
+        raise SnapshotError("snapshot shorter than its header")
+    magic, version, count, expected, frame = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("not a party snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"unsupported snapshot version {version}")
+    payload = data[HEADER.size:HEADER.size + count * PARTYMON.size]
+    if len(payload) != count * PARTYMON.size:
+        raise SnapshotError("truncated snapshot")
+    if checksum(payload) != expected:
+        raise SnapshotError("snapshot checksum mismatch")
+    return {'count': count, 'frame': frame, 'pokemon': decode_structs(payload)}
+
+
+def decode_structs(payload: bytes) -> List[Dict]:
+    """party_data.json-style entries for consecutive raw party structs"""
+    pokemon = []
+    for slot, fields in enumerate(PARTYMON.iter_unpack(payload), start=1):
+        pokemon.append({
+            'slot': slot, 'species': fields[0], 'item': fields[1],
+            'moves': [m for m in fields[2:6] if m], 'ot_id': fields[6],
+            'experience': int.from_bytes(fields[7], 'big'), 'dvs': fields[13],
+            'level': fields[21], 'current_hp': fields[23],
+            'stats': dict(zip(STATS, fields[24:30])),
+        })
+    return pokemon
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decode a binary party snapshot")
+    parser.add_argument("snapshot", nargs="?", default=SNAPSHOT_FILE, help="Snapshot file")
+    parser.add_argument("--bench", action="store_true", help="Time decoding")
+    args = parser.parse_args()
+
+    with open(args.snapshot, 'rb') as f:
+        data = f.read()
+    snapshot = decode_snapshot(data)
+
+    print(f"Frame {snapshot['frame']}, {snapshot['count']} Pokemon")
+    for poke in snapshot['pokemon']:
+        stats = ", ".join(f"{name}={value}" for name, value in poke['stats'].items())
+        print(f"  Slot {poke['slot']}: #{poke['species']:03d} Lv.{poke['level']} "
+              f"moves {poke['moves']} DVs {poke['dvs']:04X} ({stats})")
+
+    if args.bench:
+        runs = 10000
+        seconds = timeit.timeit(lambda: decode_snapshot(data), number=runs)
+        print(f"Decode: {seconds / runs * 1e6:.1f} us per snapshot")
+
+
+if __name__ == "__main__":
+    main()
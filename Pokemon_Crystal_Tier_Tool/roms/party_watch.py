@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Party File Watch
+Reloads the exported party when party_data.json or party_snapshot.bin changes
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+
+from party import PARTY_FILE, parse_party
+from party_snapshot import SNAPSHOT_FILE
+
+COALESCE_SECONDS = 0.2   # A file must be quiet this long before it is read
+POLL_SECONDS = 0.1       # Check interval of the CLI (the GUI uses its own timer)
+
+# inotify event masks (linux/inotify.h)
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+INOTIFY_EVENT = struct.Struct("iIII")   # wd, mask, cookie, name length
+
+
+class Inotify:
+    """Non-blocking inotify watches on directories (Linux only)"""
+
+    def __init__(self, directories: Iterable[Path]):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.directories: Dict[int, Path] = {}
+        for directory in directories:
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory),
+                                             IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE)
+            if wd < 0:
+                self.close()
+                raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+            self.directories[wd] = directory
+
+    def changed(self) -> Set[Path]:
+        """Paths touched since the last call (never blocks)"""
+        paths = set()
+        while True:
+            try:
+                data = os.read(self.fd, 4096)
+            except BlockingIOError:
+                return paths
+            pos = 0
+            while pos < len(data):
+                wd, _, _, length = INOTIFY_EVENT.unpack_from(data, pos)
+                pos += INOTIFY_EVENT.size
+                name = data[pos:pos + length].rstrip(b"\0")
+                pos += length
+                if wd in self.directories and name:
+                    paths.add(self.directories[wd] / os.fsdecode(name))
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PartyWatcher:
+    """Watches the party export files and hands back each new party once
+
+    Changes are detected with inotify where available and an mtime/size
+    poll otherwise. A burst of writes is coalesced until the file has been
+    quiet for COALESCE_SECONDS, and content whose hash was already seen is
+    skipped, so the emulator rewriting the same party costs no rescoring.
+    """
+
+    def __init__(self, paths: Iterable = (PARTY_FILE, SNAPSHOT_FILE),
+                 quiet: float = COALESCE_SECONDS, use_inotify: bool = True):
+        self.paths = [Path(path).resolve() for path in paths]
+        self.quiet = quiet
+        self.stamps = {path: self.stamp(path) for path in self.paths}
+        self.hashes: Dict[Path, bytes] = {}
+        # Existing files count as changed so the first poll loads them
+        self.dirty: Dict[Path, float] = {path: 0.0 for path in self.paths if self.stamps[path]}
+
+        self.inotify = None
+        if use_inotify:
+            try:
+                self.inotify = Inotify({path.parent for path in self.paths})
+            except (OSError, AttributeError):
+                self.inotify = None
+
+    @property
+    def method(self) -> str:
+        return "inotify" if self.inotify else "polling"
+
+    @staticmethod
+    def stamp(path: Path):
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def changed_paths(self) -> Set[Path]:
+        if self.inotify:
+            return self.inotify.changed() & set(self.paths)
+        changed = set()
+        for path in self.paths:
+            stamp = self.stamp(path)
+            if stamp != self.stamps[path]:
+                self.stamps[path] = stamp
+                changed.add(path)
+        return changed
+
+    def poll(self) -> Optional[Dict]:
+        """The newest party whose file settled with new content, else None (never blocks)"""
+        now = time.monotonic()
+        for path in self.changed_paths():
+            self.dirty[path] = now
+
+        snapshot = None
+        for path, changed_at in list(self.dirty.items()):
+            if now - changed_at < self.quiet:
+                continue
+            del self.dirty[path]
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            digest = hashlib.sha1(data).digest()
+            if digest == self.hashes.get(path):
+                continue
+            try:
+                snapshot = parse_party(data)
+            except ValueError:
+                continue   # Half-written or not a party object; the next write marks it dirty again
+            self.hashes[path] = digest
+        return snapshot
+
+    def close(self):
+        if self.inotify:
+            self.inotify.close()
+            self.inotify = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rescore the party whenever its export file changes")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("--poll", action="store_true", help="Use mtime/size polling instead of inotify")
+    args = parser.parse_args()
+
+    from Crystal import TierScorer
+    from party import PartyScores
+    from rom_tables import load_rom
+
+    party = PartyScores(TierScorer(load_rom(args.rom)))
+    watcher = PartyWatcher(use_inotify=not args.poll)
+    print(f"Watching {PARTY_FILE} and {SNAPSHOT_FILE} ({watcher.method}, Ctrl+C to stop)")
+    try:
+        while True:
+            snapshot = watcher.poll()
+            if snapshot is not None:
+                changed = party.update(snapshot)
+                if changed:
+                    print("=" * 60)
+                    print(f"Rescored slots {', '.join(map(str, changed))}")
+                    print(party.summary())
+            time.sleep(POLL_SECONDS)
+    except KeyboardInterrupt:
+        watcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Tier Ranking
+Keeps raw component scores for every species/moveset so weight or boundary
+changes re-rank the whole dex without rescoring
+"""
+
+import argparse
+import random
+import time
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Tuple
+
+from Crystal import MOVE_NAMES, TierScorer
+from rom_tables import NUM_POKEMON, load_rom, read_learnsets
+from tier_sweep import candidate_moves, generate_movesets
+
+COMPONENTS = list(TierScorer.DEFAULT_WEIGHTS)
+DEFAULT_SETS_PER_SPECIES = 50
+
+
+class ScoreMatrix:
+    """Rows are (species, moveset); columns are the raw tier components
+
+    Columns are stored as separate arrays so a re-rank is one pass of
+    weighted column sums (a matrix-vector product).
+    """
+
+    def __init__(self):
+        self.rows: List[Tuple[int, Tuple[int, ...]]] = []
+        self.columns = {name: array('d') for name in COMPONENTS}
+
+    def add(self, dex_num: int, moveset: Tuple[int, ...], components: Dict[str, float]):
+        self.rows.append((dex_num, moveset))
+        for name in COMPONENTS:
+            self.columns[name].append(components[name])
+
+    def totals(self, weights: Dict[str, float]) -> List[float]:
+        """Weighted total of every row"""
+        columns = [self.columns[name] for name in COMPONENTS]
+        w = [weights[name] for name in COMPONENTS]
+        return [sum(map(float.__mul__, row, w)) for row in zip(*columns)]
+
+    def rank(self, weights: Dict[str, float], boundaries: List[Tuple[str, float, str]]) -> Dict[int, Tuple[float, str, Tuple[int, ...]]]:
+        """Best (total, tier, moveset) per species under the given weights and boundaries"""
+        ascending = sorted(boundaries, key=lambda b: b[1])
+        minimums = [b[1] for b in ascending]
+
+        best = {}
+        for (dex_num, moveset), total in zip(self.rows, self.totals(weights)):
+            if dex_num not in best or total > best[dex_num][0]:
+                best[dex_num] = (total, moveset)
+
+        ranked = {}
+        for dex_num, (total, moveset) in best.items():
+            index = max(0, bisect_right(minimums, total) - 1)
+            ranked[dex_num] = (total, ascending[index][0], moveset)
+        return ranked
+
+
+def build_matrix(scorer: TierScorer, learnsets: Dict[int, List[Tuple[int, int]]],
+                 sets_per_species: int = DEFAULT_SETS_PER_SPECIES, seed: int = 0) -> ScoreMatrix:
+    """Score the components of up to sets_per_species movesets for every species"""
+    matrix = ScoreMatrix()
+    for dex_num in range(1, NUM_POKEMON + 1):
+        pokemon = scorer.read_pokemon_data(dex_num)
+        rng = random.Random(f"{seed}:{dex_num}")
+        movesets, _ = generate_movesets(candidate_moves(learnsets[dex_num]), sets_per_species, rng)
+        for moveset in movesets:
+            components = scorer.calculate_components(pokemon, [(m, MOVE_NAMES[m]) for m in moveset])
+            matrix.add(dex_num, moveset, components)
+    return matrix
+
+
+def print_ranking(scorer: TierScorer, ranked: Dict[int, Tuple[float, str, Tuple[int, ...]]], top: int):
+    counts = {}
+    for _, tier, _ in ranked.values():
+        counts[tier] = counts.get(tier, 0) + 1
+    print("Tier counts: " + ", ".join(f"{tier}={counts.get(tier, 0)}" for tier, _, _ in scorer.tier_boundaries))
+
+    order = sorted(ranked.items(), key=lambda kv: kv[1][0], reverse=True)
+    for dex_num, (total, tier, moveset) in order[:top]:
+        moves = ", ".join(MOVE_NAMES[m] for m in moveset)
+        print(f"  {tier}  {total:5.1f}  #{dex_num:03d} {scorer.POKEMON_NAMES.get(dex_num, '?'):<12} [{moves}]")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank every species and re-rank when tier_config.json changes")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("--config", default=None, help="Tier config file (default: tier_config.json)")
+    parser.add_argument("--sets", type=int, default=DEFAULT_SETS_PER_SPECIES, help="Movesets per species")
+    parser.add_argument("--top", type=int, default=20, help="Species to list")
+    parser.add_argument("--watch", action="store_true", help="Keep running and re-rank on config changes")
+    args = parser.parse_args()
+
+    rom_data = load_rom(args.rom)
+    scorer = TierScorer(rom_data)
+    if args.config:
+        scorer.load_config(args.config)
+
+    start = time.perf_counter()
+    matrix = build_matrix(scorer, read_learnsets(rom_data), args.sets)
+    print(f"Scored {len(matrix.rows)} species/moveset rows in {time.perf_counter() - start:.2f}s\n")
+
+    ranked = matrix.rank(scorer.weights, scorer.current_boundaries())
+    print_ranking(scorer, ranked, args.top)
+
+    while args.watch:
+        time.sleep(1)
+        if not scorer.load_config(args.config):
+            continue
+
+        start = time.perf_counter()
+        new_ranked = matrix.rank(scorer.weights, scorer.current_boundaries())
+        changed = sum(1 for dex_num in ranked if ranked[dex_num][1] != new_ranked[dex_num][1])
+        print(f"\nConfig changed: re-ranked in {(time.perf_counter() - start) * 1000:.1f} ms, "
+              f"{changed} species changed tier")
+        ranked = new_ranked
+        print_ranking(scorer, ranked, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal ROM Address Resolver
+Resolves party and player WRAM addresses from the ROM's code references and writes a Lua address profile
+"""
+
+import argparse
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from rom_tables import load_rom, rom_hash
+
+PROFILE_FILE = "address_profile.lua"
+PROFILE_DIR = Path(__file__).resolve().parent.parent   # Next to memory_reader.lua
+SEARCH_WINDOW = 0x80    # How far a relocated variable may sit from its vanilla address
+GLOBAL_CHECKSUM = 0x14E
+
+PARTYMON_SIZE = 48
+NAME_LENGTH = 11
+
+# Vanilla Crystal (English) addresses of the variables that are searched for
+VANILLA = {
+    'party_count': 0xDCD7,
+    'player_id': 0xD47B,
+    'badges_johto': 0xD857,
+    'pokedex_caught': 0xDE99,
+}
+
+# Variables at a fixed distance from a resolved one: (base, offset)
+DERIVED = {
+    'party_species': ('party_count', 1),
+    'party_data_start': ('party_count', 8),                 # Species list of 6 plus terminator
+    'party_ot_names': ('party_count', 8 + 6 * PARTYMON_SIZE),
+    'party_nicknames': ('party_count', 8 + 6 * PARTYMON_SIZE + 6 * NAME_LENGTH),
+    'player_name': ('player_id', 2),
+    'money': ('badges_johto', -9),                          # wMoney, wMomsMoney, wMomSavingMoney, wCoins
+    'badges_kanto': ('badges_johto', 1),
+    'pokedex_seen': ('pokedex_caught', 0x20),
+}
+
+# memory_reader.lua's keys first, in its order
+PROFILE_KEYS = ('party_count', 'party_species', 'party_data_start', 'player_id', 'player_name',
+                'pokedex_caught', 'pokedex_seen', 'badges_johto', 'badges_kanto', 'money',
+                'party_ot_names', 'party_nicknames')
+
+
+def same_word(match) -> bool:
+    """Both operands address consecutive bytes (a 16-bit variable copied byte by byte)"""
+    return int.from_bytes(match.group(2), 'little') == int.from_bytes(match.group(1), 'little') + 1
+
+
+# Instruction sequences that reference a variable, with the address operand
+# captured: (variable, pattern, offset from the captured address, extra check)
+SIGNATURES: List[Tuple[str, bytes, int, Optional[Callable]]] = [
+    # ld a, [wPartyCount] / cp PARTY_LENGTH
+    ('party_count', rb"\xFA(..)\xFE\x06", 0, None),
+    # ld hl, wPartyMonOTs or wPartyMonNicknames / ld bc, NAME_LENGTH
+    ('party_count', rb"\x21(..)\x01\x0B\x00", -DERIVED['party_ot_names'][1], None),
+    ('party_count', rb"\x21(..)\x01\x0B\x00", -DERIVED['party_nicknames'][1], None),
+    # ld a, [wPlayerID] / ld [hli], a / ld a, [wPlayerID + 1] / ld [hl], a
+    ('player_id', rb"\xFA(..)\x22\xFA(..)\x77", 0, same_word),
+    # ld hl, wPlayerName / ld bc, NAME_LENGTH
+    ('player_id', rb"\x21(..)\x01\x0B\x00", -2, None),
+    # ld hl, wBadges / ld b, 2 / call CountSetBits
+    ('badges_johto', rb"\x21(..)\x06\x02\xCD", 0, None),
+    # ld hl, wPokedexCaught or wPokedexSeen / ld b, 32 / call CountSetBits
+    ('pokedex_caught', rb"\x21(..)\x06\x20\xCD", 0, None),
+    ('pokedex_caught', rb"\x21(..)\x06\x20\xCD", -0x20, None),
+]
+
+
+def count_references(rom_data: bytes) -> Dict[str, Counter]:
+    """Votes per candidate address for each searched variable
+
+    A candidate only counts within SEARCH_WINDOW of the vanilla address, which
+    keeps HRAM and unrelated WRAM buffers that share a code idiom out.
+    """
+    votes = {name: Counter() for name in VANILLA}
+    for name, pattern, offset, check in SIGNATURES:
+        vanilla = VANILLA[name]
+        for match in re.finditer(pattern, rom_data, re.DOTALL):
+            if check and not check(match):
+                continue
+            address = int.from_bytes(match.group(1), 'little') + offset
+            if abs(address - vanilla) <= SEARCH_WINDOW:
+                votes[name][address] += 1
+    return votes
+
+
+def resolve_addresses(rom_data: bytes) -> Tuple[Dict[str, int], Dict[str, Tuple[int, int]]]:
+    """(addresses, {searched variable: (votes for the winner, votes for the runner-up)})
+
+    A variable with no votes keeps its vanilla address (reported as 0 votes).
+    """
+    addresses, confidence = {}, {}
+    for name, counter in count_references(rom_data).items():
+        ranked = counter.most_common(2) + [(VANILLA[name], 0)] * 2
+        addresses[name] = ranked[0][0]
+        confidence[name] = (ranked[0][1], ranked[1][1] if len(counter) > 1 else 0)
+    for name, (base, offset) in DERIVED.items():
+        addresses[name] = addresses[base] + offset
+    return addresses, confidence
+
+
+def lua_profile(addresses: Dict[str, int], comments: List[str], rom_checksum: Optional[int] = None) -> str:
+    """A Lua module returning the address table, in the shape build.py embeds"""
+    lines = [f"-- {comment}" for comment in comments] + ["", "local address_profile = {"]
+    for key in [k for k in PROFILE_KEYS if k in addresses] + [k for k in addresses if k not in PROFILE_KEYS]:
+        lines.append(f"    {key} = 0x{addresses[key]:04X},")
+    if rom_checksum is not None:
+        lines.append(f"    rom_checksum = 0x{rom_checksum:04X},   -- Header global checksum of the ROM")
+    lines += ["}", "", "return address_profile", ""]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolve WRAM addresses from ROM code references")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("--out", default=str(PROFILE_DIR / PROFILE_FILE), help="Lua address profile to write")
+    parser.add_argument("--dry-run", action="store_true", help="Only print the resolved addresses")
+    args = parser.parse_args()
+
+    rom_data = load_rom(args.rom)
+    addresses, confidence = resolve_addresses(rom_data)
+
+    print("=" * 60)
+    print(f"Addresses for {Path(args.rom).name}")
+    print("=" * 60)
+    for key in PROFILE_KEYS:
+        note = ""
+        if key in confidence:
+            votes, runner_up = confidence[key]
+            note = f"{votes} references" + (f" (next best {runner_up})" if runner_up else "")
+            if not votes:
+                note = "no references found, vanilla kept"
+        else:
+            base, offset = DERIVED[key]
+            note = f"{base} {offset:+d}"
+        shift = addresses[key] - (VANILLA[key] if key in VANILLA else VANILLA[DERIVED[key][0]] + DERIVED[key][1])
+        print(f"  {key:<18} 0x{addresses[key]:04X}  {shift:+5d} from vanilla  {note}")
+
+    unresolved = [name for name, (votes, _) in confidence.items() if not votes]
+    if args.dry_run:
+        return
+    comments = [f"Addresses for {Path(args.rom).name} (SHA-1 {rom_hash(rom_data)[:12]})",
+                "Generated by roms/rom_addresses.py from the ROM's code references"]
+    if unresolved:
+        comments.append(f"Unresolved, vanilla kept: {', '.join(unresolved)}")
+    checksum = int.from_bytes(rom_data[GLOBAL_CHECKSUM:GLOBAL_CHECKSUM + 2], 'big')
+    Path(args.out).write_text(lua_profile(addresses, comments, checksum))
+    print(f"\nAddress profile written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal ROM Table Decoders
+Locates and decodes data tables that randomizer patches may relocate
+"""
+
+import hashlib
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+NUM_POKEMON = 251
+BANK_SIZE = 0x4000
+
+# Decoded tables are cached per ROM under this directory
+CACHE_DIR = Path(__file__).with_name(".tier_cache")
+
+# Evolution entry sizes (type byte + parameters) from the Crystal disassembly
+EVOLVE_PARAM_BYTES = {
+    0x01: 2,  # EVOLVE_LEVEL: level, species
+    0x02: 2,  # EVOLVE_ITEM: item, species
+    0x03: 2,  # EVOLVE_TRADE: item, species
+    0x04: 2,  # EVOLVE_HAPPINESS: time of day, species
+    0x05: 3,  # EVOLVE_STAT: level, ATK_*_DEF, species
+}
+
+
+def load_rom(rom_path) -> bytes:
+    """Read a ROM file into memory"""
+    return Path(rom_path).read_bytes()
+
+
+def rom_hash(rom_data: bytes) -> str:
+    """Stable identifier for a ROM image"""
+    return hashlib.sha1(rom_data).hexdigest()
+
+
+def cache_path(rom_data: bytes, name: str) -> Path:
+    """Path of a cached table for this ROM (the directory is created on demand)"""
+    directory = CACHE_DIR / rom_hash(rom_data)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / name
+
+
+def parse_evos_attacks(rom_data: bytes, offset: int) -> Optional[Tuple[List[Tuple], List[Tuple[int, int]]]]:
+    """Parse one EvosAttacks entry, returning (evolutions, learnset) or None if malformed"""
+    evolutions = []
+    pos = offset
+
+    # Evolutions: type byte followed by parameters, terminated by 0
+    while pos < len(rom_data) and rom_data[pos] != 0:
+        evo_type = rom_data[pos]
+        param_bytes = EVOLVE_PARAM_BYTES.get(evo_type)
+        if param_bytes is None:
+            return None
+        evolutions.append((evo_type,) + tuple(rom_data[pos + 1:pos + 1 + param_bytes]))
+        pos += 1 + param_bytes
+    pos += 1
+
+    # Learnset: (level, move) pairs, terminated by 0
+    # Levels are not strictly ascending (vanilla Muk learns Minimize at 23 after Sludge at 45)
+    learnset = []
+    while pos + 1 < len(rom_data) and rom_data[pos] != 0:
+        level, move_id = rom_data[pos], rom_data[pos + 1]
+        if level > 100 or not 1 <= move_id <= 251:
+            return None
+        learnset.append((level, move_id))
+        pos += 2
+
+    if pos >= len(rom_data) or not learnset:
+        return None
+
+    return evolutions, learnset
+
+
+def find_evos_attacks_pointers(rom_data: bytes) -> Optional[int]:
+    """Find the EvosAttacksPointers table (vanilla: 0x425B1)
+
+    The table is 251 little-endian pointers into its own bank, and the first
+    entry points directly past the table. Every entry must parse cleanly.
+    """
+    table_size = NUM_POKEMON * 2
+
+    for offset in range(0, len(rom_data) - table_size):
+        first = rom_data[offset] | (rom_data[offset + 1] << 8)
+        if first != (offset % BANK_SIZE) + BANK_SIZE + table_size:
+            continue
+
+        pointers = struct.unpack_from(f'<{NUM_POKEMON}H', rom_data, offset)
+        if not all(BANK_SIZE <= p < 2 * BANK_SIZE for p in pointers):
+            continue
+
+        bank_start = (offset // BANK_SIZE) * BANK_SIZE
+        if all(parse_evos_attacks(rom_data, bank_start + p - BANK_SIZE) for p in pointers):
+            return offset
+
+    return None
+
+
+def read_learnsets(rom_data: bytes) -> Dict[int, List[Tuple[int, int]]]:
+    """Decode the level-up learnset of every species as {dex_num: [(level, move_id), ...]}"""
+    table = find_evos_attacks_pointers(rom_data)
+    if table is None:
+        raise ValueError("EvosAttacks pointer table not found in ROM")
+
+    bank_start = (table // BANK_SIZE) * BANK_SIZE
+    pointers = struct.unpack_from(f'<{NUM_POKEMON}H', rom_data, table)
+
+    learnsets = {}
+    for dex_num, pointer in enumerate(pointers, start=1):
+        _, learnset = parse_evos_attacks(rom_data, bank_start + pointer - BANK_SIZE)
+        learnsets[dex_num] = learnset
+
+    return learnsets
+
+
+def default_movesets(learnsets: Dict[int, List[Tuple[int, int]]], level: int) -> Dict[int, List[int]]:
+    """The four most recent level-up moves at the given level, as wild Pokemon get them"""
+    movesets = {}
+    for dex_num, learnset in learnsets.items():
+        moves = []
+        for move_level, move_id in learnset:
+            if move_level <= level and move_id not in moves:
+                moves.append(move_id)
+        movesets[dex_num] = moves[-4:]
+    return movesets
+
+
+def main():
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python rom_tables.py <path_to_rom>")
+        return
+
+    rom_data = load_rom(sys.argv[1])
+    table = find_evos_attacks_pointers(rom_data)
+    if table is None:
+        print("EvosAttacks pointer table not found")
+        return
+
+    print(f"EvosAttacksPointers at 0x{table:06X}")
+    learnsets = read_learnsets(rom_data)
+    print(f"Decoded learnsets for {len(learnsets)} Pokemon")
+    print(f"  #001: {learnsets[1]}")
+
+
+if __name__ == "__main__":
+    main()
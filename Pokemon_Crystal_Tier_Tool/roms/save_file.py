@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Save File
+Decodes the party and all PC boxes from a Crystal .sav and scores everything you own
+"""
+
+import argparse
+import struct
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from dvs import HIDDEN_POWER, DVBatch
+from rom_tables import NUM_POKEMON, load_rom
+from trainers import decode_text
+
+SRAM_SIZE = 0x8000
+NAME_LENGTH = 11
+
+# Crystal (English) SRAM layout; the backup copy of the checksummed block sits 0xE00 lower
+CHECKSUM_START = 0x2009
+CHECKSUM_END = 0x2B82        # Inclusive
+CHECKSUM_OFFSET = 0x2D0D
+CHECK_VALUES = ((0x2008, 99), (0x2D0F, 127))   # sCheckValue1/2 bracket a written block
+BACKUP_DELTA = -0xE00        # Backup block 0x1209-0x1D82, checksum at 0x1F0D
+PLAYER_ID = 0x2009
+PLAYER_NAME = 0x200B
+CURRENT_BOX = 0x2700         # Low nibble: index of the box held in sBox
+PARTY = 0x2865
+CURRENT_BOX_DATA = 0x2D10    # sBox: working copy of the current box (outside the checksum)
+BOX_BANKS = (0x4000, 0x6000) # Boxes 1-7 and 8-14
+BOX_STRIDE = 0x450
+BOXES_PER_BANK = 7
+NUM_BOXES = 14
+
+EGG = 0xFD                   # Species list marker for eggs
+PARTY_CAPACITY = 6
+BOX_CAPACITY = 20
+
+# The box struct is the first 32 bytes of the 48-byte party struct:
+# species, item, 4 moves, OT ID, exp (24-bit), 5 stat exp, DVs, 4 PP,
+# happiness, pokerus, caught data, level
+BOXMON = struct.Struct(">BB4BH3s5HH4BBBHB")
+PARTYMON_SIZE = 48
+
+
+class SaveError(ValueError):
+    pass
+
+
+def checksum(sram: bytes, start: int, end: int) -> int:
+    return sum(sram[start:end + 1]) & 0xFFFF
+
+
+def valid_block(sram: bytes, delta: int = 0) -> bool:
+    """Whether the (primary or backup) game data block was written and matches its checksum"""
+    if any(sram[offset + delta] != value for offset, value in CHECK_VALUES):
+        return False
+    stored = sram[CHECKSUM_OFFSET + delta] | (sram[CHECKSUM_OFFSET + delta + 1] << 8)
+    return stored == checksum(sram, CHECKSUM_START + delta, CHECKSUM_END + delta)
+
+
+def read_list(sram: bytes, offset: int, capacity: int, size: int, location: str) -> List[Dict]:
+    """Decode a Pokemon list: count, species list, structs, OT names, nicknames"""
+    count = sram[offset]
+    if count > capacity:
+        raise SaveError(f"{location}: {count} Pokemon in a list of {capacity}")
+    structs = offset + 1 + capacity + 1
+    ot_names = structs + capacity * size
+    nicknames = ot_names + capacity * NAME_LENGTH
+
+    raw = b"".join(sram[structs + i * size:structs + i * size + BOXMON.size] for i in range(count))
+    pokemon = []
+    for i, fields in enumerate(BOXMON.iter_unpack(raw)):
+        if sram[offset + 1 + i] == EGG or not 1 <= fields[0] <= NUM_POKEMON:
+            continue
+        name_at = nicknames + i * NAME_LENGTH
+        pokemon.append({
+            'location': location, 'slot': i + 1, 'species': fields[0], 'item': fields[1],
+            'moves': [m for m in fields[2:6] if m], 'ot_id': fields[6],
+            'experience': int.from_bytes(fields[7], 'big'), 'dvs': fields[13],
+            'level': fields[21],
+            'nickname': decode_text(sram[name_at:name_at + NAME_LENGTH].split(b"\x50")[0]),
+        })
+    return pokemon
+
+
+def box_offset(box: int) -> int:
+    """SRAM offset of a PC box (0-13) in the banked box storage"""
+    bank, index = divmod(box, BOXES_PER_BANK)
+    return BOX_BANKS[bank] + index * BOX_STRIDE
+
+
+def read_save(sram: bytes, force: bool = False) -> Dict:
+    """Decode the player, party and every PC box of a Crystal save
+
+    The primary data block is used when its checksum holds, else the backup;
+    with neither valid a SaveError is raised unless force is set.
+    """
+    if len(sram) < SRAM_SIZE:
+        raise SaveError(f"save is {len(sram)} bytes, expected at least {SRAM_SIZE}")
+    if valid_block(sram):
+        delta, source = 0, "primary"
+    elif valid_block(sram, BACKUP_DELTA):
+        delta, source = BACKUP_DELTA, "backup"
+    elif force:
+        delta, source = 0, "unchecked"
+    else:
+        raise SaveError("neither save block matches its checksum (not a Crystal save?)")
+
+    current_box = sram[CURRENT_BOX + delta] & 0x0F
+    pokemon = read_list(sram, PARTY + delta, PARTY_CAPACITY, PARTYMON_SIZE, "Party")
+    for box in range(NUM_BOXES):
+        # The current box lives in sBox; its banked copy is stale until the box is switched
+        offset = CURRENT_BOX_DATA if box == current_box else box_offset(box)
+        pokemon += read_list(sram, offset, BOX_CAPACITY, BOXMON.size, f"Box {box + 1}")
+
+    return {
+        'player': decode_text(sram[PLAYER_NAME + delta:PLAYER_NAME + delta + NAME_LENGTH].split(b"\x50")[0]),
+        'player_id': int.from_bytes(sram[PLAYER_ID + delta:PLAYER_ID + delta + 2], 'big'),
+        'source': source, 'current_box': current_box + 1, 'pokemon': pokemon,
+    }
+
+
+def score_owned(scorer, pokemon: List[Dict]) -> List[Tuple[float, str, Dict]]:
+    """(total, tier, pokemon) for every owned Pokemon, best first
+
+    Scores depend only on species, moves and (with Hidden Power) its DV-derived
+    type and power, so each distinct combination is scored once however many
+    copies sit in the boxes. All DVs are decoded in one batch.
+    """
+    from Crystal import MOVE_NAMES
+
+    keys = [(p['species'], tuple(p['moves']), hp if HIDDEN_POWER in p['moves'] else None)
+            for p, hp in zip(pokemon, DVBatch.from_words([p['dvs'] for p in pokemon]).hidden_powers())]
+    scores: Dict[Tuple, Tuple[float, str]] = {}
+    for key in keys:
+        if key not in scores:
+            species, moves, hidden_power = key
+            data = scorer.read_pokemon_data(species)
+            if hidden_power:
+                data['hidden_power'] = hidden_power
+            tier, total, _, _ = scorer.calculate_tier(data, [(m, MOVE_NAMES[m]) for m in moves if m in MOVE_NAMES])
+            scores[key] = (total, tier)
+
+    ranked = [(*scores[key], p) for key, p in zip(keys, pokemon)]
+    ranked.sort(key=lambda r: r[0], reverse=True)
+    return ranked
+
+
+def load_save(path, force: bool = False) -> Dict:
+    return read_save(Path(path).read_bytes(), force)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score every Pokemon in a Crystal save file")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("save", help="Crystal .sav file")
+    parser.add_argument("--top", type=int, default=6, help="Best Pokemon to list")
+    parser.add_argument("--team", action="store_true", help="Pick the best-covering team with team_builder")
+    parser.add_argument("--force", action="store_true", help="Decode even if the checksums do not match")
+    args = parser.parse_args()
+
+    from Crystal import MOVE_NAMES, TierScorer
+    scorer = TierScorer(load_rom(args.rom))
+    save = load_save(args.save, args.force)
+    owned = save['pokemon']
+
+    print("=" * 60)
+    print(f"{save['player']} (ID {save['player_id']:05d}): {len(owned)} Pokemon, {save['source']} save block")
+    print("=" * 60)
+    for total, tier, poke in score_owned(scorer, owned)[:args.top]:
+        name = scorer.POKEMON_NAMES.get(poke['species'], f"#{poke['species']}")
+        moves = ", ".join(MOVE_NAMES.get(m, f"Move {m}") for m in poke['moves'])
+        print(f"  {tier}  {total:5.1f}  {name:<12} Lv.{poke['level']:<3} {poke['location']:<7} "
+              f"slot {poke['slot']:<2} [{moves}]")
+
+    if args.team and owned:
+        from team_builder import build_team, describe_team, owned_candidates
+        candidates = owned_candidates(scorer, owned)
+        print(f"\nBest team from {len(candidates)} owned Pokemon:\n")
+        print(describe_team(candidates, build_team(candidates)))
+
+
+if __name__ == "__main__":
+    main()
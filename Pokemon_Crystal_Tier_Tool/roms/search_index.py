@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Search Index
+N-gram index over short names for prefix, substring and fuzzy lookups
+"""
+
+import re
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+GENDER_SYMBOLS = {"♂": " m", "♀": " f"}
+SUBSTRING_GRAM = 3   # Substring postings hold every 1..3-gram of each text
+
+
+def normalize(text: str) -> str:
+    """Lowercase, spell out gender symbols and collapse punctuation to single spaces"""
+    text = text.lower()
+    for symbol, replacement in GENDER_SYMBOLS.items():
+        text = text.replace(symbol, replacement)
+    text = text.replace("'", "")
+    return re.sub(r"[^a-z0-9]+", " ", text).strip()
+
+
+def trigrams(text: str) -> List[str]:
+    """Trigrams of a normalized text, padded so word starts and ends count"""
+    padded = f"  {text} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+class SearchIndex:
+    """Rows of (key, text) with n-gram postings
+
+    - prefix: bisect into the sorted texts, O(log n + k)
+    - substring: postings of the query's rarest n-gram, then a verify pass over those rows
+    - fuzzy: trigram overlap (Jaccard) counted from postings, so only rows sharing a trigram are touched
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Hashable, str]]):
+        self.keys: List[Hashable] = []
+        self.texts: List[str] = []
+        for key, text in entries:
+            self.keys.append(key)
+            self.texts.append(normalize(text))
+
+        self.sorted_texts = sorted((text, row) for row, text in enumerate(self.texts))
+        self.grams: Dict[str, List[int]] = {}
+        self.trigrams: Dict[str, List[int]] = {}
+        self.trigram_counts: List[int] = []
+
+        for row, text in enumerate(self.texts):
+            grams = {text[i:i + n] for n in range(1, SUBSTRING_GRAM + 1) for i in range(len(text) - n + 1)}
+            for gram in grams:
+                self.grams.setdefault(gram, []).append(row)
+            row_trigrams = set(trigrams(text))
+            self.trigram_counts.append(len(row_trigrams))
+            for gram in row_trigrams:
+                self.trigrams.setdefault(gram, []).append(row)
+
+    def prefix(self, query: str) -> List[int]:
+        """Rows whose text starts with the query, alphabetically"""
+        query = normalize(query)
+        rows = []
+        for text, row in self.sorted_texts[bisect_left(self.sorted_texts, (query,)):]:
+            if not text.startswith(query):
+                break
+            rows.append(row)
+        return rows
+
+    def substring(self, query: str) -> List[int]:
+        """Rows whose text contains the query, in row order"""
+        query = normalize(query)
+        if not query:
+            return list(range(len(self.texts)))
+        n = min(SUBSTRING_GRAM, len(query))
+        candidates = min((self.grams.get(query[i:i + n], []) for i in range(len(query) - n + 1)), key=len)
+        return [row for row in candidates if query in self.texts[row]]
+
+    def fuzzy(self, query: str, limit: int = 10, min_score: float = 0.2) -> List[Tuple[int, float]]:
+        """(row, score) pairs ranked by trigram similarity to the query"""
+        query_grams = set(trigrams(normalize(query)))
+        hits = Counter()
+        for gram in query_grams:
+            hits.update(self.trigrams.get(gram, ()))
+
+        scored = []
+        for row, shared in hits.items():
+            score = shared / (len(query_grams) + self.trigram_counts[row] - shared)
+            if score >= min_score:
+                scored.append((row, score))
+        scored.sort(key=lambda rs: (-rs[1], rs[0]))
+        return scored[:limit]
+
+    def search(self, query: str, limit: int = 10) -> List[Hashable]:
+        """Keys ranked exact, then prefix, then substring, then fuzzy matches"""
+        normalized = normalize(query)
+        ranked: Dict[int, None] = {}
+        for row in self.prefix(normalized):
+            if self.texts[row] == normalized:
+                ranked[row] = None
+        for rows in (self.prefix(normalized), self.substring(normalized),
+                     [row for row, _ in self.fuzzy(normalized, limit)]):
+            for row in rows:
+                ranked.setdefault(row, None)
+                if len(ranked) >= limit:
+                    break
+            if len(ranked) >= limit:
+                break
+        return [self.keys[row] for row in ranked][:limit]
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Species Index
+Resolves species by dex number, exact name or ranked fuzzy match for the GUI and CLIs
+"""
+
+import argparse
+import re
+from typing import Dict, List, Optional
+
+from search_index import SearchIndex, normalize
+
+LABEL_PATTERN = re.compile(r"^\s*#?(\d+)\s*(?::.*)?$")   # "152", "#152" or a "152: Chikorita" combobox label
+
+
+class SpeciesIndex:
+    """Species names keyed by dex number with a search index over the names"""
+
+    def __init__(self, names: Dict[int, str]):
+        self.names = names
+        self.index = SearchIndex(sorted(names.items()))
+        self.dex_of_name = {text: dex_num for dex_num, text in zip(self.index.keys, self.index.texts)}
+
+    def label(self, dex_num: int) -> str:
+        """Combobox text for a species"""
+        return f"{dex_num}: {self.names.get(dex_num, f'Pokemon #{dex_num}')}"
+
+    def labels(self, dex_nums: List[int]) -> List[str]:
+        return [self.label(dex_num) for dex_num in dex_nums]
+
+    def search(self, query: str, limit: int = 10) -> List[int]:
+        """Dex numbers ranked for partial input: a dex number first, then name matches"""
+        match = LABEL_PATTERN.match(query)
+        if match and int(match.group(1)) in self.names:
+            return [int(match.group(1))]
+        return self.index.search(query, limit)
+
+    def resolve(self, query: str) -> Optional[int]:
+        """Single best species for the query (exact name, dex number or label, else top match)"""
+        dex_num = self.dex_of_name.get(normalize(query))
+        if dex_num is None:
+            matches = self.search(query, limit=1)
+            dex_num = matches[0] if matches else None
+        return dex_num
+
+
+_default = None
+
+
+def default_index() -> SpeciesIndex:
+    """Index over the tool's species names, built on first use"""
+    global _default
+    if _default is None:
+        from Crystal import TierScorer
+        _default = SpeciesIndex(TierScorer.POKEMON_NAMES)
+    return _default
+
+
+def species_arg(text: str) -> int:
+    """argparse type accepting a dex number or a (partial) species name"""
+    dex_num = default_index().resolve(text)
+    if dex_num is None:
+        raise argparse.ArgumentTypeError(f"no species matches {text!r}")
+    return dex_num
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Look up species by dex number or (partial) name")
+    parser.add_argument("query", nargs="+", help="Dex number or name, e.g. 'feral' or 'nidoran m'")
+    parser.add_argument("--limit", type=int, default=10, help="Matches to list")
+    args = parser.parse_args()
+
+    index = default_index()
+    for dex_num in index.search(" ".join(args.query), args.limit):
+        print(f"  #{dex_num:03d} {index.names[dex_num]}")
+
+
+if __name__ == "__main__":
+    main()
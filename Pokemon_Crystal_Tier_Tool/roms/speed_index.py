@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Speed Index
+Sorted speeds of the whole dex so "who does this outspeed" is a bisect, not a scan
+"""
+
+import argparse
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional
+
+from rom_tables import NUM_POKEMON, load_rom
+from species_index import species_arg
+from stat_engine import DEFAULT_PRESET, PRESET_NAMES, StatTable, level_arg
+
+BASE = 0   # Level key for base speed
+
+
+class SpeedIndex:
+    """Per-level speed of every species plus the same speeds in sorted order
+
+    Level BASE holds base speeds and is always present. Other levels come from
+    the stat engine and are indexed the first time they are queried.
+    """
+
+    def __init__(self, scorer, preset: str = DEFAULT_PRESET):
+        self.scorer = scorer
+        self.rom_data = scorer.rom_data
+        self.preset = preset
+        self.stat_table: Optional[StatTable] = None
+
+        self.speeds: Dict[int, List[int]] = {}   # level -> speed by dex number (index 0 unused)
+        self.sorted_speeds: Dict[int, List[int]] = {}
+        self.order: Dict[int, List[int]] = {}    # level -> dex numbers, slowest first
+
+        base = [0] * (NUM_POKEMON + 1)
+        for dex_num in range(1, NUM_POKEMON + 1):
+            base[dex_num] = scorer.read_pokemon_data(dex_num)['speed']
+        self.add_level(BASE, base)
+
+    def add_level(self, level: int, speeds: List[int]):
+        self.speeds[level] = speeds
+        self.order[level] = sorted(range(1, NUM_POKEMON + 1), key=speeds.__getitem__)
+        self.sorted_speeds[level] = [speeds[d] for d in self.order[level]]
+
+    def level(self, level: int) -> List[int]:
+        """Speeds at a level, indexing the level from the stat engine on first use"""
+        if level not in self.speeds:
+            if self.stat_table is None:
+                self.stat_table = StatTable.for_rom(self.rom_data, self.scorer)
+            self.add_level(level, list(self.stat_table.column('speed', level, self.preset)))
+        return self.speeds[level]
+
+    def speed(self, dex_num: int, level: int = BASE) -> int:
+        return self.level(level)[dex_num]
+
+    def outspeed_fraction(self, speed: int, level: int = BASE) -> float:
+        """Share of the dex strictly slower than the given speed"""
+        self.level(level)
+        return bisect_left(self.sorted_speeds[level], speed) / NUM_POKEMON
+
+    def outspeeds(self, dex_num: int, level: int = BASE) -> List[int]:
+        """Species this one strictly outspeeds, slowest first"""
+        speeds = self.level(level)
+        return self.order[level][:bisect_left(self.sorted_speeds[level], speeds[dex_num])]
+
+    def outsped_by(self, dex_num: int, level: int = BASE) -> List[int]:
+        """Species strictly faster than this one, slowest first"""
+        speeds = self.level(level)
+        return self.order[level][bisect_right(self.sorted_speeds[level], speeds[dex_num]):]
+
+    def speed_ties(self, dex_num: int, level: int = BASE) -> List[int]:
+        """Other species with exactly the same speed"""
+        speeds = self.level(level)
+        sorted_speeds = self.sorted_speeds[level]
+        start = bisect_left(sorted_speeds, speeds[dex_num])
+        end = bisect_right(sorted_speeds, speeds[dex_num])
+        return [d for d in self.order[level][start:end] if d != dex_num]
+
+
+def speed_level_arg(text: str) -> int:
+    """argparse type for a level 1-100, or 0 for base speed"""
+    return BASE if text.strip() == str(BASE) else level_arg(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show where a species sits in the dex's speed order")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("dex_num", type=species_arg, help="Species to look up (dex number or name)")
+    parser.add_argument("--level", type=speed_level_arg, default=BASE, help="Level (0 = base speed)")
+    parser.add_argument("--preset", choices=PRESET_NAMES, default=DEFAULT_PRESET, help="DV/stat exp preset")
+    parser.add_argument("--show", type=int, default=10, help="Faster species to list")
+    args = parser.parse_args()
+
+    from Crystal import TierScorer
+    scorer = TierScorer(load_rom(args.rom))
+    index = SpeedIndex(scorer, args.preset)
+
+    name = scorer.POKEMON_NAMES.get(args.dex_num, f"#{args.dex_num}")
+    label = f"Lv.{args.level}" if args.level else "base"
+    speed = index.speed(args.dex_num, args.level)
+    print(f"{name} ({label} speed {speed}) outspeeds "
+          f"{100 * index.outspeed_fraction(speed, args.level):.1f}% of the dex")
+    print(f"Speed ties: {len(index.speed_ties(args.dex_num, args.level))}")
+
+    faster = index.outsped_by(args.dex_num, args.level)
+    print(f"Outsped by {len(faster)} species, slowest first:")
+    for dex_num in faster[:args.show]:
+        print(f"  #{dex_num:03d} {scorer.POKEMON_NAMES.get(dex_num, '?'):<12} {index.speed(dex_num, args.level)}")
+
+
+if __name__ == "__main__":
+    main()
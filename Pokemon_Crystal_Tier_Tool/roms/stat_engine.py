@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Stat Engine
+Actual Gen 2 stats for every species, level and DV/stat exp preset, cached per ROM
+"""
+
+import argparse
+from array import array
+from math import isqrt
+from typing import Dict, Tuple
+
+from rom_tables import NUM_POKEMON, cache_path, load_rom
+from species_index import species_arg
+
+MAX_LEVEL = 100
+STAT_NAMES = ("hp", "attack", "defense", "speed", "sp_attack", "sp_defense")
+STAT_COUNT = len(STAT_NAMES)
+TABLE_VERSION = 1   # Bump when PRESETS or the formula change to invalidate caches
+
+# DV/stat exp presets: (attack DV, defense DV, speed DV, special DV, stat exp)
+PRESETS = {
+    'min': (0, 0, 0, 0, 0),
+    'wild': (8, 8, 8, 8, 0),
+    'max': (15, 15, 15, 15, 0),
+    'trained': (15, 15, 15, 15, 65535),
+}
+PRESET_NAMES = list(PRESETS)
+DEFAULT_PRESET = 'max'
+
+
+def hp_dv(attack_dv: int, defense_dv: int, speed_dv: int, special_dv: int) -> int:
+    """The HP DV is built from the low bit of the other four DVs"""
+    return ((attack_dv & 1) << 3) | ((defense_dv & 1) << 2) | ((speed_dv & 1) << 1) | (special_dv & 1)
+
+
+def stat_exp_bonus(stat_exp: int) -> int:
+    """floor(min(255, floor(sqrt(stat_exp - 1)) + 1) / 4)"""
+    if stat_exp <= 0:
+        return 0
+    return min(255, isqrt(stat_exp - 1) + 1) // 4
+
+
+def gen2_stat(base: int, level: int, dv: int = 15, stat_exp: int = 0, is_hp: bool = False) -> int:
+    """Actual stat from base stat, DV and stat experience"""
+    value = ((base + dv) * 2 + stat_exp_bonus(stat_exp)) * level // 100
+    return value + level + 10 if is_hp else value + 5
+
+
+def preset_dvs(preset: str) -> Tuple[Tuple[int, ...], int]:
+    """(DV per stat in STAT_NAMES order, stat exp) for a preset"""
+    attack, defense, speed, special, stat_exp = PRESETS[preset]
+    return (hp_dv(attack, defense, speed, special), attack, defense, speed, special, special), stat_exp
+
+
+def level_arg(text: str) -> int:
+    """argparse type for a level 1-100"""
+    level = int(text)
+    if not 1 <= level <= MAX_LEVEL:
+        raise argparse.ArgumentTypeError(f"level must be 1-{MAX_LEVEL}")
+    return level
+
+
+class StatTable:
+    """Stats for preset x species x level x stat in one flat array
+
+    Row layout: index = ((preset * (NUM_POKEMON + 1) + dex_num) * (MAX_LEVEL + 1) + level) * 6.
+    Dex number 0 and level 0 are left as zeros so lookups need no offset arithmetic.
+    """
+
+    def __init__(self, values: array):
+        self.values = values
+
+    @staticmethod
+    def size() -> int:
+        return len(PRESETS) * (NUM_POKEMON + 1) * (MAX_LEVEL + 1) * STAT_COUNT
+
+    @classmethod
+    def build(cls, base_stats: Dict[int, Tuple[int, ...]]) -> 'StatTable':
+        """Compute every stat from {dex_num: (hp, atk, def, spe, spa, spd)} base stats"""
+        values = array('H', bytes(2 * cls.size()))
+        levels = range(MAX_LEVEL + 1)
+        row_stride = (MAX_LEVEL + 1) * STAT_COUNT
+
+        for p, preset in enumerate(PRESET_NAMES):
+            dvs, stat_exp = preset_dvs(preset)
+            bonus = stat_exp_bonus(stat_exp)
+            for dex_num, bases in base_stats.items():
+                start = (p * (NUM_POKEMON + 1) + dex_num) * row_stride
+                for s, (base, dv) in enumerate(zip(bases, dvs)):
+                    # Everything except the level multiply is shared by all 100 levels
+                    numerator = (base + dv) * 2 + bonus
+                    if s == 0:
+                        column = [numerator * level // 100 + level + 10 for level in levels]
+                    else:
+                        column = [numerator * level // 100 + 5 for level in levels]
+                    column[0] = 0
+                    values[start + s:start + row_stride:STAT_COUNT] = array('H', column)
+
+        return cls(values)
+
+    @classmethod
+    def for_rom(cls, rom_data: bytes, scorer=None) -> 'StatTable':
+        """Load the table for this ROM from the cache, building it on a miss"""
+        path = cache_path(rom_data, f"stats_v{TABLE_VERSION}.bin")
+        if path.exists() and path.stat().st_size == 2 * cls.size():
+            values = array('H')
+            with open(path, 'rb') as f:
+                values.fromfile(f, cls.size())
+            return cls(values)
+
+        if scorer is None:
+            from Crystal import TierScorer
+            scorer = TierScorer(rom_data)
+
+        base_stats = {}
+        for dex_num in range(1, NUM_POKEMON + 1):
+            pokemon = scorer.read_pokemon_data(dex_num)
+            base_stats[dex_num] = tuple(pokemon[name] for name in STAT_NAMES)
+
+        table = cls.build(base_stats)
+        with open(path, 'wb') as f:
+            table.values.tofile(f)
+        return table
+
+    def offset(self, dex_num: int, level: int, preset: str = DEFAULT_PRESET) -> int:
+        """Index of a species' stats in the flat table; out-of-range values would land in another row"""
+        if not 1 <= dex_num <= NUM_POKEMON:
+            raise ValueError(f"dex number must be 1-{NUM_POKEMON}, got {dex_num}")
+        if not 1 <= level <= MAX_LEVEL:
+            raise ValueError(f"level must be 1-{MAX_LEVEL}, got {level}")
+        p = PRESET_NAMES.index(preset)
+        return ((p * (NUM_POKEMON + 1) + dex_num) * (MAX_LEVEL + 1) + level) * STAT_COUNT
+
+    def stats(self, dex_num: int, level: int, preset: str = DEFAULT_PRESET) -> Dict[str, int]:
+        """All six stats of a species at a level"""
+        start = self.offset(dex_num, level, preset)
+        return dict(zip(STAT_NAMES, self.values[start:start + STAT_COUNT]))
+
+    def stat(self, dex_num: int, level: int, stat_name: str, preset: str = DEFAULT_PRESET) -> int:
+        return self.values[self.offset(dex_num, level, preset) + STAT_NAMES.index(stat_name)]
+
+    def column(self, stat_name: str, level: int, preset: str = DEFAULT_PRESET) -> array:
+        """One stat for every species at a level, indexed by dex number (index 0 unused)"""
+        stride = (MAX_LEVEL + 1) * STAT_COUNT
+        start = self.offset(1, level, preset) - stride + STAT_NAMES.index(stat_name)
+        return self.values[start:start + (NUM_POKEMON + 1) * stride:stride]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the per-ROM stat table and print a species' stats")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("dex_num", type=species_arg, nargs="?", default=1, help="Species to show (dex number or name)")
+    parser.add_argument("--level", type=level_arg, default=50)
+    parser.add_argument("--preset", choices=PRESET_NAMES, default=DEFAULT_PRESET)
+    args = parser.parse_args()
+
+    table = StatTable.for_rom(load_rom(args.rom))
+    stats = table.stats(args.dex_num, args.level, args.preset)
+    print(f"#{args.dex_num:03d} Lv.{args.level} ({args.preset}): " +
+          ", ".join(f"{name}={value}" for name, value in stats.items()))
+
+
+if __name__ == "__main__":
+    main()
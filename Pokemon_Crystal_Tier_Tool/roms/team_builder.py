@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Team Builder
+Picks the six-member team with the best combined type coverage from a box of candidates
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from Crystal import MOVE_NAMES, TierScorer
+from rom_tables import load_rom
+
+TEAM_SIZE = 6
+DEFAULT_BEAM_WIDTH = 256
+
+# Score weights: offense/resist bits are rewarded, weaknesses shared by
+# two or more members with no resist on the team are penalised
+OFFENSE_WEIGHT = 3.0
+RESIST_WEIGHT = 2.0
+SHARED_WEAKNESS_PENALTY = 4.0
+TIER_SCORE_WEIGHT = 0.05   # Tie-breaker on individual tier scores
+
+# The 17 real types, one bit each, in TierScorer.TYPES order
+TYPE_NAMES = list(TierScorer.TYPES.values())
+TYPE_BITS = {name: 1 << i for i, name in enumerate(TYPE_NAMES)}
+ALL_TYPES = (1 << len(TYPE_NAMES)) - 1
+
+
+def effectiveness(attack_type: str, defend_type: str) -> float:
+    return TierScorer.TYPE_EFFECTIVENESS.get(attack_type, {}).get(defend_type, 1.0)
+
+
+# Defender types each attacking type hits super effectively
+SUPER_EFFECTIVE_MASK = {
+    attack_type: sum(TYPE_BITS[d] for d in TYPE_NAMES if effectiveness(attack_type, d) > 1)
+    for attack_type in TYPE_NAMES
+}
+
+
+def popcount(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+def defensive_bits(type_names: List[str]) -> Tuple[int, int]:
+    """Return (weak, resist) bitsets over attacking types for a type combination"""
+    weak = resist = 0
+    for attack_type in TYPE_NAMES:
+        multiplier = 1.0
+        for defend_type in type_names:
+            multiplier *= effectiveness(attack_type, defend_type)
+        if multiplier > 1:
+            weak |= TYPE_BITS[attack_type]
+        elif multiplier < 1:
+            resist |= TYPE_BITS[attack_type]
+    return weak, resist
+
+
+class Candidate:
+    """One Pokemon with its moves, reduced to coverage bitsets"""
+
+    def __init__(self, scorer: TierScorer, species: int, moves: List[int], level: int = None):
+        self.pokemon = scorer.read_pokemon_data(species)
+        self.level = level
+        self.moves = [m for m in moves if m in MOVE_NAMES]
+
+        type_names = [scorer.TYPES.get(self.pokemon['type1'], "Normal")]
+        if self.pokemon['type2'] != self.pokemon['type1']:
+            type_names.append(scorer.TYPES.get(self.pokemon['type2'], "Normal"))
+        self.type_names = type_names
+
+        self.offense = 0
+        for move_id in self.moves:
+            power, type_, _, _, _, _ = scorer.MOVE_DATA.get(move_id, (0, "Normal", 0, 0, False, ""))
+            if power > 0:
+                self.offense |= SUPER_EFFECTIVE_MASK.get(type_, 0)
+
+        self.weak, self.resist = defensive_bits(type_names)
+
+        _, self.tier_score, _, _ = scorer.calculate_tier(
+            self.pokemon, [(m, MOVE_NAMES[m]) for m in self.moves])
+
+    def label(self) -> str:
+        level = f" Lv.{self.level}" if self.level else ""
+        return f"#{self.pokemon['dex_num']:03d} {self.pokemon['name']}{level}"
+
+
+class TeamState:
+    """Running bitsets for a partial team, extended one member at a time"""
+
+    __slots__ = ('members', 'mask', 'offense', 'resist', 'weak1', 'weak2', 'tier_total')
+
+    def __init__(self):
+        self.members = ()
+        self.mask = 0        # Bit i set when candidate i is on the team
+        self.offense = 0
+        self.resist = 0
+        self.weak1 = 0       # Weak for at least one member
+        self.weak2 = 0       # Weak for at least two members
+        self.tier_total = 0.0
+
+    def extend(self, index: int, candidate: Candidate) -> 'TeamState':
+        state = TeamState()
+        state.members = self.members + (index,)
+        state.mask = self.mask | (1 << index)
+        state.offense = self.offense | candidate.offense
+        state.resist = self.resist | candidate.resist
+        state.weak2 = self.weak2 | (self.weak1 & candidate.weak)
+        state.weak1 = self.weak1 | candidate.weak
+        state.tier_total = self.tier_total + candidate.tier_score
+        return state
+
+    def score(self) -> float:
+        shared_uncovered = self.weak2 & ~self.resist
+        return (popcount(self.offense) * OFFENSE_WEIGHT +
+                popcount(self.resist) * RESIST_WEIGHT -
+                popcount(shared_uncovered) * SHARED_WEAKNESS_PENALTY +
+                self.tier_total * TIER_SCORE_WEIGHT)
+
+
+def build_team(candidates: List[Candidate], team_size: int = TEAM_SIZE,
+               beam_width: int = DEFAULT_BEAM_WIDTH) -> TeamState:
+    """Beam search over teams, keeping the best beam_width partial teams per size"""
+    team_size = min(team_size, len(candidates))
+    beam = [TeamState()]
+
+    for _ in range(team_size):
+        seen = set()
+        expanded = []
+        for state in beam:
+            for index, candidate in enumerate(candidates):
+                if state.mask & (1 << index):
+                    continue
+                mask = state.mask | (1 << index)
+                if mask in seen:
+                    continue
+                seen.add(mask)
+                expanded.append(state.extend(index, candidate))
+
+        expanded.sort(key=TeamState.score, reverse=True)
+        beam = expanded[:beam_width]
+
+    return beam[0]
+
+
+def owned_candidates(scorer: TierScorer, entries: List[Dict]) -> List[Candidate]:
+    """Candidates for a collection of owned Pokemon; identical entries become one candidate"""
+    candidates = {}
+    for entry in entries:
+        if not 1 <= entry['species'] <= 251:
+            continue
+        key = (entry['species'], tuple(entry.get('moves', [])), entry.get('level'))
+        if key not in candidates:
+            candidates[key] = Candidate(scorer, entry['species'], entry.get('moves', []), entry.get('level'))
+    return list(candidates.values())
+
+
+def load_candidates(scorer: TierScorer, path: Path) -> List[Candidate]:
+    """Read candidates from a party_data.json export, a plain JSON list of Pokemon or a .sav file"""
+    if path.suffix.lower() == ".sav":
+        from save_file import load_save
+        return owned_candidates(scorer, load_save(path)['pokemon'])
+
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    entries = data['pokemon'] if isinstance(data, dict) else data
+    return [Candidate(scorer, entry['species'], entry.get('moves', []), entry.get('level'))
+            for entry in entries if 1 <= entry['species'] <= 251]
+
+
+def describe_team(candidates: List[Candidate], team: TeamState) -> str:
+    lines = []
+    for index in team.members:
+        candidate = candidates[index]
+        moves = ", ".join(MOVE_NAMES[m] for m in candidate.moves) or "no moves"
+        lines.append(f"  {candidate.label():<24} {'/'.join(candidate.type_names):<16} "
+                     f"score {candidate.tier_score:5.1f}  [{moves}]")
+
+    def names(bits):
+        return ", ".join(t for t in TYPE_NAMES if bits & TYPE_BITS[t]) or "none"
+
+    lines.append("")
+    lines.append(f"Offensive coverage ({popcount(team.offense)}/17): {names(team.offense)}")
+    lines.append(f"Not covered: {names(ALL_TYPES & ~team.offense)}")
+    lines.append(f"Team resists ({popcount(team.resist)}/17): {names(team.resist)}")
+    lines.append(f"Shared weaknesses without a resist: {names(team.weak2 & ~team.resist)}")
+    lines.append(f"Team score: {team.score():.1f}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the best six-member team from a set of candidates")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("candidates", nargs="?", default="party_data.json",
+                        help="party_data.json export, JSON list of {species, moves, level} or a .sav file")
+    parser.add_argument("--beam", type=int, default=DEFAULT_BEAM_WIDTH, help="Beam width")
+    args = parser.parse_args()
+
+    scorer = TierScorer(load_rom(args.rom))
+    candidates = load_candidates(scorer, Path(args.candidates))
+    if not candidates:
+        print("No candidates found")
+        return
+
+    team = build_team(candidates, beam_width=args.beam)
+    print(f"Best team from {len(candidates)} candidates:\n")
+    print(describe_team(candidates, team))
+
+
+if __name__ == "__main__":
+    main()
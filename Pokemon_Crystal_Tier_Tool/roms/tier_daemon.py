@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Tier Daemon
+Local HTTP service keeping decoded ROM tables and scores resident for tier, damage and coverage queries
+"""
+
+import argparse
+import json
+import threading
+import time
+import urllib.request
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+
+from Crystal import MOVE_NAMES, TierScorer
+from damage_calc import DEFAULT_LEVEL, DamageCalculator
+from dvs import hidden_power
+from rom_tables import NUM_POKEMON, load_rom, rom_hash
+from stat_engine import DEFAULT_PRESET, PRESET_NAMES
+from team_builder import ALL_TYPES, SUPER_EFFECTIVE_MASK, TYPE_BITS, TYPE_NAMES
+
+DAEMON_HOST = "127.0.0.1"
+DAEMON_PORT = 52791
+LATENCY_BUCKETS_US = (100, 250, 500, 1000, 2500, 5000, 10000, 50000)   # Upper bounds; one more bucket for slower
+
+
+class QueryError(ValueError):
+    pass
+
+
+def species_field(query: Dict, name: str) -> int:
+    dex_num = query.get(name)
+    if not isinstance(dex_num, int) or not 1 <= dex_num <= NUM_POKEMON:
+        raise QueryError(f"'{name}' must be a dex number 1-{NUM_POKEMON}")
+    return dex_num
+
+
+def dvs_field(query: Dict) -> int:
+    dvs = query['dvs']
+    if not isinstance(dvs, int) or not 0 <= dvs <= 0xFFFF:
+        raise QueryError("'dvs' must be a DV word 0-65535")
+    return dvs
+
+
+def move_field(scorer: TierScorer, move_id) -> int:
+    if not isinstance(move_id, int) or move_id not in scorer.MOVE_DATA:
+        raise QueryError(f"unknown move {move_id!r}; moves are given by ID")
+    return move_id
+
+
+class RomState:
+    """One ROM's scorer, damage calculators and tier results, kept warm between requests"""
+
+    def __init__(self, rom_data: bytes):
+        self.hash = rom_hash(rom_data)
+        self.scorer = TierScorer(rom_data)
+        self.calculators: Dict[Tuple[int, str], DamageCalculator] = {}
+        self.tiers: Dict[Tuple, Dict] = {}
+        self.scorer.get_speed_index()
+        self.scorer.current_boundaries()
+        self.calculator(DEFAULT_LEVEL, DEFAULT_PRESET)
+
+    def refresh(self):
+        """Drop cached tier results when tier_config.json changed (an mtime check)"""
+        if self.scorer.load_config():
+            self.tiers.clear()
+
+    def tier(self, query: Dict) -> Dict:
+        species = species_field(query, 'species')
+        moves = tuple(m for m in query.get('moves', []) if m in MOVE_NAMES)
+        power = hidden_power(dvs_field(query)) if 'dvs' in query else None
+        key = (species, moves, power)
+        if key not in self.tiers:
+            pokemon = self.scorer.read_pokemon_data(species)
+            if power:
+                pokemon['hidden_power'] = power
+            tier, total, breakdown, _ = self.scorer.calculate_tier(pokemon, [(m, MOVE_NAMES[m]) for m in moves])
+            self.tiers[key] = {'species': species, 'tier': tier, 'score': round(total, 2),
+                               'breakdown': {name: round(value, 2) for name, value in breakdown.items()}}
+        return self.tiers[key]
+
+    def calculator(self, level: int, preset: str) -> DamageCalculator:
+        if not isinstance(level, int) or not 1 <= level <= 100:
+            raise QueryError("'level' must be 1-100")
+        if preset not in PRESET_NAMES:
+            raise QueryError(f"'preset' must be one of {', '.join(PRESET_NAMES)}")
+        if (level, preset) not in self.calculators:
+            self.calculators[(level, preset)] = DamageCalculator(self.scorer, level=level, preset=preset)
+        return self.calculators[(level, preset)]
+
+    def damage(self, query: Dict) -> Dict:
+        attacker, defender = species_field(query, 'attacker'), species_field(query, 'defender')
+        calc = self.calculator(query.get('level', DEFAULT_LEVEL), query.get('preset', DEFAULT_PRESET))
+        move = move_field(self.scorer, query.get('move'))
+        info = calc.move_info(move)
+        if info is None:   # Status or fixed-damage move
+            return {'move': move, 'expected': 0.0, 'min': 0, 'max': 0, 'percent_hp': 0.0}
+        expected = calc.expected_damage(attacker, defender, info)
+        low, high = calc.damage_range(attacker, defender, move)
+        return {'move': move, 'expected': round(expected, 2), 'min': low, 'max': high,
+                'percent_hp': round(100 * expected / calc.hp[defender], 1)}
+
+    def coverage(self, query: Dict) -> Dict:
+        """Types a moveset hits super effectively (with damaging moves)"""
+        covered = 0
+        for move_id in query.get('moves', []):
+            power, type_, _, _, _, _ = self.scorer.MOVE_DATA[move_field(self.scorer, move_id)]
+            if power > 0:
+                covered |= SUPER_EFFECTIVE_MASK.get(type_, 0)
+        return {'super_effective': [t for t in TYPE_NAMES if covered & TYPE_BITS[t]],
+                'not_covered': [t for t in TYPE_NAMES if ALL_TYPES & ~covered & TYPE_BITS[t]]}
+
+
+class Metrics:
+    """Request counters and latency histograms per endpoint"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.endpoints: Dict[str, Dict] = {}
+
+    def record(self, endpoint: str, seconds: float, queries: int, error: bool):
+        stats = self.endpoints.setdefault(endpoint, {
+            'requests': 0, 'errors': 0, 'queries': 0, 'total_us': 0.0,
+            'histogram': [0] * (len(LATENCY_BUCKETS_US) + 1)})
+        micros = seconds * 1e6
+        stats['requests'] += 1
+        stats['errors'] += error
+        stats['queries'] += queries
+        stats['total_us'] += micros
+        stats['histogram'][bisect_left(LATENCY_BUCKETS_US, micros)] += 1
+
+    def report(self) -> Dict:
+        labels = [f"<={bound}us" for bound in LATENCY_BUCKETS_US] + [f">{LATENCY_BUCKETS_US[-1]}us"]
+        return {
+            'uptime_s': round(time.time() - self.started, 1),
+            'endpoints': {endpoint: {
+                'requests': s['requests'], 'errors': s['errors'], 'queries': s['queries'],
+                'mean_us': round(s['total_us'] / s['requests'], 1),
+                'histogram': dict(zip(labels, s['histogram'])),
+            } for endpoint, s in self.endpoints.items()},
+        }
+
+
+class TierDaemon(ThreadingHTTPServer):
+    """HTTP server with a thread per connection, so an idle keep-alive client can't block others
+
+    Requests are sub-millisecond, so they are simply serialized on one lock
+    rather than locking each cache.
+    """
+
+    QUERY_ENDPOINTS = {'/tier': RomState.tier, '/damage': RomState.damage, '/coverage': RomState.coverage}
+
+    def __init__(self, roms: List[bytes], host: str = DAEMON_HOST, port: int = DAEMON_PORT):
+        self.states = {}
+        for rom_data in roms:
+            state = RomState(rom_data)
+            self.states[state.hash] = state
+        self.default = next(iter(self.states.values()))
+        self.metrics = Metrics()
+        self.lock = threading.Lock()
+        super().__init__((host, port), DaemonHandler)
+
+    def state_for(self, rom: str) -> RomState:
+        """ROM state by SHA-1 (any unique prefix); the first ROM when none is given"""
+        if not rom:
+            return self.default
+        if not isinstance(rom, str):
+            raise QueryError("'rom' must be a SHA-1 string")
+        matches = [state for digest, state in self.states.items() if digest.startswith(rom)]
+        if len(matches) != 1:
+            raise QueryError(f"unknown ROM {rom!r}")
+        return matches[0]
+
+    def answer(self, path: str, body: Dict) -> Dict:
+        """Run a batch ({"rom": ..., "queries": [...]}) or a single query; errors are per query"""
+        state = self.state_for(body.get('rom'))
+        state.refresh()
+        handler = self.QUERY_ENDPOINTS[path]
+        queries = body.get('queries', [body])
+        if not isinstance(queries, list):
+            raise QueryError("'queries' must be a list")
+        results = []
+        for query in queries:
+            if not isinstance(query, dict):
+                results.append({'error': "query must be a JSON object"})
+                continue
+            try:
+                results.append(handler(state, query))
+            except (QueryError, TypeError, KeyError) as e:
+                results.append({'error': str(e)})
+        return {'rom': state.hash, 'results': results}
+
+
+class DaemonHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # Keep-alive, so batched clients skip the TCP handshake (one thread each)
+    disable_nagle_algorithm = True  # Otherwise small replies wait on the client's delayed ACK
+
+    def send_json(self, status: int, payload: Dict):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            with self.server.lock:
+                report = self.server.metrics.report()
+            self.send_json(200, report)
+        elif self.path == "/roms":
+            self.send_json(200, {'roms': list(self.server.states)})
+        else:
+            self.send_json(404, {'error': f"unknown endpoint {self.path}"})
+
+    def do_POST(self):
+        start = time.perf_counter()
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path not in TierDaemon.QUERY_ENDPOINTS:
+            self.send_json(404, {'error': f"unknown endpoint {self.path}"})
+            return
+
+        with self.server.lock:
+            try:
+                request = json.loads(body or b"{}")
+                if not isinstance(request, dict):
+                    raise QueryError("request body must be a JSON object")
+                response, status = self.server.answer(self.path, request), 200
+            except (QueryError, ValueError) as e:
+                response, status = {'error': str(e)}, 400
+
+            results = response.get('results', [])
+            self.server.metrics.record(self.path, time.perf_counter() - start, len(results),
+                                       status != 200 or any('error' in r for r in results))
+        self.send_json(status, response)
+
+    def log_message(self, format, *args):
+        pass   # Per-request logging would cost more than the query
+
+
+def query(endpoint: str, body: Dict, host: str = DAEMON_HOST, port: int = DAEMON_PORT) -> Dict:
+    """POST a query to a running daemon (GET when body is None)"""
+    url = f"http://{host}:{port}{endpoint}"
+    data = None if body is None else json.dumps(body).encode()
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request) as response:
+        return json.load(response)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve tier, damage and coverage queries from resident ROM state")
+    parser.add_argument("roms", nargs="*", help="ROMs to load (serve mode)")
+    parser.add_argument("--host", default=DAEMON_HOST)
+    parser.add_argument("--port", type=int, default=DAEMON_PORT)
+    parser.add_argument("--query", nargs=2, metavar=("ENDPOINT", "JSON"),
+                        help="Send one request to a running daemon, e.g. --query /tier '{\"species\": 157}'")
+    args = parser.parse_args()
+
+    if args.query:
+        endpoint, body = args.query
+        print(json.dumps(query(endpoint, json.loads(body) if body else None, args.host, args.port), indent=2))
+        return
+    if not args.roms:
+        parser.error("give at least one ROM to serve")
+
+    started = time.perf_counter()
+    daemon = TierDaemon([load_rom(path) for path in args.roms], args.host, args.port)
+    print(f"Loaded {len(daemon.states)} ROM(s) in {time.perf_counter() - started:.2f}s")
+    for digest in daemon.states:
+        print(f"  {digest}")
+    print(f"Serving on http://{args.host}:{daemon.server_address[1]} (Ctrl+C to stop)")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        daemon.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Tier Distribution
+Whole-dex score distribution for assigning tiers by percentile instead of fixed scores
+"""
+
+import argparse
+import json
+import math
+from bisect import bisect_right
+from typing import Dict, List, Tuple
+
+from rom_tables import NUM_POKEMON, cache_path, default_movesets, load_rom, read_learnsets
+
+DISTRIBUTION_VERSION = 1   # Bump when calculate_components changes to invalidate caches
+DISTRIBUTION_LEVEL = 100   # Each species is scored with its last four level-up moves at this level
+
+
+class ScoreDistribution:
+    """Raw tier components of every species, sorted into totals per set of weights
+
+    Components are cached per ROM, so changing weights only costs a re-sum and
+    a sort of 251 totals; percentile and cutoff lookups are bisects.
+    """
+
+    def __init__(self, components: Dict[int, Dict[str, float]]):
+        self.components = components
+        self._sorted: Dict[Tuple, List[float]] = {}
+
+    @classmethod
+    def for_rom(cls, scorer) -> 'ScoreDistribution':
+        """Load the distribution for the scorer's ROM from the cache, building it on a miss"""
+        path = cache_path(scorer.rom_data, f"dex_components_v{DISTRIBUTION_VERSION}.json")
+        if path.exists():
+            try:
+                with open(path, 'r') as f:
+                    cached = json.load(f)
+                return cls({int(dex_num): components for dex_num, components in cached.items()})
+            except ValueError:
+                pass
+
+        from Crystal import MOVE_NAMES
+        movesets = default_movesets(read_learnsets(scorer.rom_data), DISTRIBUTION_LEVEL)
+        components = {}
+        for dex_num in range(1, NUM_POKEMON + 1):
+            moves = [(m, MOVE_NAMES[m]) for m in movesets[dex_num] if m in MOVE_NAMES]
+            components[dex_num] = scorer.calculate_components(scorer.read_pokemon_data(dex_num), moves)
+
+        with open(path, 'w') as f:
+            json.dump(components, f)
+        return cls(components)
+
+    def species_totals(self, weights: Dict[str, float]) -> Dict[int, float]:
+        """Weighted total of every species"""
+        return {dex_num: sum(value * weights[name] for name, value in c.items())
+                for dex_num, c in self.components.items()}
+
+    def sorted_totals(self, weights: Dict[str, float]) -> List[float]:
+        """Weighted totals of the whole dex in ascending order"""
+        key = tuple(sorted(weights.items()))
+        if key not in self._sorted:
+            self._sorted[key] = sorted(self.species_totals(weights).values())
+        return self._sorted[key]
+
+    def percentile(self, total: float, weights: Dict[str, float]) -> float:
+        """Share of the dex (0-100) scoring at or below the given total"""
+        totals = self.sorted_totals(weights)
+        return 100 * bisect_right(totals, total) / len(totals)
+
+    def boundaries(self, weights: Dict[str, float], percentiles: Dict[str, float],
+                   colors: Dict[str, str]) -> List[Tuple[str, float, str]]:
+        """Score cutoffs equivalent to the percentile thresholds, in tier_boundaries form
+
+        A total reaches a tier when percentile(total) >= the tier's threshold, so the
+        cutoff is the lowest dex total whose rank gets there.
+        """
+        totals = self.sorted_totals(weights)
+        boundaries = []
+        for tier, threshold in percentiles.items():
+            rank = math.ceil(threshold * len(totals) / 100)
+            minimum = totals[min(rank, len(totals)) - 1] if rank > 0 else 0.0
+            boundaries.append((tier, minimum, colors.get(tier, "#808080")))
+        return sorted(boundaries, key=lambda b: b[1], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the percentile tier cutoffs for a ROM")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    args = parser.parse_args()
+
+    from Crystal import TierScorer
+    scorer = TierScorer(load_rom(args.rom))
+    distribution = scorer.get_distribution()
+    totals = distribution.sorted_totals(scorer.weights)
+
+    print(f"Dex totals: min {totals[0]:.1f}, median {totals[len(totals) // 2]:.1f}, max {totals[-1]:.1f}\n")
+    colors = {tier: color for tier, _, color in scorer.DEFAULT_TIER_BOUNDARIES}
+    print(f"{'Tier':<6}{'Percentile':>11}{'Cutoff':>9}{'Fixed':>8}")
+    fixed = {tier: minimum for tier, minimum, _ in scorer.tier_boundaries}
+    for tier, minimum, _ in distribution.boundaries(scorer.weights, scorer.tier_percentiles, colors):
+        print(f"{tier:<6}{scorer.tier_percentiles[tier]:>10.0f}%{minimum:>9.1f}{fixed.get(tier, 0):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
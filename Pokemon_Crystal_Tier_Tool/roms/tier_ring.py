@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Tier Ring
+Streams tier results back to the BizHawk overlay through a fixed-layout ring buffer file
+"""
+
+import argparse
+import struct
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from party import PARTY_SIZE, PartyScores
+from party_snapshot import SNAPSHOT_FILE
+
+RING_MAGIC = b"CTRB"
+RING_VERSION = 1
+RING_FILE = "tier_ring.bin"
+RING_SLOTS = 8
+POLL_SECONDS = 0.05
+
+# magic, version, number of entries, entry size, head (entries ever written)
+RING_HEADER = struct.Struct(">4sBBHI")
+
+# Snapshot sequence (the snapshot's frame), party count, then per slot
+# species, tier letter and score x10, then a 16-bit sum of the preceding bytes
+RING_ENTRY = struct.Struct(">IBx" + "BcH" * PARTY_SIZE + "H")
+
+
+def entry_checksum(entry: bytes) -> int:
+    return sum(entry[:-2]) & 0xFFFF
+
+
+def pack_entry(seq: int, results: Dict[int, Tuple[int, str, float]]) -> bytes:
+    """A ring entry from {slot: (species, tier, score)}"""
+    fields = []
+    for slot in range(1, PARTY_SIZE + 1):
+        species, tier, score = results.get(slot, (0, " ", 0.0))
+        fields += [species, tier[:1].encode('ascii'), max(0, min(0xFFFF, round(score * 10)))]
+    entry = RING_ENTRY.pack(seq & 0xFFFFFFFF, len(results), *fields, 0)
+    return entry[:-2] + entry_checksum(entry).to_bytes(2, 'big')
+
+
+class TierRing:
+    """Writer side: appends one entry per party snapshot, then bumps the head
+
+    The entry is written before the header, so a reader never follows the
+    head to an unwritten entry; a torn entry fails its checksum instead.
+    """
+
+    def __init__(self, path=RING_FILE, slots: int = RING_SLOTS):
+        self.path = Path(path)
+        self.slots = slots
+        self.head = 0
+        if self.path.exists():
+            header = self.path.read_bytes()[:RING_HEADER.size]
+            if len(header) == RING_HEADER.size:
+                magic, version, existing, entry_size, head = RING_HEADER.unpack(header)
+                if (magic, version, existing, entry_size) == (RING_MAGIC, RING_VERSION, slots, RING_ENTRY.size):
+                    self.head = head
+        if self.head == 0:
+            self.path.write_bytes(RING_HEADER.pack(RING_MAGIC, RING_VERSION, slots, RING_ENTRY.size, 0)
+                                  + bytes(RING_ENTRY.size * slots))
+        self.file = open(self.path, 'r+b', buffering=0)
+
+    def write(self, seq: int, results: Dict[int, Tuple[int, str, float]]):
+        self.file.seek(RING_HEADER.size + (self.head % self.slots) * RING_ENTRY.size)
+        self.file.write(pack_entry(seq, results))
+        self.head = (self.head + 1) & 0xFFFFFFFF
+        self.file.seek(0)
+        self.file.write(RING_HEADER.pack(RING_MAGIC, RING_VERSION, self.slots, RING_ENTRY.size, self.head))
+
+    def publish(self, seq: int, party: PartyScores):
+        """Write the current PartyScores results under a snapshot sequence number"""
+        self.write(seq, {slot: (poke['species'], party.results[slot][0], party.results[slot][1])
+                         for slot, poke in party.slots.items() if slot <= PARTY_SIZE})
+
+    def close(self):
+        self.file.close()
+
+
+def read_entries(data: bytes) -> List[Dict]:
+    """Valid entries, newest first"""
+    if len(data) < RING_HEADER.size:
+        return []
+    magic, version, slots, entry_size, head = RING_HEADER.unpack_from(data)
+    if magic != RING_MAGIC or version != RING_VERSION or entry_size != RING_ENTRY.size:
+        return []
+
+    entries = []
+    for back in range(1, min(slots, head) + 1):
+        offset = RING_HEADER.size + ((head - back) % slots) * entry_size
+        entry = data[offset:offset + entry_size]
+        if len(entry) != entry_size or entry_checksum(entry) != int.from_bytes(entry[-2:], 'big'):
+            continue
+        fields = RING_ENTRY.unpack(entry)
+        results = {}
+        for slot in range(1, PARTY_SIZE + 1):
+            species, tier, score = fields[2 + (slot - 1) * 3:5 + (slot - 1) * 3]
+            if species:
+                results[slot] = (species, tier.decode('ascii'), score / 10)
+        entries.append({'seq': fields[0], 'count': fields[1], 'results': results})
+    return entries
+
+
+def lookup(data: bytes, seq: int) -> Optional[Dict[int, Tuple[int, str, float]]]:
+    """tier_ring.lua's lookup: the results for a snapshot sequence, or None when stale"""
+    for entry in read_entries(data):
+        if entry['seq'] == seq & 0xFFFFFFFF:
+            return entry['results']
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score party snapshots into the ring buffer read by tier_ring.lua")
+    parser.add_argument("rom", nargs="?", help="Path to the Pokemon Crystal ROM (publish mode)")
+    parser.add_argument("--ring", default=RING_FILE, help="Ring buffer file")
+    parser.add_argument("--snapshot", default=SNAPSHOT_FILE, help="Binary party snapshot to watch")
+    parser.add_argument("--read", action="store_true", help="Print the ring's entries as the Lua reader sees them")
+    parser.add_argument("--seq", type=int, help="With --read, look up one snapshot sequence")
+    args = parser.parse_args()
+
+    if args.read:
+        data = Path(args.ring).read_bytes()
+        if args.seq is not None:
+            results = lookup(data, args.seq)
+            entries = [{'seq': args.seq, 'count': len(results), 'results': results}] if results is not None else []
+            if not entries:
+                print(f"No results for sequence {args.seq} (stale)")
+        else:
+            entries = read_entries(data)
+        for entry in entries:
+            slots = ", ".join(f"{slot}: #{species:03d} {tier} {score:.1f}"
+                              for slot, (species, tier, score) in sorted(entry['results'].items()))
+            print(f"Seq {entry['seq']}: {slots}")
+        return
+    if not args.rom:
+        parser.error("give a ROM to publish, or --read")
+
+    from Crystal import TierScorer
+    from party_watch import PartyWatcher
+    from rom_tables import load_rom
+
+    party = PartyScores(TierScorer(load_rom(args.rom)))
+    watcher = PartyWatcher([args.snapshot])
+    ring = TierRing(args.ring)
+    print(f"Publishing tiers for {args.snapshot} to {args.ring} ({watcher.method}, Ctrl+C to stop)")
+    seq = None
+    try:
+        while True:
+            snapshot = watcher.poll()
+            if snapshot is not None and 'frame' in snapshot:
+                started = time.perf_counter()
+                seq = snapshot['frame']
+                party.update(snapshot)
+                ring.publish(seq, party)
+                print(f"Seq {seq}: {party.summary(', ')} ({(time.perf_counter() - started) * 1000:.1f} ms)")
+            elif party.scorer.load_config() and seq is not None:
+                party.rescore()
+                ring.publish(seq, party)
+                print(f"Config changed, republished seq {seq}")
+            time.sleep(POLL_SECONDS)
+    except KeyboardInterrupt:
+        watcher.close()
+        ring.close()
+
+
+if __name__ == "__main__":
+    main()
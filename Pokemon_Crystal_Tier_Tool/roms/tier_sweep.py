@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Tier Sweep
+Scores every legal moveset of every species to find each species' tier range
+"""
+
+import argparse
+import itertools
+import json
+import math
+import random
+import statistics
+from collections import Counter
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, Iterator, List, Set, Tuple
+
+from Crystal import MOVE_NAMES, TierScorer
+from machines import MachineMatrix
+from rom_tables import NUM_POKEMON, load_rom, read_learnsets
+
+DEFAULT_MAX_SETS = 5000   # Movesets per species before switching from enumeration to sampling
+TIERS = ["S", "A", "B", "C", "D", "F"]
+
+# Per-process scorer, created once by the pool initializer
+_scorer = None
+
+
+def _init_worker(rom_path: str):
+    global _scorer
+    _scorer = TierScorer(load_rom(rom_path))
+
+
+def candidate_moves(learnset: List[Tuple[int, int]], machine_moves: List[int] = ()) -> List[int]:
+    """Distinct move IDs a species can learn by level-up (and by machine, if given)"""
+    moves = {move_id for _, move_id in learnset} | set(machine_moves)
+    return sorted(m for m in moves if m in MOVE_NAMES)
+
+
+def generate_movesets(pool: List[int], max_sets: int, rng: random.Random) -> Tuple[Iterator[Tuple[int, ...]], bool]:
+    """Enumerate all 4-move sets from the pool, or sample max_sets distinct ones if there are too many
+
+    Returns (movesets, exhaustive).
+    """
+    if len(pool) <= 4:
+        return iter([tuple(pool)]), True
+
+    if math.comb(len(pool), 4) <= max_sets:
+        return itertools.combinations(pool, 4), True
+
+    sampled: Set[Tuple[int, ...]] = set()
+    while len(sampled) < max_sets:
+        sampled.add(tuple(sorted(rng.sample(pool, 4))))
+    return iter(sorted(sampled)), False
+
+
+def sweep_species(task: Tuple[int, List[int], int, int]) -> Dict:
+    """Score all movesets of one species (runs in a worker process)"""
+    dex_num, pool, max_sets, seed = task
+    pokemon = _scorer.read_pokemon_data(dex_num)
+    rng = random.Random(f"{seed}:{dex_num}")
+
+    movesets, exhaustive = generate_movesets(pool, max_sets, rng)
+
+    scores = []
+    tier_counts = Counter()
+    best_score = -1.0
+    best_sets = []
+    for moveset in movesets:
+        moves = [(move_id, MOVE_NAMES[move_id]) for move_id in moveset]
+        tier, score, _, _ = _scorer.calculate_tier(pokemon, moves)
+        scores.append(score)
+        tier_counts[tier] += 1
+
+        if score > best_score + 1e-9:
+            best_score = score
+            best_sets = [moveset]
+        elif abs(score - best_score) <= 1e-9:
+            best_sets.append(moveset)
+
+    # How often each move appears among the optimal sets
+    optimal_moves = Counter(move_id for moveset in best_sets for move_id in moveset)
+
+    return {
+        'dex_num': dex_num,
+        'name': pokemon['name'],
+        'pool_size': len(pool),
+        'movesets': len(scores),
+        'exhaustive': exhaustive,
+        'min': round(min(scores), 2) if scores else 0,
+        'median': round(statistics.median(scores), 2) if scores else 0,
+        'max': round(max(scores), 2) if scores else 0,
+        'tier_histogram': {tier: tier_counts[tier] for tier in TIERS if tier_counts[tier]},
+        'optimal_sets': len(best_sets),
+        'optimal_moves': {MOVE_NAMES[move_id]: count for move_id, count in optimal_moves.most_common()},
+        'best_moveset': [MOVE_NAMES[move_id] for move_id in best_sets[0]] if best_sets else [],
+    }
+
+
+def load_completed(out_path: Path) -> Set[int]:
+    """Read species already written by an earlier (possibly interrupted) sweep
+
+    A trailing partial line from an interrupted write is truncated away so new
+    results can be appended safely.
+    """
+    if not out_path.exists():
+        return set()
+
+    text = out_path.read_text(encoding='utf-8')
+    if text and not text.endswith('\n'):
+        text = text[:text.rfind('\n') + 1]
+        out_path.write_text(text, encoding='utf-8')
+
+    completed = set()
+    for line in text.splitlines():
+        try:
+            completed.add(json.loads(line)['dex_num'])
+        except (ValueError, KeyError):
+            continue
+    return completed
+
+
+def run_sweep(rom_path: str, out_path: Path, max_sets: int = DEFAULT_MAX_SETS,
+              workers: int = None, seed: int = 0, machines: bool = True) -> int:
+    """Sweep every species not yet in out_path, streaming one JSON line per species"""
+    rom_data = load_rom(rom_path)
+    learnsets = read_learnsets(rom_data)
+    matrix = MachineMatrix.for_rom(rom_data) if machines else None
+    completed = load_completed(out_path)
+
+    tasks = [(dex_num, candidate_moves(learnsets[dex_num], matrix.learnable_moves(dex_num) if matrix else ()),
+              max_sets, seed)
+             for dex_num in range(1, NUM_POKEMON + 1) if dex_num not in completed]
+
+    if completed:
+        print(f"Resuming: {len(completed)} species already done, {len(tasks)} remaining")
+    if not tasks:
+        return 0
+
+    done = 0
+    with Pool(processes=workers, initializer=_init_worker, initargs=(rom_path,)) as pool, \
+            open(out_path, 'a', encoding='utf-8') as f:
+        for result in pool.imap_unordered(sweep_species, tasks):
+            f.write(json.dumps(result) + "\n")
+            f.flush()
+            done += 1
+            print(f"  [{len(completed) + done:3d}/{NUM_POKEMON}] #{result['dex_num']:03d} {result['name']:<12} "
+                  f"{result['min']:5.1f} / {result['median']:5.1f} / {result['max']:5.1f} "
+                  f"({result['movesets']} sets)")
+
+    return done
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score every legal moveset of every species")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("--out", help="Output JSON Lines file (default: tier_sweep_<rom>.jsonl)")
+    parser.add_argument("--max-sets", type=int, default=DEFAULT_MAX_SETS,
+                        help=f"Movesets per species before sampling (default: {DEFAULT_MAX_SETS})")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="Sampling seed")
+    parser.add_argument("--level-up-only", action="store_true", help="Leave TM/HM/tutor moves out of the pool")
+    args = parser.parse_args()
+
+    out_path = Path(args.out) if args.out else Path(f"tier_sweep_{Path(args.rom).stem}.jsonl")
+
+    print("=" * 60)
+    print("Pokemon Crystal Tier Sweep")
+    print("=" * 60)
+    print(f"ROM: {args.rom}")
+    print(f"Output: {out_path}\n")
+
+    run_sweep(args.rom, out_path, args.max_sets, args.workers, args.seed, not args.level_up_only)
+    print(f"\n[+] Sweep complete: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Trainer Parties
+Decodes the ROM's trainer party tables and scores every species against the boss trainers
+"""
+
+import argparse
+import json
+import math
+import struct
+from typing import Dict, List, Optional, Tuple
+
+from rom_tables import BANK_SIZE, NUM_POKEMON, cache_path, default_movesets, load_rom, read_learnsets
+
+NUM_TRAINER_CLASSES = 67
+NAME_END = 0x50
+PARTY_END = 0xFF
+
+# Trainer party types: (has item, has moves)
+TRAINERTYPE_FIELDS = {0: (False, False), 1: (False, True), 2: (True, False), 3: (True, True)}
+
+# Trainer classes whose parties are worth planning around (gym leaders, rivals, Elite Four)
+BOSS_CLASSES = {
+    1: "Falkner", 2: "Whitney", 3: "Bugsy", 4: "Morty", 5: "Pryce", 6: "Jasmine",
+    7: "Chuck", 8: "Clair", 9: "Rival1", 11: "Will", 13: "Bruno", 14: "Karen",
+    15: "Koga", 16: "Lance", 17: "Brock", 18: "Misty", 19: "Lt. Surge", 21: "Erika",
+    26: "Janine", 35: "Sabrina", 42: "Rival2", 46: "Blaine", 63: "Red", 64: "Blue",
+}
+
+MATCHUP_VERSION = 1   # Bump when the matchup scoring changes to invalidate caches
+
+
+def decode_text(raw: bytes) -> str:
+    """Decode a Gen 2 text string (letters, digits and common punctuation)"""
+    chars = []
+    for byte in raw:
+        if 0x80 <= byte <= 0x99:
+            chars.append(chr(ord('A') + byte - 0x80))
+        elif 0xA0 <= byte <= 0xB9:
+            chars.append(chr(ord('a') + byte - 0xA0))
+        elif 0xF6 <= byte <= 0xFF:
+            chars.append(chr(ord('0') + byte - 0xF6))
+        else:
+            chars.append({0x7F: " ", 0xE3: "-", 0xE6: "?", 0xE7: "!", 0xE8: ".", 0xEF: "M", 0xF5: "F"}.get(byte, "?"))
+    return "".join(chars)
+
+
+def parse_trainer(rom_data: bytes, offset: int, end: int) -> Optional[Tuple[Dict, int]]:
+    """Parse one trainer entry, returning (trainer, next offset) or None if malformed
+
+    Each trainer is a 0x50-terminated name, a party type byte and party
+    entries of level, species, [item], [4 moves], terminated by 0xFF.
+    """
+    name_end = rom_data.find(bytes([NAME_END]), offset, min(end, offset + 16))
+    if name_end == -1:
+        return None
+    fields = TRAINERTYPE_FIELDS.get(rom_data[name_end + 1])
+    if fields is None:
+        return None
+    has_item, has_moves = fields
+
+    pos = name_end + 2
+    party = []
+    while pos < end and rom_data[pos] != PARTY_END:
+        level, species = rom_data[pos], rom_data[pos + 1]
+        if not (1 <= level <= 100 and 1 <= species <= NUM_POKEMON):
+            return None
+        pos += 2
+        member = {'level': level, 'species': species}
+        if has_item:
+            member['item'] = rom_data[pos]
+            pos += 1
+        if has_moves:
+            member['moves'] = [m for m in rom_data[pos:pos + 4] if m]
+            pos += 4
+        party.append(member)
+
+    if pos >= end or not party or len(party) > 6:
+        return None
+    return {'name': decode_text(rom_data[offset:name_end]), 'party': party}, pos + 1
+
+
+def find_trainer_groups(rom_data: bytes) -> Optional[int]:
+    """Find the TrainerGroups pointer table (vanilla: 0x39999)
+
+    Like EvosAttacksPointers, the first pointer points directly past the
+    table, and the first trainer of every class must parse cleanly.
+    """
+    table_size = NUM_TRAINER_CLASSES * 2
+
+    for offset in range(0, len(rom_data) - table_size):
+        first = rom_data[offset] | (rom_data[offset + 1] << 8)
+        if first != (offset % BANK_SIZE) + BANK_SIZE + table_size:
+            continue
+
+        pointers = struct.unpack_from(f'<{NUM_TRAINER_CLASSES}H', rom_data, offset)
+        if list(pointers) != sorted(pointers) or not all(BANK_SIZE <= p < 2 * BANK_SIZE for p in pointers):
+            continue
+
+        bank_start = (offset // BANK_SIZE) * BANK_SIZE
+        bank_end = bank_start + BANK_SIZE
+        if all(parse_trainer(rom_data, bank_start + p - BANK_SIZE, bank_end) for p in pointers):
+            return offset
+
+    return None
+
+
+def read_trainers(rom_data: bytes) -> Dict[int, List[Dict]]:
+    """Decode every trainer as {class_id: [trainer, ...]} (class IDs start at 1)"""
+    table = find_trainer_groups(rom_data)
+    if table is None:
+        raise ValueError("TrainerGroups pointer table not found in ROM")
+
+    bank_start = (table // BANK_SIZE) * BANK_SIZE
+    pointers = struct.unpack_from(f'<{NUM_TRAINER_CLASSES}H', rom_data, table)
+    starts = [bank_start + p - BANK_SIZE for p in pointers] + [bank_start + BANK_SIZE]
+
+    trainers = {}
+    for class_id, (start, end) in enumerate(zip(starts, starts[1:]), start=1):
+        group = []
+        pos = start
+        while pos < end:
+            parsed = parse_trainer(rom_data, pos, end)
+            if parsed is None:
+                break
+            trainer, pos = parsed
+            group.append(trainer)
+        trainers[class_id] = group
+
+    return trainers
+
+
+def boss_battles(trainers: Dict[int, List[Dict]]) -> List[Dict]:
+    """Boss trainers in rough play order (by their strongest party member's level)"""
+    battles = []
+    for class_id, title in BOSS_CLASSES.items():
+        group = trainers.get(class_id, [])
+        for index, trainer in enumerate(group, start=1):
+            key = title if len(group) == 1 else f"{title} {index}"
+            battles.append({'key': key, 'class_id': class_id, 'index': index, 'party': trainer['party'],
+                            'level': max(member['level'] for member in trainer['party'])})
+    return sorted(battles, key=lambda b: (b['level'], b['key']))
+
+
+def score_matchups(scorer, battles: List[Dict], learnsets: Dict[int, List[Tuple[int, int]]]) -> Dict[str, List[float]]:
+    """Share of each boss party every species wins a 1v1 against, at the boss's top level
+
+    Returns {battle key: [score per dex number]} with index 0 unused. Both sides
+    use the default preset; player species know their default moves for that
+    level, trainer Pokemon use their listed moves or their own defaults.
+    """
+    from damage_calc import DamageCalculator
+
+    calculators = {}
+    matchups = {}
+
+    for battle in battles:
+        level = battle['level']
+        if level not in calculators:
+            calculators[level] = DamageCalculator(scorer, level=level)
+        calc = calculators[level]
+
+        movesets = default_movesets(learnsets, level)
+        enemies = [(m['species'], m.get('moves') or movesets[m['species']]) for m in battle['party']]
+
+        # Best per-turn expected damage of each enemy against every species, as a share of its HP
+        incoming = [[0.0] * (NUM_POKEMON + 1) for _ in enemies]
+        for e, (enemy, moves) in enumerate(enemies):
+            infos = [info for info in map(calc.move_info, moves) if info]
+            for dex_num in range(1, NUM_POKEMON + 1):
+                best = max((calc.expected_damage(enemy, dex_num, info) for info in infos), default=0.0)
+                incoming[e][dex_num] = best / calc.hp[dex_num]
+
+        row = [0.0] * (NUM_POKEMON + 1)
+        for dex_num in range(1, NUM_POKEMON + 1):
+            infos = [info for info in map(calc.move_info, movesets[dex_num]) if info]
+            wins = 0
+            for e, (enemy, _) in enumerate(enemies):
+                outgoing = max((calc.expected_damage(dex_num, enemy, info) for info in infos), default=0.0)
+                if outgoing <= 0:
+                    continue
+                turns_to_win = math.ceil(calc.hp[enemy] / outgoing)
+                turns_to_lose = math.ceil(1 / incoming[e][dex_num]) if incoming[e][dex_num] > 0 else math.inf
+                if turns_to_win < turns_to_lose or \
+                        (turns_to_win == turns_to_lose and calc.speed[dex_num] > calc.speed[enemy]):
+                    wins += 1
+            row[dex_num] = round(100 * wins / len(enemies), 1)
+
+        matchups[battle['key']] = row
+
+    return matchups
+
+
+def load_matchups(scorer) -> Tuple[List[Dict], Dict[str, List[float]]]:
+    """Boss battles and their matchup matrix for the scorer's ROM, cached per ROM"""
+    battles = boss_battles(read_trainers(scorer.rom_data))
+    path = cache_path(scorer.rom_data, f"matchups_v{MATCHUP_VERSION}.json")
+    if path.exists():
+        try:
+            with open(path, 'r') as f:
+                return battles, json.load(f)
+        except ValueError:
+            pass
+
+    matchups = score_matchups(scorer, battles, read_learnsets(scorer.rom_data))
+    with open(path, 'w') as f:
+        json.dump(matchups, f)
+    return battles, matchups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decode boss trainer parties and score species against them")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("--top", type=int, default=5, help="Best species to list per battle")
+    parser.add_argument("--party", help="party_data.json: only rank these species")
+    args = parser.parse_args()
+
+    from Crystal import MOVE_NAMES, TierScorer
+    scorer = TierScorer(load_rom(args.rom))
+    battles, matchups = load_matchups(scorer)
+
+    species = range(1, NUM_POKEMON + 1)
+    if args.party:
+        with open(args.party, 'r') as f:
+            species = sorted({p['species'] for p in json.load(f)['pokemon'] if 1 <= p['species'] <= NUM_POKEMON})
+
+    def name(dex_num):
+        return scorer.POKEMON_NAMES.get(dex_num, f"#{dex_num}")
+
+    for battle in battles:
+        print("=" * 60)
+        print(f"{battle['key']} (Lv.{battle['level']})")
+        print("=" * 60)
+        for member in battle['party']:
+            moves = ", ".join(MOVE_NAMES.get(m, f"Move {m}") for m in member.get('moves', []))
+            print(f"  Lv.{member['level']:<3} {name(member['species']):<12} {moves}")
+
+        row = matchups[battle['key']]
+        best = sorted(species, key=lambda d: row[d], reverse=True)[:args.top]
+        print("  Best picks: " + ", ".join(f"{name(d)} ({row[d]:.0f}%)" for d in best))
+        print()
+
+
+if __name__ == "__main__":
+    main()
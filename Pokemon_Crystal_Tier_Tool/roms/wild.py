@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal Wild Encounters
+Decodes grass, surf and fishing tables into map -> species and species -> earliest map indexes
+"""
+
+import argparse
+import json
+import struct
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from rom_tables import BANK_SIZE, NUM_POKEMON, cache_path, load_rom
+from species_index import species_arg
+
+WILD_VERSION = 2   # Bump when the decoded encounter format changes to invalidate caches
+
+GRASS_RECORD = 47   # map group, map number, 3 rates, 7 slots x 3 times of day x (level, species)
+WATER_RECORD = 9    # map group, map number, rate, 3 slots x (level, species)
+GRASS_CHANCES = (30, 30, 20, 10, 5, 4, 1)
+WATER_CHANCES = (60, 30, 10)
+TIMES_OF_DAY = ("morn", "day", "nite")
+TABLE_END = 0xFF
+
+# Wild data order in the ROM: Johto grass/water, Kanto grass/water, swarm grass/water
+WILD_TABLES = (("grass", False), ("water", False), ("grass", False), ("water", False),
+               ("grass", True), ("water", True))
+
+NUM_MAP_GROUPS = 26
+MAP_HEADER_SIZE = 9          # attributes bank, tileset, environment, attributes pointer, landmark, music, palette, fish group
+NUM_FISH_GROUPS = 13
+FISH_GROUP_SIZE = 7          # bite chance, old/good/super rod list pointers
+# Map environments without fishing spots (INDOOR, GATE, DUNGEON); their headers still carry a fish group
+FISHLESS_ENVIRONMENTS = (3, 6, 7)
+RODS = ("old_rod", "good_rod", "super_rod")
+
+LANDMARK_NAMES = [
+    "Special", "New Bark Town", "Route 29", "Cherrygrove City", "Route 30", "Route 31",
+    "Violet City", "Sprout Tower", "Route 32", "Ruins of Alph", "Union Cave", "Route 33",
+    "Azalea Town", "Slowpoke Well", "Ilex Forest", "Route 34", "Goldenrod City", "Radio Tower",
+    "Route 35", "National Park", "Route 36", "Route 37", "Ecruteak City", "Tin Tower",
+    "Burned Tower", "Route 38", "Route 39", "Olivine City", "Lighthouse", "Battle Tower",
+    "Route 40", "Whirl Islands", "Route 41", "Cianwood City", "Route 42", "Mt. Mortar",
+    "Mahogany Town", "Route 43", "Lake of Rage", "Route 44", "Ice Path", "Blackthorn City",
+    "Dragon's Den", "Route 45", "Dark Cave", "Route 46", "Silver Cave", "Pallet Town",
+    "Route 1", "Viridian City", "Route 2", "Pewter City", "Route 3", "Mt. Moon",
+    "Route 4", "Cerulean City", "Route 24", "Route 25", "Route 5", "Underground",
+    "Route 6", "Vermilion City", "Diglett's Cave", "Route 7", "Route 8", "Route 9",
+    "Rock Tunnel", "Route 10", "Power Plant", "Lavender Town", "Lav Radio Tower", "Celadon City",
+    "Saffron City", "Route 11", "Route 12", "Route 13", "Route 14", "Route 15",
+    "Route 16", "Route 17", "Route 18", "Fuchsia City", "Route 19", "Route 20",
+    "Seafoam Islands", "Cinnabar Island", "Route 21", "Route 22", "Victory Road", "Route 23",
+    "Indigo Plateau", "Route 26", "Route 27", "Tohjo Falls", "Route 28", "Fast Ship",
+]
+
+# Johto landmarks are numbered roughly in story order. BADGE_LANDMARKS[n] is the
+# first landmark that needs more than n badges (Route 32, Ilex Forest, Route 35,
+# Route 38, Route 42, Route 44, Dragon's Den, then Kanto), so badges needed is a bisect.
+BADGE_LANDMARKS = [0x08, 0x0E, 0x12, 0x19, 0x22, 0x27, 0x2A, 0x2F]
+# Reachable out of order: Dark Cave and Route 46 from Routes 31/29, Silver Cave after Kanto
+BADGE_OVERRIDES = {0x2C: 0, 0x2D: 0, 0x2E: 16}
+# Badges needed to use Surf and to be given each rod
+METHOD_BADGES = {'surf': 4, 'old_rod': 1, 'good_rod': 4, 'super_rod': 8}
+
+
+def badges_required(landmark: int, method: str = "") -> int:
+    """Approximate badges needed before an encounter on a landmark is reachable"""
+    if landmark in BADGE_OVERRIDES:
+        badges = BADGE_OVERRIDES[landmark]
+    else:
+        badges = bisect_right(BADGE_LANDMARKS, landmark)
+    return max(badges, METHOD_BADGES.get(method.split()[0], 0))
+
+
+def landmark_name(landmark: int) -> str:
+    return LANDMARK_NAMES[landmark] if landmark < len(LANDMARK_NAMES) else f"Landmark {landmark}"
+
+
+def valid_pair(level: int, species: int) -> bool:
+    return 1 <= level <= 100 and 1 <= species <= NUM_POKEMON
+
+
+def grass_record_ok(rom_data: bytes, offset: int) -> bool:
+    record = rom_data[offset:offset + GRASS_RECORD]
+    if len(record) < GRASS_RECORD or not (1 <= record[0] <= NUM_MAP_GROUPS and record[1] >= 1):
+        return False
+    return all(valid_pair(record[i], record[i + 1]) for i in range(5, GRASS_RECORD, 2))
+
+
+def find_wild_tables(rom_data: bytes, min_maps: int = 20) -> Optional[int]:
+    """Find JohtoGrassWildMons (vanilla: 0x2A5E9): the first run of min_maps grass records ending in 0xFF"""
+    pos = 0
+    while pos < len(rom_data) - GRASS_RECORD:
+        end = pos
+        while grass_record_ok(rom_data, end):
+            end += GRASS_RECORD
+        if end - pos >= min_maps * GRASS_RECORD and rom_data[end] == TABLE_END:
+            return pos
+        pos += 1
+    return None
+
+
+def read_wild_tables(rom_data: bytes) -> List[Tuple[int, int, str, int, int, float]]:
+    """Decode grass and surf encounters as (group, map, method, species, level, chance %) tuples"""
+    pos = find_wild_tables(rom_data)
+    if pos is None:
+        raise ValueError("Wild encounter tables not found in ROM")
+
+    encounters = []
+    for kind, swarm in WILD_TABLES:
+        suffix = " swarm" if swarm else ""
+        while rom_data[pos] != TABLE_END:
+            group, map_num = rom_data[pos], rom_data[pos + 1]
+            if kind == "grass":
+                slots = rom_data[pos + 5:pos + GRASS_RECORD]
+                for t, time in enumerate(TIMES_OF_DAY):
+                    for s, chance in enumerate(GRASS_CHANCES):
+                        level, species = slots[(t * 7 + s) * 2:(t * 7 + s) * 2 + 2]
+                        encounters.append((group, map_num, time + suffix, species, level, chance))
+                pos += GRASS_RECORD
+            else:
+                slots = rom_data[pos + 3:pos + WATER_RECORD]
+                for s, chance in enumerate(WATER_CHANCES):
+                    level, species = slots[s * 2:s * 2 + 2]
+                    encounters.append((group, map_num, "surf" + suffix, species, level, chance))
+                pos += WATER_RECORD
+        pos += 1
+
+    return encounters
+
+
+def find_map_groups(rom_data: bytes) -> Optional[int]:
+    """Find MapGroupPointers (vanilla: 0x94000): 26 ascending pointers to 9-byte map headers"""
+    table_size = NUM_MAP_GROUPS * 2
+    for offset in range(0, len(rom_data) - table_size):
+        first = rom_data[offset] | (rom_data[offset + 1] << 8)
+        if first != (offset % BANK_SIZE) + BANK_SIZE + table_size:
+            continue
+        pointers = struct.unpack_from(f'<{NUM_MAP_GROUPS}H', rom_data, offset)
+        if all(b > a and (b - a) % MAP_HEADER_SIZE == 0 for a, b in zip(pointers, pointers[1:])):
+            return offset
+    return None
+
+
+def read_map_headers(rom_data: bytes) -> Dict[Tuple[int, int], Tuple[int, int]]:
+    """{(group, map): (landmark, fish group)} for every map; 0 for the fish group where there's no water"""
+    table = find_map_groups(rom_data)
+    if table is None:
+        raise ValueError("MapGroupPointers table not found in ROM")
+
+    bank_start = (table // BANK_SIZE) * BANK_SIZE
+    pointers = struct.unpack_from(f'<{NUM_MAP_GROUPS}H', rom_data, table)
+    counts = [(b - a) // MAP_HEADER_SIZE for a, b in zip(pointers, pointers[1:])]
+    counts.append(max(counts))  # The last group's size isn't recorded; stop at the first bad header
+
+    headers = {}
+    for group, (pointer, count) in enumerate(zip(pointers, counts), start=1):
+        pos = bank_start + pointer - BANK_SIZE
+        for map_num in range(1, count + 1):
+            header = rom_data[pos:pos + MAP_HEADER_SIZE]
+            if header[5] >= len(LANDMARK_NAMES) or header[8] > NUM_FISH_GROUPS:
+                break
+            fish_group = 0 if header[2] in FISHLESS_ENVIRONMENTS else header[8]
+            headers[(group, map_num)] = (header[5], fish_group)
+            pos += MAP_HEADER_SIZE
+    return headers
+
+
+def parse_rod(rom_data: bytes, offset: int) -> Optional[List[Tuple[int, int, int]]]:
+    """(cumulative chance, species, level) entries up to the 100% (0xFF) entry"""
+    entries = []
+    for pos in range(offset, offset + 3 * 8, 3):
+        chance, species, level = rom_data[pos:pos + 3]
+        entries.append((chance, species, level))
+        if chance == 0xFF:
+            return entries
+    return None
+
+
+def find_fish_groups(rom_data: bytes) -> Optional[int]:
+    """Find FishGroups (vanilla: 0x92488): the first old rod list starts right after the table"""
+    table_size = NUM_FISH_GROUPS * FISH_GROUP_SIZE
+    for offset in range(0, len(rom_data) - table_size):
+        first = rom_data[offset + 1] | (rom_data[offset + 2] << 8)
+        if first != (offset % BANK_SIZE) + BANK_SIZE + table_size:
+            continue
+        bank_start = (offset // BANK_SIZE) * BANK_SIZE
+        pointers = [p for g in range(NUM_FISH_GROUPS)
+                    for p in struct.unpack_from('<3H', rom_data, offset + g * FISH_GROUP_SIZE + 1)]
+        if all(BANK_SIZE <= p < 2 * BANK_SIZE and parse_rod(rom_data, bank_start + p - BANK_SIZE)
+               for p in pointers):
+            return offset
+    return None
+
+
+def read_fish_groups(rom_data: bytes) -> Dict[int, List[Tuple[str, int, int, float]]]:
+    """{fish group: [(rod, species, level, chance %)]}, with time-of-day entries expanded"""
+    table = find_fish_groups(rom_data)
+    if table is None:
+        raise ValueError("FishGroups table not found in ROM")
+
+    bank_start = (table // BANK_SIZE) * BANK_SIZE
+    rods = {}
+    list_end = table
+    for group in range(1, NUM_FISH_GROUPS + 1):
+        pointers = struct.unpack_from('<3H', rom_data, table + (group - 1) * FISH_GROUP_SIZE + 1)
+        rods[group] = []
+        for rod, pointer in zip(RODS, pointers):
+            start = bank_start + pointer - BANK_SIZE
+            entries = parse_rod(rom_data, start)
+            list_end = max(list_end, start + 3 * len(entries))
+            rods[group].append((rod, entries))
+
+    # TimeFishGroups follows the rod lists: (day species, level, nite species, level)
+    groups = {}
+    for group, rod_lists in rods.items():
+        groups[group] = []
+        for rod, entries in rod_lists:
+            previous = 0
+            for chance, species, level in entries:
+                share = round(100 * (chance - previous) / 255, 1)
+                previous = chance
+                if species:
+                    groups[group].append((rod, species, level, share))
+                else:
+                    day, day_level, nite, nite_level = rom_data[list_end + 4 * level:list_end + 4 * level + 4]
+                    groups[group].append((rod + " day", day, day_level, share))
+                    groups[group].append((rod + " nite", nite, nite_level, share))
+    return groups
+
+
+class WildIndex:
+    """Encounters indexed both ways: map -> encounters and species -> maps in progression order"""
+
+    def __init__(self, encounters: List[Tuple[int, int, str, int, int, float]],
+                 landmarks: Dict[Tuple[int, int], int]):
+        self.encounters = encounters
+        self.landmarks = landmarks
+
+        self.by_map: Dict[Tuple[int, int], List[Tuple]] = {}
+        self.by_species: Dict[int, List[Tuple]] = {}
+        for encounter in encounters:
+            group, map_num, method, species, level, chance = encounter
+            self.by_map.setdefault((group, map_num), []).append(encounter)
+            landmark = landmarks.get((group, map_num), 0)
+            self.by_species.setdefault(species, []).append(
+                (badges_required(landmark, method), landmark, (group, map_num), method, level, chance))
+
+        for entries in self.by_species.values():
+            entries.sort(key=lambda e: (e[0], e[1], e[4]))
+
+    @classmethod
+    def for_rom(cls, rom_data: bytes) -> 'WildIndex':
+        """Load the decoded encounters for this ROM from the cache, decoding them on a miss"""
+        path = cache_path(rom_data, f"wild_v{WILD_VERSION}.json")
+        if path.exists():
+            try:
+                with open(path, 'r') as f:
+                    cached = json.load(f)
+                landmarks = {(group, map_num): landmark for group, map_num, landmark in cached['landmarks']}
+                return cls([tuple(e) for e in cached['encounters']], landmarks)
+            except (ValueError, KeyError):
+                pass
+
+        encounters = read_wild_tables(rom_data)
+        headers = read_map_headers(rom_data)
+        fish_groups = read_fish_groups(rom_data)
+        for (group, map_num), (landmark, fish_group) in sorted(headers.items()):
+            for rod, species, level, chance in fish_groups.get(fish_group, []):
+                encounters.append((group, map_num, rod, species, level, chance))
+        landmarks = {key: landmark for key, (landmark, _) in headers.items()}
+
+        with open(path, 'w') as f:
+            json.dump({'encounters': encounters,
+                       'landmarks': [[g, m, landmark] for (g, m), landmark in landmarks.items()]}, f)
+        return cls(encounters, landmarks)
+
+    def map_label(self, key: Tuple[int, int]) -> str:
+        return f"{landmark_name(self.landmarks.get(key, 0))} ({key[0]}:{key[1]})"
+
+    def earliest(self, species: int) -> Optional[Tuple]:
+        """(badges, landmark, map, method, level, chance) of the earliest place to find a species"""
+        entries = self.by_species.get(species)
+        return entries[0] if entries else None
+
+    def obtainable(self, badges: int) -> List[int]:
+        """Species found somewhere reachable with the given number of badges"""
+        return sorted(species for species, entries in self.by_species.items()
+                      if 1 <= species <= NUM_POKEMON and entries[0][0] <= badges)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decode wild encounters and find where species can be caught")
+    parser.add_argument("rom", help="Path to the Pokemon Crystal ROM")
+    parser.add_argument("--species", type=species_arg, help="List where this species can be found (dex number or name)")
+    parser.add_argument("--badges", type=int, help="Rank the species obtainable with this many badges")
+    parser.add_argument("--top", type=int, default=15, help="Species to list with --badges")
+    args = parser.parse_args()
+
+    from Crystal import TierScorer
+    rom_data = load_rom(args.rom)
+    scorer = TierScorer(rom_data)
+    index = WildIndex.for_rom(rom_data)
+    print(f"Decoded {len(index.encounters)} encounter slots on {len(index.by_map)} maps")
+
+    def name(dex_num):
+        return scorer.POKEMON_NAMES.get(dex_num, f"#{dex_num}")
+
+    if args.species:
+        print(f"\n{name(args.species)}:")
+        seen = set()
+        for badges, _, key, method, level, chance in index.by_species.get(args.species, []):
+            if (key, method) in seen:
+                continue
+            seen.add((key, method))
+            print(f"  {badges} badges  {index.map_label(key):<28} {method:<16} Lv.{level:<3} {chance:g}%")
+
+    if args.badges is not None:
+        distribution = scorer.get_distribution()
+        totals = distribution.species_totals(scorer.weights)
+        species = sorted(index.obtainable(args.badges), key=lambda d: totals[d], reverse=True)
+        print(f"\nBest obtainable with {args.badges} badges:")
+        for dex_num in species[:args.top]:
+            tier, _ = scorer.assign_tier(totals[dex_num])
+            badges, _, key, method, level, _ = index.earliest(dex_num)
+            print(f"  {tier}  {totals[dex_num]:5.1f}  #{dex_num:03d} {name(dex_num):<12} "
+                  f"{index.map_label(key)} ({method}, Lv.{level})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Pokemon Crystal WRAM Scanner
+Finds the party layout in WRAM/SRAM dumps offline instead of scanning inside BizHawk
+"""
+
+import argparse
+import re
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from rom_addresses import lua_profile
+from rom_tables import NUM_POKEMON
+
+PARTYMON_SIZE = 48
+MAX_MOVE = 251
+
+# Dump sizes with a known mapping to System Bus addresses: (address of first byte, bytes to scan)
+DUMP_LAYOUTS = {
+    0x2000: (0xC000, 0x2000),    # WRAM banks 0-1 as seen on the System Bus (C000-DFFF)
+    0x8000: (0xC000, 0x2000),    # Full CGB WRAM; only banks 0-1 are mapped at C000-DFFF
+    0x10000: (0x0000, 0x10000),  # Whole System Bus
+}
+
+# newgame_starter.scanForStarters' System Bus ranges
+STARTER_RANGES = ((0xC000, 0xC500), (0xCF00, 0xD100), (0xD000, 0xD500), (0xCC00, 0xCE00))
+
+# Offsets tried by deep_memory_scan.lua's findPartyStructure
+SPECIES_OFFSETS = (1, 2, 7, 8, 16, 32)
+DATA_OFFSETS = (8, 9, 16, 32)
+
+# Byte -> 1 if it is a valid species ID, else 0; translate() turns a dump into a mask in one pass
+SPECIES_MASK = bytes(1 if 1 <= b <= NUM_POKEMON else 0 for b in range(256))
+PARTY_COUNT = re.compile(rb"[\x01-\x06]")
+STARTER_RUN = re.compile(rb"(?=([\x01-\xfb]{3}))")
+
+
+def dump_window(data: bytes, base: Optional[int] = None) -> Tuple[bytes, int, bool]:
+    """The part of a dump to scan, the System Bus address of its first byte and whether that is known
+
+    Unknown sizes (save-state blobs, SRAM) are scanned whole; without --base
+    the reported addresses are then file offsets.
+    """
+    layout_base, length = DUMP_LAYOUTS.get(len(data), (0, len(data)))
+    if base is None:
+        return data[:length], layout_base, len(data) in DUMP_LAYOUTS
+    return data[:length], base, True
+
+
+def struct_score(data: bytes, pos: int) -> Optional[Dict]:
+    """analyzePokemonStructure: score a party struct candidate (None if invalid)"""
+    if pos + PARTYMON_SIZE > len(data) or not SPECIES_MASK[data[pos]]:
+        return None
+    moves = list(data[pos + 2:pos + 6])
+    level = data[pos + 0x1F]
+    current_hp, max_hp = struct.unpack_from(">HH", data, pos + 0x22)
+
+    score = 0
+    if max(moves) <= MAX_MOVE:
+        score += 25
+    if 1 <= level <= 100:
+        score += 25
+    if current_hp <= max_hp and 0 < max_hp < 1000:
+        score += 50
+    if score <= 50:
+        return None
+    return {'species': data[pos], 'moves': moves, 'level': level,
+            'current_hp': current_hp, 'max_hp': max_hp, 'score': score}
+
+
+def find_party_structures(data: bytes, base: int = 0) -> List[Dict]:
+    """Candidate (party count, species list, party structs) layouts, best first
+
+    Ports deep_memory_scan.lua's findPartyStructure and scoring. The per-byte
+    scans are done in C: the count candidates come from a regex scan, and
+    species lists are checked against a translate() mask by slice comparison.
+    Ties are broken by how many of the party's structs match their species.
+    """
+    mask = data.translate(SPECIES_MASK)
+    results = []
+
+    for match in PARTY_COUNT.finditer(data):
+        addr = match.start()
+        count = data[addr]
+        for species_offset in SPECIES_OFFSETS:
+            start = addr + species_offset
+            species_list = list(data[start:start + count])
+            if len(species_list) < count or start + count >= len(data):
+                continue
+            all_valid = mask[start:start + count] == b"\x01" * count
+            if not (all_valid or species_list[0] > 0):
+                continue
+            has_terminator = data[start + count] in (0xFF, 0x00)
+
+            for data_offset in sorted(set(DATA_OFFSETS + (species_offset + count + 1,))):
+                pos = addr + data_offset
+                if pos >= len(data) or data[pos] != species_list[0]:
+                    continue
+                poke = struct_score(data, pos)
+                if poke is None:
+                    continue
+                matching = sum(1 for i, species in enumerate(species_list)
+                               if pos + (i + 1) * PARTYMON_SIZE <= len(data)
+                               and data[pos + i * PARTYMON_SIZE] == species)
+                results.append({
+                    'party_count': base + addr, 'party_species': base + start,
+                    'party_data_start': base + pos, 'count': count,
+                    'species_list': species_list, 'has_terminator': has_terminator,
+                    'pokemon': poke, 'matching_structs': matching,
+                    'score': (50 if all_valid else 25) + (25 if has_terminator else 0) + poke['score'],
+                })
+
+    results.sort(key=lambda r: (r['score'], r['matching_structs']), reverse=True)
+    return results
+
+
+def find_starters(data: bytes, base: int = 0, mapped: bool = False) -> List[Dict]:
+    """newgame_starter.scanForStarters: three consecutive species IDs with no adjacent repeats
+
+    Only its WRAM ranges are searched when the dump's addresses are known
+    (mapped), which is true of a whole System Bus dump at base 0 as well.
+    """
+    if mapped:
+        windows = [(max(start - base, 0), end - base) for start, end in STARTER_RANGES if end > base]
+    else:
+        windows = [(0, len(data))]
+    found = {}
+    for start, end in windows:
+        for match in STARTER_RUN.finditer(data, start, min(end, len(data))):
+            values = list(match.group(1))
+            if values[0] != values[1] and values[1] != values[2]:
+                found[base + match.start()] = values
+    return [{'address': address, 'values': values} for address, values in sorted(found.items())]
+
+
+def address_profile(result: Dict, source: str = "") -> str:
+    """Lua address profile (as written by rom_addresses.py) with the party addresses found"""
+    return lua_profile({key: result[key] for key in ("party_count", "party_species", "party_data_start")},
+                       [f"Party addresses found by wram_scan.py{f' in {source}' if source else ''}",
+                        f"Score {result['score']}, {result['matching_structs']}/{result['count']} party structs matched"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the party layout in a WRAM/SRAM dump")
+    parser.add_argument("dump", help="Memory dump (8 KB C000-DFFF, 32 KB WRAM, 64 KB System Bus, or any blob)")
+    parser.add_argument("--base", type=lambda s: int(s, 0), default=None,
+                        help="Address of the dump's first byte (default: from the dump size, else 0)")
+    parser.add_argument("--top", type=int, default=5, help="Candidates to list")
+    parser.add_argument("--starters", action="store_true", help="Also list starter-like species runs")
+    parser.add_argument("--out", help="Write the best candidate as a Lua address profile")
+    args = parser.parse_args()
+
+    data, base, mapped = dump_window(Path(args.dump).read_bytes(), args.base)
+    results = find_party_structures(data, base)
+
+    print("=" * 60)
+    print(f"{len(results)} candidate party structures in {args.dump} (base 0x{base:04X})")
+    print("=" * 60)
+    for i, r in enumerate(results[:args.top], start=1):
+        poke = r['pokemon']
+        print(f"\n{i}. Score: {r['score']} ({r['matching_structs']}/{r['count']} structs match)")
+        print(f"   Party count at: 0x{r['party_count']:04X} = {r['count']}")
+        print(f"   Species at: 0x{r['party_species']:04X}  Data at: 0x{r['party_data_start']:04X}")
+        print(f"   Species list: {', '.join(map(str, r['species_list']))}")
+        print(f"   First Pokemon: Species {poke['species']}, Level {poke['level']}, "
+              f"HP {poke['current_hp']}/{poke['max_hp']}")
+
+    if args.starters:
+        starters = find_starters(data, base, mapped)
+        print(f"\n{len(starters)} starter-like runs")
+        for s in starters[:args.top]:
+            print(f"   0x{s['address']:04X}: {', '.join(map(str, s['values']))}")
+
+    if results and args.out:
+        Path(args.out).write_text(address_profile(results[0], Path(args.dump).name))
+        print(f"\nAddress profile written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
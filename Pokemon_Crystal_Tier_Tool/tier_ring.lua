@@ -0,0 +1,94 @@
+-- Tier Ring Reader for Pokemon Crystal Tier Tool
+-- Reads tier results scored by the Python calculator (tier_ring.py) from a
+-- ring buffer file, so the overlay can skip its own per-slot scoring
+
+-- Run alongside BizHawk in the same directory:
+--   python roms/tier_ring.py <rom>
+-- main.lua loads this add-on if present. Results are only used when they were
+-- scored from the party snapshot party_feed.lua last wrote; otherwise the
+-- overlay falls back to tier_calculator.calculateTierRating.
+
+local tier_ring = {}
+
+tier_ring.file = "tier_ring.bin"
+
+local RING_MAGIC = "CTRB"
+local RING_VERSION = 1
+local HEADER_SIZE = 12
+local PARTY_SIZE = 6
+local SLOT_SIZE = 4
+
+-- Big-endian unsigned integer at a 1-based position
+local function readBE(data, pos, size)
+    local value = 0
+    for i = pos, pos + size - 1 do
+        value = value * 256 + data:byte(i)
+    end
+    return value
+end
+
+-- {slot index (0-5) = tier result} from a checksummed entry, or nil if torn
+local function decodeEntry(data, pos, entry_size)
+    local sum = 0
+    for i = pos, pos + entry_size - 3 do
+        sum = sum + data:byte(i)
+    end
+    if sum % 65536 ~= readBE(data, pos + entry_size - 2, 2) then
+        return nil
+    end
+
+    local results = {}
+    for slot = 0, PARTY_SIZE - 1 do
+        local at = pos + 6 + slot * SLOT_SIZE
+        local species = data:byte(at)
+        if species > 0 then
+            results[slot] = {
+                species = species,
+                tier = data:sub(at + 1, at + 1),
+                score = readBE(data, at + 2, 2) / 10
+            }
+        end
+    end
+    return results
+end
+
+-- Tier results for a party snapshot sequence, or nil when the Python side
+-- has not scored that snapshot yet (or is not running)
+function tier_ring.lookup(seq)
+    if not seq then
+        return nil
+    end
+    local file = io.open(tier_ring.file, "rb")
+    if not file then
+        return nil
+    end
+    local data = file:read("*a")
+    file:close()
+
+    if not data or #data < HEADER_SIZE or data:sub(1, 4) ~= RING_MAGIC or data:byte(5) ~= RING_VERSION then
+        return nil
+    end
+    local slots = data:byte(6)
+    local entry_size = readBE(data, 7, 2)
+    local head = readBE(data, 9, 4)
+
+    -- Newest entry first
+    for back = 1, math.min(slots, head) do
+        local pos = HEADER_SIZE + ((head - back) % slots) * entry_size + 1
+        if pos + entry_size - 1 <= #data and readBE(data, pos, 4) == seq then
+            return decodeEntry(data, pos, entry_size)
+        end
+    end
+    return nil
+end
+
+-- A slot's result if it was scored for the Pokemon now in that slot
+function tier_ring.resultFor(results, slot, pokemon)
+    local result = results and results[slot]
+    if result and result.species == pokemon.species then
+        return result
+    end
+    return nil
+end
+
+return tier_ring
@@ -39,6 +39,14 @@ class Builder:
             
         return content
         
+    def add_address_profile(self, modules):
+        """Embed address_profile.lua (from roms/rom_addresses.py) ahead of memory_reader, if present"""
+        profile = Path("address_profile.lua")
+        if profile.exists():
+            print(f"  📍 Embedding address profile: {profile}")
+            modules.insert(modules.index(("memory_reader", "memory_reader.lua")),
+                           ("address_profile", str(profile)))
+            
     def build_monolithic(self):
         """Build a single monolithic Lua file with all modules embedded"""
         print("\n📦 Building monolithic script...")
@@ -54,6 +62,7 @@ class Builder:
             ("tier_calculator", "tier_calculator.lua"),
             ("display", "display.lua")
         ]
+        self.add_address_profile(modules)
         
         # Start with header
         output = f"""-- Pokemon Crystal Tier Rating Tool (Monolithic Build)
@@ -164,6 +173,7 @@ end)()
             ("tier_calculator", "tier_calculator.lua"),
             ("display", "display.lua")
         ]
+        self.add_address_profile(code_modules)
         
         main_output = f"""-- Pokemon Crystal Tier Rating Tool (Minimal Build)
 -- Version: {self.version}